@@ -6,6 +6,8 @@ Copyright (c) 2017-2020 Anthon van der Neut, Ruamel bvba
 original idea from https://stackoverflow.com/a/19722365/1307905
 """
 
+import copy
+import struct
 import zipfile
 from io import BytesIO
 from os import PathLike
@@ -33,6 +35,63 @@ class InMemoryZipFile:
         file_contents to the in-memory zip."""
         self.in_memory_zip.writestr(filename_in_zip, file_contents)
 
+    def copy_member(self, source: zipfile.ZipFile, name: str) -> None:
+        """Copies a member of another zip file as is, without decompressing and recompressing it.
+
+        Members which can't be copied as is, such as zip64 or encrypted members,
+        are decompressed and recompressed instead.
+        """
+        zip_file = self.in_memory_zip
+        assert source.mode == "r", "The source zip file must be opened for reading"
+        assert zip_file.mode == "w", "The in-memory zip file must be opened for writing"
+        source_info = source.getinfo(name)
+        if not self._can_copy_as_is(source_info):
+            info = zipfile.ZipInfo(source_info.filename, source_info.date_time)
+            info.compress_type = source_info.compress_type
+            info.external_attr = source_info.external_attr
+            info.comment = source_info.comment
+            zip_file.writestr(info, source.read(name))
+            return
+
+        with source._lock:
+            source.fp.seek(source_info.header_offset)
+            header = source.fp.read(zipfile.sizeFileHeader)
+            # The local header is followed by the file name and extra field, then the compressed data
+            filename_length, extra_length = struct.unpack("<HH", header[26:30])
+            source.fp.seek(filename_length + extra_length, 1)
+            data = source.fp.read(source_info.compress_size)
+
+        info = copy.copy(source_info)
+        # Sizes and CRC are known, so they are written in the local header rather than a data descriptor
+        info.flag_bits &= ~0x08
+        with zip_file._lock:
+            info.header_offset = zip_file.fp.tell()
+            zip_file.fp.write(info.FileHeader())
+            zip_file.fp.write(data)
+            zip_file.filelist.append(info)
+            zip_file.NameToInfo[info.filename] = info
+            zip_file.start_dir = zip_file.fp.tell()
+            zip_file._didModify = True
+
+    def _can_copy_as_is(self, info: zipfile.ZipInfo) -> bool:
+        if info.flag_bits & 0x01:  # Encrypted
+            return False
+        if max(info.file_size, info.compress_size, info.header_offset) >= zipfile.ZIP64_LIMIT:
+            return False
+        if self.in_memory_data.tell() + len(info.filename) + info.compress_size >= zipfile.ZIP64_LIMIT:
+            return False
+        # A zip64 extra field would be duplicated when writing the local header
+        extra = info.extra
+        while len(extra) >= 4:
+            extra_id, extra_length = struct.unpack("<HH", extra[:4])
+            if extra_id == 0x0001:
+                return False
+            extra = extra[4 + extra_length :]
+        return True
+
+    def has_member(self, name: str) -> bool:
+        return name in self.in_memory_zip.NameToInfo
+
     def write_to_file(self, filename: str | bytes | PathLike[str] | PathLike[bytes] | int) -> None:
         """Writes the in-memory zip to a file."""
         # Mark the files as having been created on Windows so that
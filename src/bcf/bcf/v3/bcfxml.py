@@ -4,11 +4,12 @@ import uuid
 import warnings
 import zipfile
 from pathlib import Path
-from typing import Any, NoReturn, Optional, TypeVar
+from typing import Any, Callable, NoReturn, Optional, TypeVar
 
 import bcf.v3.model as mdl
 from bcf.inmemory_zipfile import InMemoryZipFile, ZipFileInterface
 from bcf.v3.document import DocumentsHandler
+from bcf.v3.index import TopicSummary, build_topic_index
 from bcf.v3.topic import TopicHandler
 from bcf.xml_parser import AbstractXmlParserSerializer, XmlParserSerializer
 
@@ -27,6 +28,7 @@ class BcfXml:
         self._project_info: Optional[mdl.ProjectInfo] = None
         self._extensions: Optional[mdl.Extensions] = None
         self._topics: Optional[dict[str, TopicHandler]] = None
+        self._topic_index: Optional[dict[str, TopicSummary]] = None
         self._documents: Optional[DocumentsHandler] = None
         self._zip_file = self._load_zip_file()
 
@@ -99,15 +101,69 @@ class BcfXml:
         topics = {}
         if self._zip_file is None:
             return topics
-        for topic_dir in zipfile.Path(self._zip_file).iterdir():
-            if not topic_dir.is_dir():
-                continue
-            markup_path = topic_dir.joinpath("markup.bcf")
-            if not markup_path.exists():
-                continue
-            topics[topic_dir.name] = TopicHandler(topic_dir, self._xml_handler)
+        # Topic directories share a root so the archive's name lookup is only built once
+        root = zipfile.Path(self._zip_file)
+        for name in self._zip_file.namelist():
+            topic_dir, _, filename = name.partition("/")
+            if filename == "markup.bcf":
+                topics[topic_dir] = TopicHandler(root.joinpath(f"{topic_dir}/"), self._xml_handler)
         return topics
 
+    def get_topic_index(self, cache_path: Optional[Path] = None) -> dict[str, TopicSummary]:
+        """
+        Return a summary of every topic, without parsing their markups into the data model.
+
+        Topics are summarised from a partial parse of their markup.bcf file,
+        which is much faster than loading the full topic for large archives.
+        Topics that have already been loaded (and possibly edited) or added
+        are summarised from their data model instead.
+
+        Args:
+            cache_path: An optional JSON sidecar file to cache the index in,
+                keyed by the CRC of each markup.bcf file.
+
+        Returns:
+            The summary of each topic, keyed by GUID.
+        """
+        if self._topic_index is None:
+            self._topic_index = build_topic_index(self._zip_file, cache_path) if self._zip_file else {}
+        if self._topics is None:
+            return dict(self._topic_index)
+        index = {}
+        for guid, topic_handler in self._topics.items():
+            if topic_handler.is_markup_loaded or guid not in self._topic_index:
+                index[guid] = TopicSummary.from_markup(topic_handler.markup)
+            else:
+                index[guid] = self._topic_index[guid]
+        return index
+
+    def filter_topics(
+        self, predicate: Optional[Callable[[TopicSummary], bool]] = None, **fields: Any
+    ) -> list[TopicSummary]:
+        """
+        Filter topics by their summary, without parsing their markups into the data model.
+
+        Example:
+
+        .. code:: python
+
+            for summary in bcfxml.filter_topics(topic_status="Open", assigned_to="foo@bar.com"):
+                print(summary.title)
+                comments = bcfxml.topics[summary.guid].comments  # Only this topic is parsed
+
+        Args:
+            predicate: An optional function which returns whether to include a topic summary.
+            fields: Values which topic summary fields must be equal to.
+
+        Returns:
+            The matching topic summaries.
+        """
+        return [
+            summary
+            for summary in self.get_topic_index().values()
+            if all(getattr(summary, k) == v for k, v in fields.items()) and (predicate is None or predicate(summary))
+        ]
+
     @property
     def documents(self) -> Optional[DocumentsHandler]:
         """Documents stored in the BCF file."""
@@ -159,48 +215,103 @@ class BcfXml:
         return instance
 
     def save(self, filename: Optional[Path] = None, keep_open: bool = False) -> None:
-        """Save the BCF file to the given filename."""
+        """
+        Save the BCF file to the given filename.
+
+        If the BCF was loaded from a file, only new and modified topics are
+        serialised. Everything which has not been modified (or loaded) is
+        copied from the loaded file as is, without being parsed or even
+        recompressed. A loaded file is then reopened from the saved file, so
+        that topics which have not been loaded yet can still be read.
+
+        Args:
+            filename: The file to save to. Defaults to the loaded file.
+            keep_open: Whether to open the saved file if the BCF was not loaded from a file.
+        """
         if not filename and not self._filename:
             raise ValueError("No file name specified, cannot save BCF file.")
         if filename:
             self._filename = filename
+        source_zip = self._zip_file
         with InMemoryZipFile(self._filename) as bcf_zip:
             self._save_project(bcf_zip)
             self._save_version(bcf_zip)
             self._save_extensions(bcf_zip)
             self._save_documents(bcf_zip)
-            self._save_topics(bcf_zip)
-        if keep_open:
+            saved_topics = self._save_topics(bcf_zip)
+            if source_zip:
+                self._copy_unmodified_members(bcf_zip, saved_topics)
+        self._topic_index = None
+        if source_zip:
+            source_zip.close()
+        if source_zip or keep_open:
             self._zip_file = self._load_zip_file()
+            self._reload_topics(saved_topics)
 
     def _save_project(self, destination_zip: ZipFileInterface) -> None:
         self._smart_save_xml(destination_zip, self._project_info, "project.bcfp")
 
     def _save_version(self, destination_zip: ZipFileInterface) -> None:
-        if not self._version and self._zip_file:
-            destination_zip.writestr("bcf.version", self._zip_file.read("bcf.version"))
-        else:
+        if self._version or not self._zip_file:
             self._save_xml(destination_zip, "bcf.version", self.version)
 
     def _save_extensions(self, destination_zip: ZipFileInterface) -> None:
         self._smart_save_xml(destination_zip, self._extensions, "extensions.xml")
 
     def _smart_save_xml(self, destination_zip: ZipFileInterface, item: Any, target: str) -> None:
+        # Items which have not been loaded are copied from the loaded file
         if item:
             self._save_xml(destination_zip, target, item)
-        elif self._zip_file and zipfile.Path(self._zip_file, target).exists():
-            destination_zip.writestr(target, self._zip_file.read(target))
 
     def _save_xml(self, destination_zip: ZipFileInterface, inner_file: str, xml_obj: Any) -> None:
         destination_zip.writestr(inner_file, self._xml_handler.serialize(xml_obj))
 
     def _save_documents(self, bcf_zip: ZipFileInterface) -> None:
-        if self.documents:
-            self.documents.save(bcf_zip)
+        if self._documents:
+            self._documents.save(bcf_zip)
 
-    def _save_topics(self, destination_zip: ZipFileInterface) -> None:
-        for topic_handler in self.topics.values():
-            topic_handler.save(destination_zip)
+    def _save_topics(self, destination_zip: ZipFileInterface) -> set[str]:
+        """Serialise new and modified topics, returning their directories."""
+        saved_topics = set()
+        if self._topics is None:
+            return saved_topics
+        for topic_dir, topic_handler in self._topics.items():
+            if self._zip_file is None or topic_handler.is_modified:
+                topic_handler.save(destination_zip)
+                saved_topics.add(topic_dir)
+        return saved_topics
+
+    def _copy_unmodified_members(self, destination_zip: InMemoryZipFile, saved_topics: set[str]) -> None:
+        excluded_dirs = set(saved_topics)
+        if self._topics is not None:
+            # Topics which have been removed
+            excluded_dirs.update(topic_dir for topic_dir in self._get_topic_dirs() if topic_dir not in self._topics)
+        if self._documents:
+            excluded_dirs.add("documents")
+        for name in self._zip_file.namelist():
+            if destination_zip.has_member(name):
+                continue
+            if "/" in name and name.partition("/")[0] in excluded_dirs:
+                continue
+            destination_zip.copy_member(self._zip_file, name)
+
+    def _get_topic_dirs(self) -> set[str]:
+        topic_dirs = set()
+        for name in self._zip_file.namelist():
+            topic_dir, _, filename = name.partition("/")
+            if filename == "markup.bcf":
+                topic_dirs.add(topic_dir)
+        return topic_dirs
+
+    def _reload_topics(self, saved_topics: set[str]) -> None:
+        if self._topics is None or self._zip_file is None:
+            return
+        root = zipfile.Path(self._zip_file)
+        for topic_dir, topic_handler in self._topics.items():
+            if topic_dir in saved_topics:
+                topic_handler.mark_unmodified(root.joinpath(f"{topic_dir}/"))
+            else:
+                topic_handler.set_topic_dir(root.joinpath(f"{topic_dir}/"))
 
     def add_topic(
         self, title: str, description: str, author: str, topic_type: str = "", topic_status: str = ""
@@ -0,0 +1,149 @@
+"""BCF XML V3 topic index."""
+
+import dataclasses
+import json
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Optional
+from xml.etree import ElementTree
+
+import bcf.v3.model as mdl
+
+INDEX_VERSION = 1
+
+_TOPIC_ELEMENTS = {
+    "Title": "title",
+    "Priority": "priority",
+    "CreationDate": "creation_date",
+    "ModifiedDate": "modified_date",
+    "AssignedTo": "assigned_to",
+}
+
+
+@dataclass(frozen=True)
+class TopicSummary:
+    """The most commonly listed and filtered fields of a topic, without its comments and viewpoints."""
+
+    guid: str
+    title: Optional[str] = None
+    topic_type: Optional[str] = None
+    topic_status: Optional[str] = None
+    priority: Optional[str] = None
+    creation_date: Optional[str] = None
+    modified_date: Optional[str] = None
+    assigned_to: Optional[str] = None
+    viewpoint_count: int = 0
+
+    @classmethod
+    def from_markup(cls, markup: mdl.Markup) -> "TopicSummary":
+        """
+        Summarise an already parsed markup.
+
+        Args:
+            markup: The markup of the topic.
+
+        Returns:
+            The summary of the topic.
+        """
+        topic = markup.topic
+        return cls(
+            guid=topic.guid,
+            title=topic.title,
+            topic_type=topic.topic_type,
+            topic_status=topic.topic_status,
+            priority=topic.priority,
+            creation_date=str(topic.creation_date) if topic.creation_date else None,
+            modified_date=str(topic.modified_date) if topic.modified_date else None,
+            assigned_to=topic.assigned_to,
+            viewpoint_count=len(topic.viewpoints.view_point) if topic.viewpoints else 0,
+        )
+
+    @classmethod
+    def from_markup_bytes(cls, markup: bytes, guid: str = "") -> "TopicSummary":
+        """
+        Summarise a markup.bcf file without parsing it into the BCF data model.
+
+        Only the attributes and simple elements of the topic are read, and its
+        viewpoints are counted. Comments and other nested elements are skipped.
+
+        Args:
+            markup: The contents of the markup.bcf file.
+            guid: The GUID to use if the topic does not have one.
+
+        Returns:
+            The summary of the topic.
+        """
+        values: dict[str, Any] = {"guid": guid}
+        viewpoint_count = 0
+        path: list[str] = []
+        for event, element in ElementTree.iterparse(BytesIO(markup), events=("start", "end")):
+            tag = element.tag.rpartition("}")[2]
+            if event == "start":
+                path.append(tag)
+                if path == ["Markup", "Topic"]:
+                    values["guid"] = element.get("Guid") or guid
+                    values["topic_type"] = element.get("TopicType")
+                    values["topic_status"] = element.get("TopicStatus")
+                elif path == ["Markup", "Topic", "Viewpoints", "ViewPoint"]:
+                    viewpoint_count += 1
+                continue
+            path.pop()
+            if path == ["Markup", "Topic"] and tag in _TOPIC_ELEMENTS:
+                # Elements are whitespace collapsed, as in the data model
+                values[_TOPIC_ELEMENTS[tag]] = " ".join((element.text or "").split()) or None
+            elif path == ["Markup"] and tag == "Topic":
+                break
+        return cls(viewpoint_count=viewpoint_count, **values)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+def build_topic_index(zip_file: zipfile.ZipFile, cache_path: Optional[Path] = None) -> dict[str, TopicSummary]:
+    """
+    Build an index of the topics in a BCF archive without parsing their markups into the data model.
+
+    If a cache path is provided, summaries are stored alongside the CRC of
+    each markup.bcf file. Subsequent builds reuse the summaries of unchanged
+    markups, and the cache is rewritten if any have changed.
+
+    Args:
+        zip_file: The BCF archive.
+        cache_path: An optional JSON sidecar file to cache the index in.
+
+    Returns:
+        The summary of each topic, keyed by topic directory name.
+    """
+    cached_topics = load_topic_index_cache(cache_path) if cache_path else {}
+    index = {}
+    cache = {}
+    is_cache_changed = False
+    for info in zip_file.infolist():
+        topic_dir, _, filename = info.filename.partition("/")
+        if filename != "markup.bcf":
+            continue
+        cached = cached_topics.get(topic_dir)
+        if cached and cached["crc"] == info.CRC:
+            summary = TopicSummary(**cached["topic"])
+        else:
+            summary = TopicSummary.from_markup_bytes(zip_file.read(info), guid=topic_dir)
+            is_cache_changed = True
+        index[topic_dir] = summary
+        cache[topic_dir] = {"crc": info.CRC, "topic": summary.to_dict()}
+    if cache_path and (is_cache_changed or len(cache) != len(cached_topics)):
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "topics": cache}, f)
+    return index
+
+
+def load_topic_index_cache(cache_path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("topics", {})
@@ -1,5 +1,6 @@
 """BCF XML V3 Topic handler."""
 
+import copy
 import datetime
 import uuid
 import zipfile
@@ -31,6 +32,11 @@ class TopicHandler:
         self._bim_snippet: Optional[bytes] = None
         self._xml_handler = xml_handler or XmlParserSerializer()
         self._topic_dir = topic_dir
+        # Topics which are not stored in a BCF archive are new, and therefore always modified
+        self._is_modified = not isinstance(topic_dir, zipfile.Path)
+        self._saved_markup: Optional[mdl.Markup] = None
+        self._saved_viewpoints: set[str] = set()
+        self._saved_reference_files: dict[str, bytes] = {}
 
     @property
     def markup(self) -> Optional[mdl.Markup]:
@@ -38,11 +44,60 @@ class TopicHandler:
             markup_path = self._topic_dir.joinpath("markup.bcf")
             if markup_path.exists():
                 self._markup = self._xml_handler.parse(markup_path.read_bytes(), mdl.Markup)
+                self._saved_markup = copy.deepcopy(self._markup)
         return self._markup
 
     @markup.setter
     def markup(self, value: mdl.Markup) -> None:
         self._markup = value
+        self._is_modified = True
+
+    @property
+    def is_markup_loaded(self) -> bool:
+        """Whether the markup has been parsed or set, and may therefore have been edited."""
+        return self._markup is not None
+
+    @property
+    def is_modified(self) -> bool:
+        """
+        Whether the topic has changed since it was loaded or saved.
+
+        Only the parts of the topic which have been loaded can be modified, so
+        a topic which has only had its markup read is compared with its markup
+        as it was parsed, and its viewpoints are not loaded.
+        """
+        if self._is_modified:
+            return True
+        if self._markup is not None and self._markup != self._saved_markup:
+            return True
+        if self._viewpoints is not None and (
+            self._viewpoints.keys() != self._saved_viewpoints or any(vh.is_modified for vh in self._viewpoints.values())
+        ):
+            return True
+        return self._reference_files is not None and self._reference_files != self._saved_reference_files
+
+    def mark_unmodified(self, topic_dir: Optional[zipfile.Path] = None) -> None:
+        """
+        Mark the current state of the topic as saved.
+
+        Args:
+            topic_dir: The directory of the topic in the saved BCF archive,
+                that topic data which has not been loaded yet is read from.
+        """
+        if topic_dir is not None:
+            self._topic_dir = topic_dir
+        self._is_modified = False
+        self._saved_markup = copy.deepcopy(self._markup)
+        if self._viewpoints is not None:
+            self._saved_viewpoints = set(self._viewpoints.keys())
+            for vh in self._viewpoints.values():
+                vh.mark_unmodified()
+        if self._reference_files is not None:
+            self._saved_reference_files = dict(self._reference_files)
+
+    def set_topic_dir(self, topic_dir: zipfile.Path) -> None:
+        """Set the directory in a BCF archive that topic data which has not been loaded yet is read from."""
+        self._topic_dir = topic_dir
 
     @property
     def topic(self) -> mdl.Topic:
@@ -65,6 +120,7 @@ class TopicHandler:
     def header(self, header: mdl.Header) -> None:
         """Set the header of the topic."""
         self.markup.header = header
+        self._is_modified = True
 
     @property
     def comments(self) -> list[mdl.Comment]:
@@ -79,6 +135,7 @@ class TopicHandler:
                 return
             self.topic.comments = (topic_comments := mdl.TopicComments())
         topic_comments.comment = comments
+        self._is_modified = True
 
     @property
     def bim_snippet(self) -> Optional[bytes]:
@@ -89,11 +146,13 @@ class TopicHandler:
     @bim_snippet.setter
     def bim_snippet(self, value: bytes) -> None:
         self._bim_snippet = value
+        self._is_modified = True
 
     @property
     def viewpoints(self) -> dict[str, "VisualizationInfoHandler"]:
         if self._viewpoints is None:
             self._viewpoints = self._load_viewpoints()
+            self._saved_viewpoints = set(self._viewpoints.keys())
         return self._viewpoints
 
     def _load_viewpoints(self) -> dict[str, "VisualizationInfoHandler"]:
@@ -128,6 +187,7 @@ class TopicHandler:
             for path_part in ref.reference.split("/"):
                 real_path = real_path.parent if path_part == ".." else real_path.joinpath(path_part)
             self._reference_files[ref.reference] = real_path.read_bytes()
+        self._saved_reference_files = dict(self._reference_files)
         return self._reference_files
 
     @classmethod
@@ -1,3 +1,4 @@
+import copy
 import uuid
 import zipfile
 from typing import Any, Iterable, Optional, Literal, Union
@@ -31,6 +32,20 @@ class VisualizationInfoHandler:
         self.snapshot = snapshot
         self.bitmaps = bitmaps or {}
         self._xml_handler = xml_handler or XmlParserSerializer()
+        # What was last loaded or saved, to detect modifications. New viewpoints are always modified.
+        self._saved_state: Optional[tuple[mdl.VisualizationInfo, Optional[bytes], dict[str, bytes]]] = None
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether the visualization info, snapshot or bitmaps have changed since they were loaded or saved."""
+        if self._saved_state is None:
+            return True
+        visualization_info, snapshot, bitmaps = self._saved_state
+        return self.snapshot is not snapshot or self.bitmaps != bitmaps or self.visualization_info != visualization_info
+
+    def mark_unmodified(self) -> None:
+        """Mark the current state as saved, such as after loading or saving."""
+        self._saved_state = (copy.deepcopy(self.visualization_info), self.snapshot, dict(self.bitmaps))
 
     @property
     def guid(self) -> str:
@@ -75,7 +90,9 @@ class VisualizationInfoHandler:
             return None
         snapshot = cls._load_snapshot(topic_dir, vpt.snapshot)
         bitmaps = cls._load_bitmaps(topic_dir, visinfo)
-        return cls(visinfo, snapshot, bitmaps, xml_handler)
+        handler = cls(visinfo, snapshot, bitmaps, xml_handler)
+        handler.mark_unmodified()
+        return handler
 
     @staticmethod
     def _load_visinfo(
@@ -0,0 +1,87 @@
+"""In-memory zip file tests."""
+
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from bcf.inmemory_zipfile import InMemoryZipFile
+
+CONTENTS = b"Test contents " * 100
+
+
+class UnseekableBytesIO(BytesIO):
+    """A stream which zipfile can't seek, so members are written with a data descriptor."""
+
+    def seekable(self) -> bool:
+        return False
+
+    def seek(self, *args, **kwargs) -> int:
+        raise OSError("Unseekable")
+
+    def tell(self) -> int:
+        raise OSError("Unseekable")
+
+
+def copy_member(source_data: bytes, name: str) -> zipfile.ZipFile:
+    with zipfile.ZipFile(BytesIO(source_data)) as source:
+        destination = InMemoryZipFile()
+        destination.copy_member(source, name)
+    destination.in_memory_zip.close()
+    return zipfile.ZipFile(BytesIO(destination.data))
+
+
+def test_copying_a_member() -> None:
+    source_data = BytesIO()
+    with zipfile.ZipFile(source_data, "w", zipfile.ZIP_DEFLATED) as source:
+        source.writestr("file.txt", CONTENTS)
+    with copy_member(source_data.getvalue(), "file.txt") as result:
+        assert result.testzip() is None
+        assert result.read("file.txt") == CONTENTS
+        assert result.getinfo("file.txt").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_copying_a_member_with_a_data_descriptor() -> None:
+    source_data = UnseekableBytesIO()
+    with zipfile.ZipFile(source_data, "w", zipfile.ZIP_DEFLATED) as source:
+        source.writestr("file.txt", CONTENTS)
+    with zipfile.ZipFile(BytesIO(source_data.getvalue())) as source:
+        assert source.getinfo("file.txt").flag_bits & 0x08
+    with copy_member(source_data.getvalue(), "file.txt") as result:
+        assert result.testzip() is None
+        assert result.read("file.txt") == CONTENTS
+        assert not result.getinfo("file.txt").flag_bits & 0x08
+
+
+def test_copying_a_zip64_member() -> None:
+    source_data = BytesIO()
+    with zipfile.ZipFile(source_data, "w", zipfile.ZIP_DEFLATED) as source:
+        with source.open("file.txt", "w", force_zip64=True) as f:
+            f.write(CONTENTS)
+    with copy_member(source_data.getvalue(), "file.txt") as result:
+        assert result.testzip() is None
+        assert result.read("file.txt") == CONTENTS
+
+
+def test_copying_a_member_with_a_zip64_extra_field() -> None:
+    source_data = BytesIO()
+    with zipfile.ZipFile(source_data, "w", zipfile.ZIP_DEFLATED) as source:
+        source.writestr("file.txt", CONTENTS)
+    with zipfile.ZipFile(BytesIO(source_data.getvalue())) as source:
+        info = source.getinfo("file.txt")
+        # A zip64 extra field, as written for members of large archives
+        info.extra += b"\x01\x00\x08\x00" + info.header_offset.to_bytes(8, "little")
+        destination = InMemoryZipFile()
+        destination.copy_member(source, "file.txt")
+    destination.in_memory_zip.close()
+    with zipfile.ZipFile(BytesIO(destination.data)) as result:
+        assert result.testzip() is None
+        assert result.read("file.txt") == CONTENTS
+        assert result.getinfo("file.txt").extra == b""
+
+
+def test_copying_requires_a_source_opened_for_reading() -> None:
+    with zipfile.ZipFile(BytesIO(), "w") as source:
+        source.writestr("file.txt", CONTENTS)
+        with pytest.raises(AssertionError):
+            InMemoryZipFile().copy_member(source, "file.txt")
@@ -1,6 +1,7 @@
 """BCF XML tests."""
 
 import uuid
+import zipfile
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -76,6 +77,64 @@ def test_bcf_edit(xml_handler, build_sample) -> None:
                 assert len(modified_parsed.topics) == 1
 
 
+def test_topic_index(xml_handler, build_sample) -> None:
+    """Topics can be listed and filtered without loading them."""
+    bcf, orig_th = build_sample
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "test.bcf"
+        cache_path = Path(tmp_dir) / "test.json"
+        bcf.save(file_path)
+        with BcfXml.load(file_path, xml_handler=xml_handler) as parsed:
+            summary = parsed.get_topic_index(cache_path)[orig_th.guid]
+            assert parsed._topics is None
+            assert cache_path.exists()
+            assert summary.title == "Test topic"
+            assert summary.topic_type == "Test type"
+            assert summary.viewpoint_count == 0
+            assert parsed.filter_topics(topic_type="Test type") == [summary]
+            assert parsed.filter_topics(lambda s: s.title.startswith("Foo")) == []
+
+            parsed.topics[orig_th.guid].topic.title = "Foo"
+            new_th = parsed.add_topic("Bar", "Test message", "Test author")
+            index = parsed.get_topic_index()
+            assert index[orig_th.guid].title == "Foo"
+            assert index[new_th.guid].title == "Bar"
+
+        with BcfXml.load(file_path, xml_handler=xml_handler) as parsed:
+            assert parsed.get_topic_index(cache_path)[orig_th.guid] == summary
+
+
+def test_incremental_save(xml_handler, build_sample) -> None:
+    """Only modified topics are serialised, and everything else is copied as is."""
+    bcf, orig_th = build_sample
+    other_th = bcf.add_topic("Other topic", "Test message", "Test author", "Test type")
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "test.bcf"
+        bcf.save(file_path)
+        with BcfXml.load(file_path, xml_handler=xml_handler) as parsed:
+            assert not parsed.topics[orig_th.guid].is_modified
+            parsed.topics[orig_th.guid].topic.title = "New Topic Title"
+            assert parsed.topics[orig_th.guid].is_modified
+            modified_path = Path(tmp_dir) / "edited.bcf"
+            parsed.save(modified_path)
+            assert not parsed.topics[orig_th.guid].is_modified
+            assert not parsed.topics[other_th.guid].is_markup_loaded
+            assert parsed.topics[other_th.guid].topic.title == "Other topic"
+
+        with zipfile.ZipFile(file_path) as original, zipfile.ZipFile(modified_path) as modified:
+            for name in original.namelist():
+                if name.startswith(orig_th.guid):
+                    continue
+                assert original.getinfo(name).CRC == modified.getinfo(name).CRC
+                assert original.getinfo(name).compress_size == modified.getinfo(name).compress_size
+            assert original.read(f"{orig_th.guid}/markup.bcf") != modified.read(f"{orig_th.guid}/markup.bcf")
+
+        with BcfXml.load(modified_path, xml_handler=xml_handler) as modified_parsed:
+            assert modified_parsed == bcf
+            assert modified_parsed.topics[orig_th.guid].topic.title == "New Topic Title"
+            assert modified_parsed.topics[other_th.guid] == other_th
+
+
 def test_save_no_filename(build_sample) -> None:
     bcf, _ = build_sample
     with pytest.raises(ValueError):
@@ -602,19 +602,15 @@ class IfcImporter:
             verts = geometry["verts"]
             mesh["has_cartesian_point_offset"] = False
 
-            if geometry["faces"]:
+            if len(geometry["faces"]):
                 mesh = tool.Loader.create_mesh_from_shape(
                     mesh=mesh, faces=geometry["faces"].reshape(-1, 3), verts=verts.reshape(-1, 3)
                 )
             else:
-                e = geometry["edges"]
-                v = verts
-                vertices = [[v[i], v[i + 1], v[i + 2]] for i in range(0, len(v), 3)]
-                edges = [[e[i], e[i + 1]] for i in range(0, len(e), 2)]
-                mesh.from_pydata(vertices, edges, [])
+                mesh.from_pydata(verts.reshape(-1, 3).tolist(), geometry["edges"].reshape(-1, 2).tolist(), [])
 
             mesh["ios_materials"] = geometry["materials"]
-            mesh["ios_material_ids"] = geometry["material_ids"]
+            mesh["ios_material_ids"] = geometry["material_ids"].tolist()
             self.meshes[mesh_name] = mesh
 
         total = len(elements)
@@ -319,7 +319,7 @@ class ImportIfcCsv(bpy.types.Operator, tool.Ifc.Operator):
         ifc_csv = ifccsv.IfcCsv()
         sep = props.csv_custom_delimiter if props.csv_delimiter == "CUSTOM" else props.csv_delimiter
         attributes = [a.name for a in props.csv_attributes]
-        ifc_csv.Import(
+        total_changes = ifc_csv.Import(
             ifc_file,
             self.filepath,
             attributes=attributes,
@@ -333,7 +333,7 @@ class ImportIfcCsv(bpy.types.Operator, tool.Ifc.Operator):
         if not props.should_load_from_memory:
             ifc_file.write(props.csv_ifc_file)
         refresh_ui_data()
-        self.report({"INFO"}, "Data is imported to IFC.")
+        self.report({"INFO"}, f"Data is imported to IFC ({total_changes} cells changed).")
         return {"FINISHED"}
 
 
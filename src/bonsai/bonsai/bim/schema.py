@@ -46,9 +46,6 @@ class IfcSchema:
         self.psetqto = ifcopenshell.util.pset.get_template(self.schema_identifier)
         # Keep only the first template, which is the official buildingSMART one
         self.psetqto.templates = self.psetqto.templates[0:1]
-        self.psetqto.get_applicable.cache_clear()
-        self.psetqto.get_applicable_names.cache_clear()
-        self.psetqto.get_by_name.cache_clear()
 
         # During register we cannot access the context either way.
         if isinstance(bpy.context, bpy_restrict_state._RestrictContext):
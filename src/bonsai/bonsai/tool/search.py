@@ -67,7 +67,7 @@ class Search(bonsai.core.tool.Search):
     ) -> None:
         filter_groups.clear()
         transformer = ImportFilterQueryTransformer(filter_groups)
-        transformer.transform(ifcopenshell.util.selector.filter_elements_grammar.parse(query))
+        transformer.transform(ifcopenshell.util.selector.get_grammar("filter_elements").parse(query))
 
     @classmethod
     def export_filter_query(cls, filter_groups: bpy.types.bpy_prop_collection_idprop[BIMFilterGroup]) -> str:
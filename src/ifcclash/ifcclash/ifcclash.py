@@ -89,6 +89,14 @@ class Clasher:
         self.tree = None
 
     def clash(self) -> None:
+        self.load_ifcs(
+            [
+                source["file"]
+                for clash_set in self.clash_sets
+                for group in ("a", "b")
+                for source in clash_set.get(group) or []
+            ]
+        )
         for clash_set in self.clash_sets:
             self.process_clash_set(clash_set)
 
@@ -167,6 +175,17 @@ class Clasher:
         self.settings.logger.info(f"Loading finished {time.time() - start}")
         return ifc
 
+    def load_ifcs(self, paths: list[str]) -> None:
+        paths = [path for path in dict.fromkeys(paths) if path not in self.ifcs]
+        if not paths:
+            return
+        start = time.time()
+        self.settings.logger.info(f"Loading IFCs {', '.join(paths)}")
+        for path, ifc in zip(paths, ifcopenshell.open_many(paths)):
+            assert isinstance(ifc, ifcopenshell.file)
+            self.ifcs[path] = ifc
+        self.settings.logger.info(f"Loading finished {time.time() - start}")
+
     def add_collision_objects(
         self,
         name: str,
@@ -24,12 +24,13 @@ import os
 import re
 import csv
 import argparse
+import datetime
 import ifcopenshell
 import ifcopenshell.util.selector
 import ifcopenshell.util.element
 import ifcopenshell.util.schema
-from statistics import mean
-from typing import Optional, Union, Literal, Iterable
+import numpy as np
+from typing import Any, Callable, Optional, Union, Literal, Iterable
 
 try:
     from odf.namespaces import OFFICENS
@@ -43,6 +44,8 @@ except:
 
 try:
     import openpyxl
+    import openpyxl.cell
+    import openpyxl.styles
 except:
     pass  # No XLSX support
 
@@ -67,12 +70,24 @@ FILE_FORMAT = Literal[
 class IfcCsv:
     attributes: list[str]
     headers: list[str]
+    columns: list[list[Any]]
 
     def __init__(self):
         self.headers = []
-        self.results = []
+        self.columns = []
+        self.summaries = []
         self.dataframe = None
 
+    @property
+    def results(self) -> list[list[Any]]:
+        """The exported rows. Results are stored as :attr:`columns`, which should be preferred for large exports."""
+        return [list(row) for row in zip(*self.columns)]
+
+    @results.setter
+    def results(self, rows: Iterable[list[Any]]) -> None:
+        rows = list(rows)
+        self.columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in self.headers]
+
     def export(
         self,
         ifc_file: ifcopenshell.file,
@@ -95,7 +110,7 @@ class IfcCsv:
         formatting=None,
     ):
         self.ifc_file = ifc_file
-        self.results = []
+        self.columns = []
         self.headers = []
         attributes = attributes or []
 
@@ -106,23 +121,11 @@ class IfcCsv:
             attributes.insert(0, "GlobalId")
             headers.insert(0, "GlobalId")
 
-        for element in elements:
-            result = []
-
-            for attribute in attributes:
-                value = ifcopenshell.util.selector.get_element_value(element, attribute)
-                if value is None:
-                    value = null
-                elif value == "":
-                    value = empty
-                elif value is True:
-                    value = bool_true
-                elif value is False:
-                    value = bool_false
-                elif isinstance(value, (list, tuple)) and concat is not None:
-                    value = concat.join(map(str, value))
-                result.append(value)
-            self.results.append(result)
+        # Each attribute is resolved for all elements in one pass, and stored as a column
+        self.columns = [
+            self.serialise_values(values, null, empty, bool_true, bool_false, concat)
+            for values in ifcopenshell.util.selector.get_element_values(elements, attributes)
+        ]
 
         self.headers = []
         for i, attribute in enumerate(attributes):
@@ -145,13 +148,47 @@ class IfcCsv:
         elif format == "pd":
             return self.export_pd()
 
+    def serialise_values(
+        self, values: list[Any], null: str, empty: str, bool_true: str, bool_false: str, concat: str
+    ) -> list[Any]:
+        results = []
+        for value in values:
+            if value is None:
+                value = null
+            elif value == "":
+                value = empty
+            elif value is True:
+                value = bool_true
+            elif value is False:
+                value = bool_false
+            elif isinstance(value, (list, tuple)) and concat is not None:
+                value = concat.join(map(str, value))
+            results.append(value)
+        return results
+
+    def get_total_rows(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def get_float_values(self, values: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+        """Returns values as floats, and a mask of which values could be converted"""
+        try:
+            floats = np.array(values, dtype=float)
+            return floats, ~np.isnan(floats)
+        except (TypeError, ValueError):
+            pass
+        floats = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                floats[i] = float(value)
+            except:
+                continue
+        return floats, ~np.isnan(floats)
+
     def group_results(self, groups, attributes):
         if not groups:
             return
 
-        group_results = {}
         group_indices = {}
-        group_values = {}
         group_varies_values = {}
 
         for group in groups:
@@ -161,51 +198,61 @@ class IfcCsv:
             if group["type"] == "VARIES":
                 group_varies_values[index] = group["varies_value"]
 
-        for row in self.results:
-            key = "-".join([str(row[gi]) for gi in group_indices.get("GROUP", [])])
-            for group_type, gis in group_indices.items():
-                if group_type in ("CONCAT", "VARIES"):
-                    for gi in gis:
-                        group_values.setdefault(key, {}).setdefault(gi, set())
-                        group_values[key][gi].add(str(row[gi]))
-                elif group_type in ("SUM", "AVERAGE", "MIN", "MAX"):
-                    for gi in gis:
-                        group_values.setdefault(key, {}).setdefault(gi, [])
-                        try:
-                            value = float(row[gi])
-                        except:
-                            continue
-                        group_values[key][gi].append(value)
-            group_results[key] = row
+        total_rows = self.get_total_rows()
+        if not total_rows:
+            return
+
+        group_columns = [self.columns[gi] for gi in group_indices.get("GROUP", [])]
+        if group_columns:
+            keys = np.array(["-".join(map(str, values)) for values in zip(*group_columns)], dtype=object)
+        else:
+            keys = np.full(total_rows, "", dtype=object)
+
+        # Number groups in order of their first row, as this is the order of results
+        _, first_rows, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first_rows, kind="stable")
+        group_numbers = np.empty(len(order), dtype=np.intp)
+        group_numbers[order] = np.arange(len(order))
+        group_ids = group_numbers[inverse.reshape(-1)]
+        total_groups = len(order)
+
+        # Non-aggregated values are taken from the last row of each group
+        last_rows = np.zeros(total_groups, dtype=np.intp)
+        np.maximum.at(last_rows, group_ids, np.arange(total_rows))
+        columns = [np.array(column, dtype=object)[last_rows].tolist() for column in self.columns]
 
         for group_type, gis in group_indices.items():
-            if group_type == "CONCAT":
-                for key, result in group_results.items():
-                    for gi in gis:
-                        result[gi] = ", ".join(group_values[key][gi])
-            elif group_type == "VARIES":
-                for key, result in group_results.items():
-                    for gi in gis:
-                        if len(group_values[key][gi]) > 1:
-                            result[gi] = group_varies_values[gi]
-            elif group_type == "SUM":
-                for key, result in group_results.items():
-                    for gi in gis:
-                        result[gi] = sum(group_values[key][gi])
-            elif group_type == "AVERAGE":
-                for key, result in group_results.items():
-                    for gi in gis:
-                        result[gi] = mean(group_values[key][gi])
-            elif group_type == "MIN":
-                for key, result in group_results.items():
-                    for gi in gis:
-                        result[gi] = min(group_values[key][gi])
-            elif group_type == "MAX":
-                for key, result in group_results.items():
-                    for gi in gis:
-                        result[gi] = max(group_values[key][gi])
-
-        self.results = group_results.values()
+            for gi in gis:
+                if group_type in ("CONCAT", "VARIES"):
+                    group_values = [{} for _ in range(total_groups)]
+                    for group_id, value in zip(group_ids.tolist(), self.columns[gi]):
+                        group_values[group_id][str(value)] = None
+                    if group_type == "CONCAT":
+                        columns[gi] = [", ".join(values) for values in group_values]
+                    else:
+                        for group_id, values in enumerate(group_values):
+                            if len(values) > 1:
+                                columns[gi][group_id] = group_varies_values[gi]
+                elif group_type in ("SUM", "AVERAGE", "MIN", "MAX"):
+                    values, is_valid = self.get_float_values(self.columns[gi])
+                    values, valid_ids = values[is_valid], group_ids[is_valid]
+                    counts = np.bincount(valid_ids, minlength=total_groups)
+                    if group_type in ("SUM", "AVERAGE"):
+                        results = np.bincount(valid_ids, weights=values, minlength=total_groups)
+                        if group_type == "AVERAGE":
+                            results = np.divide(results, counts, out=np.zeros(total_groups), where=counts > 0)
+                    elif group_type == "MIN":
+                        results = np.full(total_groups, np.inf)
+                        np.minimum.at(results, valid_ids, values)
+                    else:
+                        results = np.full(total_groups, -np.inf)
+                        np.maximum.at(results, valid_ids, values)
+                    empty_value = 0 if group_type == "SUM" else None
+                    columns[gi] = [
+                        value if count else empty_value for value, count in zip(results.tolist(), counts.tolist())
+                    ]
+
+        self.columns = columns
 
     def summarise_results(self, summaries, attributes):
         self.summaries = [None] * len(attributes)
@@ -213,36 +260,24 @@ class IfcCsv:
         if not summaries:
             return
 
-        summary_indices = {}
-        summary_values = {}
-
         for summary in summaries:
-            index = attributes.index(summary["name"])
-            summary_indices.setdefault(summary["type"], [])
-            summary_indices[summary["type"]].append(index)
-
-        for row in self.results:
-            for summary_type, sis in summary_indices.items():
-                if summary_type in ("SUM", "AVERAGE", "MIN", "MAX"):
-                    for si in sis:
-                        summary_values.setdefault(si, [])
-                        try:
-                            value = float(row[si])
-                        except:
-                            continue
-                        summary_values[si].append(value)
-
-        for summary_type, sis in summary_indices.items():
-            for si in sis:
-                if summary_type == "SUM":
-                    self.summaries[si] = sum(summary_values[si])
-                elif summary_type == "AVERAGE":
-                    self.summaries[si] = mean(summary_values[si])
-                elif summary_type == "MIN":
-                    self.summaries[si] = min(summary_values[si])
-                elif summary_type == "MAX":
-                    self.summaries[si] = max(summary_values[si])
-                self.summaries[si] = summary_type.title() + ": " + str(self.summaries[si])
+            si = attributes.index(summary["name"])
+            summary_type = summary["type"]
+            if summary_type not in ("SUM", "AVERAGE", "MIN", "MAX"):
+                continue
+            values, is_valid = self.get_float_values(self.columns[si])
+            values = values[is_valid]
+            if summary_type == "SUM":
+                value = values.sum().item() if len(values) else 0
+            elif not len(values):
+                continue
+            elif summary_type == "AVERAGE":
+                value = values.mean().item()
+            elif summary_type == "MIN":
+                value = values.min().item()
+            elif summary_type == "MAX":
+                value = values.max().item()
+            self.summaries[si] = summary_type.title() + ": " + str(value)
 
     def format_results(self, formatting, attributes, null):
         if not formatting:
@@ -255,11 +290,18 @@ class IfcCsv:
             formatting_indices[index] = data["format"]
 
         for index, format_query in formatting_indices.items():
-            for row in self.results:
-                if row[index] == null:
+            # Many rows share a value, so each unique value is only formatted once
+            formatted_values = {}
+            column = self.columns[index]
+            for i, value in enumerate(column):
+                if value == null:
                     continue
-                row[index] = '"' + str(row[index]).replace('"', '\\"') + '"'
-                row[index] = ifcopenshell.util.selector.format(format_query.replace("{{value}}", row[index]))
+                value = '"' + str(value).replace('"', '\\"') + '"'
+                formatted_value = formatted_values.get(value)
+                if formatted_value is None:
+                    formatted_value = ifcopenshell.util.selector.format(format_query.replace("{{value}}", value))
+                    formatted_values[value] = formatted_value
+                column[i] = formatted_value
 
             if self.summaries[index] is not None:
                 summary_label, summary_value = self.summaries[index].split(": ")
@@ -268,7 +310,7 @@ class IfcCsv:
                 self.summaries[index] = summary_label + ": " + str(summary_value)
 
     def sort_results(self, sort, attributes, include_global_id):
-        if not self.results:
+        if not self.get_total_rows():
             return
         if sort:
 
@@ -278,24 +320,57 @@ class IfcCsv:
                     return [convert(c) for c in re.split("([0-9]+)", value)]
                 return value
 
-            # Sort least important keys first, then more important keys.
-            # https://stackoverflow.com/questions/11476371/sort-by-multiple-keys-using-different-orderings
+            # Sort least important keys first, then more important keys, relying on a stable sort.
+            order = np.arange(self.get_total_rows())
             for sort_data in reversed(sort):
-                i = attributes.index(sort_data["name"])
-                reverse = sort_data["order"] == "DESC"
-                self.results = sorted(self.results, key=lambda x: natural_sort(x[i]), reverse=reverse)
+                ranks = self.get_ranks(self.columns[attributes.index(sort_data["name"])], natural_sort)[order]
+                if sort_data["order"] == "DESC":
+                    ranks = -ranks
+                order = order[np.argsort(ranks, kind="stable")]
         else:
-            if include_global_id and len(list(self.results)[0]) > 1:
-                self.results = sorted(self.results, key=lambda x: x[1])
+            if include_global_id and len(self.columns) > 1:
+                order = np.argsort(self.get_ranks(self.columns[1]), kind="stable")
             elif not include_global_id:
-                self.results = sorted(self.results, key=lambda x: x[0])
+                order = np.argsort(self.get_ranks(self.columns[0]), kind="stable")
+            else:
+                return
+        self.columns = [np.array(column, dtype=object)[order].tolist() for column in self.columns]
+
+    def get_ranks(self, values: list[Any], key: Optional[Callable[[Any], Any]] = None) -> np.ndarray:
+        """Returns the rank of each value when sorted, where values with equal sort keys share a rank
+
+        Only unique values are compared, which is much faster than sorting all
+        rows when many rows share a value.
+        """
+        try:
+            unique_values = list(dict.fromkeys(values))
+        except TypeError:  # Unhashable values such as lists
+            order = sorted(range(len(values)), key=lambda i: key(values[i]) if key else values[i])
+            ranks = np.empty(len(values), dtype=np.intp)
+            rank = -1
+            previous_key = object()
+            for i in order:
+                sort_key = key(values[i]) if key else values[i]
+                if rank == -1 or sort_key != previous_key:
+                    rank += 1
+                    previous_key = sort_key
+                ranks[i] = rank
+            return ranks
+        sort_keys = [key(v) if key else v for v in unique_values]
+        value_ranks = {}
+        rank = -1
+        for i in sorted(range(len(unique_values)), key=sort_keys.__getitem__):
+            if rank == -1 or sort_keys[i] != previous_key:
+                rank += 1
+                previous_key = sort_keys[i]
+            value_ranks[unique_values[i]] = rank
+        return np.array([value_ranks[v] for v in values], dtype=np.intp)
 
     def export_csv(self, output: str, delimiter: Optional[str] = None) -> None:
         with open(output, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f, delimiter=delimiter)
             writer.writerow(self.headers)
-            for row in self.results:
-                writer.writerow(row)
+            writer.writerows(zip(*self.columns))
             if self.has_summaries():
                 writer.writerow(self.summaries)
 
@@ -365,24 +440,47 @@ class IfcCsv:
         return any([s for s in self.summaries if s is not None])
 
     def export_xlsx(self, output, should_preserve_existing=False):
+        # A new workbook is streamed to disk, and an existing one is edited in place
+        if not os.path.exists(output):
+            return self.export_xlsx_write_only(output)
+
         df = self.export_pd()
         if self.has_summaries():
             df.loc[df.shape[0]] = self.summaries
 
-        if os.path.exists(output):
-            book = openpyxl.load_workbook(output)
-            with pd.ExcelWriter(
-                output,
-                engine="openpyxl",
-                mode="a",
-                if_sheet_exists="overlay" if should_preserve_existing else "replace",
-            ) as writer:
-                df.to_excel(writer, sheet_name=book.sheetnames[0], index=False)
-        else:
-            df.to_excel(output, index=False, engine="openpyxl")
+        book = openpyxl.load_workbook(output)
+        with pd.ExcelWriter(
+            output,
+            engine="openpyxl",
+            mode="a",
+            if_sheet_exists="overlay" if should_preserve_existing else "replace",
+        ) as writer:
+            df.to_excel(writer, sheet_name=book.sheetnames[0], index=False)
+
+    def export_xlsx_write_only(self, output):
+        # A write only workbook streams rows to disk rather than holding every cell in memory.
+        # Headers are styled and values are typed the same way as when pandas writes a workbook.
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Sheet1")
+        thin = openpyxl.styles.Side(style="thin")
+        headers = []
+        for header in self.headers:
+            cell = openpyxl.cell.WriteOnlyCell(worksheet, value=header)
+            cell.font = openpyxl.styles.Font(bold=True)
+            cell.border = openpyxl.styles.Border(left=thin, right=thin, top=thin, bottom=thin)
+            cell.alignment = openpyxl.styles.Alignment(horizontal="center", vertical="top")
+            headers.append(cell)
+        worksheet.append(headers)
+        cell_types = (str, int, float, np.number, np.bool_, datetime.date, datetime.time, type(None))
+        for row in zip(*self.columns):
+            worksheet.append([v if isinstance(v, cell_types) else str(v) for v in row])
+        if self.has_summaries():
+            worksheet.append(self.summaries)
+        workbook.save(output)
 
     def export_pd(self):
-        self.dataframe = pd.DataFrame(self.results, columns=self.headers)
+        self.dataframe = pd.DataFrame({i: column for i, column in enumerate(self.columns)})
+        self.dataframe.columns = self.headers
         return self.dataframe
 
     def get_wildcard_attributes(self, attribute):
@@ -408,19 +506,26 @@ class IfcCsv:
         bool_true: str = "YES",
         bool_false: str = "NO",
         concat: str = ", ",
-    ) -> None:
+    ) -> int:
         """
+        Only cells which differ from what would be exported from the model are
+        imported, and property edits to the same property set are batched.
+
         Args:
             table: filepath to the table.
+
+        Returns:
+            The number of changed cells.
         """
         ext: FILE_FORMAT = table.split(".")[-1].lower()
 
         if ext == "csv":
-            self.import_csv(ifc_file, table, attributes, delimiter, null, empty, bool_true, bool_false, concat)
+            return self.import_csv(ifc_file, table, attributes, delimiter, null, empty, bool_true, bool_false, concat)
         elif ext == "ods":
-            self.import_ods(ifc_file, table, attributes, null, empty, bool_true, bool_false, concat)
+            return self.import_ods(ifc_file, table, attributes, null, empty, bool_true, bool_false, concat)
         elif ext == "xlsx":
-            self.import_xlsx(ifc_file, table, attributes, null, empty, bool_true, bool_false, concat)
+            return self.import_xlsx(ifc_file, table, attributes, null, empty, bool_true, bool_false, concat)
+        return 0
 
     def import_csv(
         self,
@@ -433,31 +538,27 @@ class IfcCsv:
         bool_true: str = "YES",
         bool_false: str = "NO",
         concat: str = ", ",
-    ) -> None:
+    ) -> int:
         with open(table, newline="", encoding="utf-8") as f:
             reader = csv.reader(f, delimiter=delimiter)
-            headers = []
-            for row in reader:
-                if not headers:
-                    headers = row
-                    if not attributes:
-                        attributes = [None] * len(headers)
-                    elif len(attributes) == len(headers) - 1:
-                        attributes.insert(0, "")  # The GlobalId column
-                    continue
-                self.process_row(ifc_file, row, headers, attributes, null, empty, bool_true, bool_false, concat)
-
-    def import_xlsx(self, ifc_file, table, attributes, null, empty, bool_true, bool_false, concat) -> None:
+            headers = next(reader, [])
+            if not attributes:
+                attributes = [None] * len(headers)
+            elif len(attributes) == len(headers) - 1:
+                attributes.insert(0, "")  # The GlobalId column
+            return self.import_rows(ifc_file, reader, headers, attributes, null, empty, bool_true, bool_false, concat)
+
+    def import_xlsx(self, ifc_file, table, attributes, null, empty, bool_true, bool_false, concat) -> int:
         df = pd.read_excel(table)
-        self.import_pd(ifc_file, df, attributes, null, empty, bool_true, bool_false)
+        return self.import_pd(ifc_file, df, attributes, null, empty, bool_true, bool_false)
 
-    def import_ods(self, ifc_file, table, attributes, null, empty, bool_true, bool_false, concat) -> None:
+    def import_ods(self, ifc_file, table, attributes, null, empty, bool_true, bool_false, concat) -> int:
         df = pd.read_excel(table, engine="odf")
-        self.import_pd(ifc_file, df, attributes, null, empty, bool_true, bool_false)
+        return self.import_pd(ifc_file, df, attributes, null, empty, bool_true, bool_false)
 
     def import_pd(
         self, ifc_file, df, attributes=None, null="-", empty="", bool_true="YES", bool_false="NO", concat=", "
-    ) -> None:
+    ) -> int:
         headers = df.columns.tolist()
 
         if not attributes:
@@ -465,8 +566,74 @@ class IfcCsv:
         elif len(attributes) == len(headers) - 1:
             attributes.insert(0, "")  # The GlobalId column
 
-        for _, row in df.iterrows():
-            self.process_row(ifc_file, row.tolist(), headers, attributes, null, empty, bool_true, bool_false, concat)
+        return self.import_rows(
+            ifc_file, df.values.tolist(), headers, attributes, null, empty, bool_true, bool_false, concat
+        )
+
+    def import_rows(
+        self,
+        ifc_file: ifcopenshell.file,
+        rows: Iterable[list[Any]],
+        headers: list[str],
+        attributes: list[Union[str, None]],
+        null: str,
+        empty: str,
+        bool_true: str,
+        bool_false: str,
+        concat: str,
+    ) -> int:
+        """Imports rows, only setting the values of cells which have changed
+
+        The current values of all elements are read using the same queries
+        and serialisation as an export. A cell is unchanged if it is equal to
+        the value that would be exported, so a round trip of an unedited
+        spreadsheet makes no changes to the model. Changed cells of each
+        element are then set together, which allows properties in the same
+        property set to be edited at once.
+
+        :return: The number of changed cells.
+        """
+        elements = []
+        element_rows = []
+        for row in rows:
+            try:
+                element = ifc_file.by_guid(row[0])
+            except:
+                print("The element with GUID {} was not found".format(row[0]))
+                continue
+            elements.append(element)
+            element_rows.append(row)
+        if not elements:
+            return 0
+
+        queries = [attributes[i] or headers[i] for i in range(1, len(headers))]
+        current_columns = [
+            self.serialise_values(values, null, empty, bool_true, bool_false, concat)
+            for values in ifcopenshell.util.selector.get_element_values(elements, queries)
+        ]
+
+        total_changes = 0
+        for element, row, current_row in zip(elements, element_rows, zip(*current_columns)):
+            changes = {}
+            for query, value, current_value in zip(queries, row[1:], current_row):
+                if value == current_value or (isinstance(value, str) and value == str(current_value)):
+                    continue
+                changes[query] = self.deserialise_value(value, null, empty, bool_true, bool_false)
+            if changes:
+                total_changes += len(changes)
+                ifcopenshell.util.selector.set_element_values(ifc_file, element, changes, concat=concat)
+        return total_changes
+
+    def deserialise_value(self, value: Any, null: str, empty: str, bool_true: str, bool_false: str) -> Any:
+        if value == null:
+            return None
+        elif value == empty:
+            return ""
+        elif value == bool_true:
+            return True
+        elif value == bool_false:
+            return False
+        return value
 
     def process_row(
         self,
@@ -488,14 +655,7 @@ class IfcCsv:
         for i, value in enumerate(row):
             if i == 0:
                 continue  # Skip GlobalId
-            if value == null:
-                value = None
-            elif value == empty:
-                value = ""
-            elif value == bool_true:
-                value = True
-            elif value == bool_false:
-                value = False
+            value = self.deserialise_value(value, null, empty, bool_true, bool_false)
             key = attributes[i] or headers[i]
             ifcopenshell.util.selector.set_element_value(ifc_file, element, key, value, concat=concat)
 
@@ -552,7 +712,7 @@ if __name__ == "__main__":
     elif getattr(args, "import"):
         ifc_csv = IfcCsv()
         ifc_file = ifcopenshell.open(args.ifc)
-        ifc_csv.Import(
+        total_changes = ifc_csv.Import(
             ifc_file,
             args.spreadsheet,
             attributes=args.attributes or [],
@@ -561,4 +721,5 @@ if __name__ == "__main__":
             empty=args.empty,
             concat=args.concat,
         )
+        print(f"{total_changes} cells changed")
         ifc_file.write(args.ifc)
@@ -0,0 +1,50 @@
+# IfcCSV - A utility to interact with IFC data through CSV.
+# Copyright (C) 2020, 2021 Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcCSV.
+#
+# IfcCSV is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcCSV is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcCSV.  If not, see <http://www.gnu.org/licenses/>.
+
+import openpyxl
+import ifcopenshell
+import ifcopenshell.api.root
+import ifccsv
+
+
+class TestExportXlsx:
+    def test_exporting_a_new_workbook(self, tmp_path):
+        ifc_file = ifcopenshell.file()
+        walls = [ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcWall", name=f"W{i}") for i in range(3)]
+        output = tmp_path / "schedule.xlsx"
+        ifc_csv = ifccsv.IfcCsv()
+        ifc_csv.export(ifc_file, walls, ["Name"], output=str(output), format="xlsx")
+
+        worksheet = openpyxl.load_workbook(output).active
+        rows = list(worksheet.iter_rows(values_only=True))
+        assert rows == [("GlobalId", "Name")] + [(w.GlobalId, w.Name) for w in walls]
+        for cell in worksheet[1]:
+            assert cell.font.bold
+            assert cell.border.bottom.style == "thin"
+            assert cell.alignment.horizontal == "center"
+
+    def test_exporting_typed_values_and_summaries(self, tmp_path):
+        output = tmp_path / "schedule.xlsx"
+        ifc_csv = ifccsv.IfcCsv()
+        ifc_csv.headers = ["Name", "Count", "Length"]
+        ifc_csv.results = [["A", 1, 2.5], ["B", 2, None]]
+        ifc_csv.summaries = [None, 3, None]
+        ifc_csv.export_xlsx(str(output))
+
+        rows = list(openpyxl.load_workbook(output).active.iter_rows(values_only=True))
+        assert rows == [("Name", "Count", "Length"), ("A", 1, 2.5), ("B", 2, None), (None, 3, None)]
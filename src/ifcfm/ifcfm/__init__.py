@@ -19,11 +19,15 @@
 import os
 import re
 import csv
+import tempfile
 import importlib
+import contextlib
+import ifcopenshell
 import ifcopenshell.util.selector
 from pathlib import Path
 from collections import defaultdict
-from typing import Literal, Union, Any, Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Literal, Optional, Union, Any, Callable, ContextManager
 
 try:
     from openpyxl import Workbook
@@ -51,8 +55,13 @@ __version__ = version = "0.0.0"
 
 ParserPreset = Literal["basic", "cobie24", "cobie24legacy"]
 GetElementDataCallBack = Callable[[ifcopenshell.file, ifcopenshell.entity_instance], dict[str, Any]]
+CategoryData = list[tuple[str, dict[str, Any]]]
 _parser_presets_configs = {}
 
+# The parser and model used by a worker process
+worker_parser: Optional["Parser"] = None
+worker_file: Optional[ifcopenshell.file] = None
+
 
 def get_presets_configs() -> dict[ParserPreset, dict[str, Any]]:
     global _parser_presets_configs
@@ -90,50 +99,136 @@ class Parser:
             self.config = preset
 
     # TODO: name is unused?
-    def parse(self, ifc_file: ifcopenshell.file, name=None):
-        for category_name, category_config in self.config["categories"].items():
-            for element in category_config["get_category_elements"](ifc_file):
-                get_element_data: Union[GetElementDataCallBack, dict[str, Any]]
-                get_element_data = category_config["get_element_data"]
-
-                if isinstance(get_element_data, dict):
-                    data = {}
-                    for key, query in get_element_data.items():
-                        data[key] = ifcopenshell.util.selector.get_element_value(element, query)
-                elif isinstance(get_element_data, Callable):
-                    data = get_element_data(ifc_file, element) or {}
-
-                get_custom_element_data = self.get_custom_element_data.get(category_name, lambda x, y: None)
-                if isinstance(get_custom_element_data, dict):
-                    custom_data = {}
-                    for key, query in get_custom_element_data.items():
-                        custom_data[key] = ifcopenshell.util.selector.get_element_value(element, query)
-                elif isinstance(get_custom_element_data, Callable):
-                    custom_data = get_custom_element_data(ifc_file, element) or {}
-
-                data.update(custom_data)
-
-                if data:
-                    key = "-".join([str(data[k]) for k in category_config["keys"]])
-                    # TODO: duplicate_keys are never used?
-                    if key in self.categories[category_name]:
-                        self.duplicate_keys.append((self.categories[category_name][key], data))
-                    self.categories[category_name][key] = data
-
-    def federate(self, paths: list[str]) -> None:
-        for path in paths:
-            spreadsheet = pd.ExcelFile(path)
-            sheet_names = spreadsheet.sheet_names
-
-            for category_name, category_config in self.config["categories"].items():
-                if category_name not in sheet_names:
-                    continue
-                df = pd.read_excel(spreadsheet, sheet_name=category_name, keep_default_na=False)
-                for _, row in df.iterrows():
-                    key = "-".join([str(row[k]) for k in category_config["keys"]])
+    def parse(self, ifc_file: ifcopenshell.file, name=None, processes: Optional[int] = None) -> None:
+        """Parses FM data from a model, adding it to the parsed categories
+
+        :param ifc_file: The model to parse.
+        :param processes: If more than one, categories are parsed in a pool of
+            processes. The model is written to a temporary file so that each
+            process can load it, and entities in the parsed data are mapped
+            back to entities of ``ifc_file``, so the result is the same as a
+            serial parse. The preset and ``get_custom_element_data`` are sent
+            to each process, so their callbacks must be picklable (i.e.
+            module level functions, not lambdas) where processes are spawned,
+            which is the default on Windows, macOS, and from Python 3.14.
+        """
+        if processes is not None and processes > 1 and len(self.config["categories"]) > 1:
+            return self.parse_in_processes(ifc_file, processes)
+
+        with self.cache_scope(ifc_file):
+            for category_name in self.config["categories"]:
+                self.add_category_data(category_name, self.get_category_data(ifc_file, category_name))
+
+    def parse_in_processes(self, ifc_file: ifcopenshell.file, processes: int) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = os.path.join(tmpdir, "model.ifc")
+            ifc_file.write(model_path)
+            initargs = (self.config, self.get_custom_element_data, model_path)
+            with ProcessPoolExecutor(max_workers=processes, initializer=init_worker, initargs=initargs) as executor:
+                category_names = list(self.config["categories"].keys())
+                for category_name, data in zip(category_names, executor.map(parse_category, category_names)):
+                    self.add_category_data(category_name, get_entity_data(ifc_file, data))
+
+    def parse_files(self, paths: list[str], processes: Optional[int] = None) -> None:
+        """Parses and federates FM data from many models in a pool of processes
+
+        The result is the same as opening and parsing each model in order,
+        including which rows are replaced or recorded as duplicates when
+        models share keys, except that the models are never opened in this
+        process, so entities in the parsed data are returned as strings (such
+        as ``"#1=IfcWall(...)"``) rather than entity instances.
+
+        The preset and ``get_custom_element_data`` are sent to each process,
+        so their callbacks must be picklable (i.e. module level functions, not
+        lambdas) where processes are spawned, which is the default on
+        Windows, macOS, and from Python 3.14.
+
+        :param paths: The filepaths of the models to parse.
+        :param processes: The number of processes to use. Defaults to the
+            number of CPUs.
+        """
+        initargs = (self.config, self.get_custom_element_data)
+        with ProcessPoolExecutor(max_workers=processes, initializer=init_worker, initargs=initargs) as executor:
+            for results in executor.map(parse_file, paths):
+                for category_name, data in results.items():
+                    self.add_category_data(category_name, data)
+
+    def cache_scope(self, ifc_file: ifcopenshell.file) -> ContextManager[None]:
+        """Caches the lookups of a preset for a model, if the preset supports it"""
+        cache_scope = self.config.get("cache_scope", None)
+        return cache_scope(ifc_file) if cache_scope else contextlib.nullcontext()
+
+    def get_category_data(self, ifc_file: ifcopenshell.file, category_name: str) -> CategoryData:
+        """Gets the key and data of every element in a category, in order"""
+        results = []
+        category_config = self.config["categories"][category_name]
+        for element in category_config["get_category_elements"](ifc_file):
+            get_element_data: Union[GetElementDataCallBack, dict[str, Any]]
+            get_element_data = category_config["get_element_data"]
+
+            if isinstance(get_element_data, dict):
+                data = {}
+                for key, query in get_element_data.items():
+                    data[key] = ifcopenshell.util.selector.get_element_value(element, query)
+            elif isinstance(get_element_data, Callable):
+                data = get_element_data(ifc_file, element) or {}
+
+            get_custom_element_data = self.get_custom_element_data.get(category_name, lambda x, y: None)
+            if isinstance(get_custom_element_data, dict):
+                custom_data = {}
+                for key, query in get_custom_element_data.items():
+                    custom_data[key] = ifcopenshell.util.selector.get_element_value(element, query)
+            elif isinstance(get_custom_element_data, Callable):
+                custom_data = get_custom_element_data(ifc_file, element) or {}
+
+            data.update(custom_data)
+
+            if data:
+                key = "-".join([str(data[k]) for k in category_config["keys"]])
+                results.append((key, data))
+        return results
+
+    def add_category_data(self, category_name: str, data: CategoryData) -> None:
+        for key, row in data:
+            # TODO: duplicate_keys are never used?
+            if key in self.categories[category_name]:
+                self.duplicate_keys.append((self.categories[category_name][key], row))
+            self.categories[category_name][key] = row
+
+    def federate(self, paths: list[str], processes: Optional[int] = None) -> None:
+        """Merges rows from existing spreadsheets, keeping the first row of each key
+
+        :param paths: The filepaths of the spreadsheets to merge.
+        :param processes: If more than one, spreadsheets are read in a pool
+            of processes. The preset is sent to each process, so its callbacks
+            must be picklable, as in :meth:`parse`.
+        """
+        if processes is not None and processes > 1 and len(paths) > 1:
+            initargs = (self.config, self.get_custom_element_data)
+            with ProcessPoolExecutor(max_workers=processes, initializer=init_worker, initargs=initargs) as executor:
+                results = list(executor.map(read_spreadsheet, paths))
+        else:
+            results = [self.read_spreadsheet(path) for path in paths]
+
+        for spreadsheet_data in results:
+            for category_name, data in spreadsheet_data.items():
+                for key, row in data:
                     if key in self.categories[category_name]:
                         continue
-                    self.categories[category_name][key] = row.to_dict()
+                    self.categories[category_name][key] = row
+
+    def read_spreadsheet(self, path: str) -> dict[str, CategoryData]:
+        results = {}
+        spreadsheet = pd.ExcelFile(path)
+        sheet_names = spreadsheet.sheet_names
+        for category_name, category_config in self.config["categories"].items():
+            if category_name not in sheet_names:
+                continue
+            df = pd.read_excel(spreadsheet, sheet_name=category_name, keep_default_na=False)
+            results[category_name] = [
+                ("-".join([str(row[k]) for k in category_config["keys"]]), row) for row in df.to_dict("records")
+            ]
+        return results
 
     def exclude_categories(self, names: list[str]) -> None:
         for name in names:
@@ -145,6 +240,70 @@ class Parser:
         self.config["categories"][category]["headers"] = [h for h in headers if h not in names]
 
 
+def init_worker(
+    config: dict[str, Any],
+    get_custom_element_data: dict[str, Union[GetElementDataCallBack, dict[str, Any]]],
+    model_path: Optional[str] = None,
+) -> None:
+    global worker_parser, worker_file
+    worker_parser = Parser(config)
+    worker_parser.get_custom_element_data = get_custom_element_data
+    worker_file = ifcopenshell.open(model_path) if model_path else None
+
+
+def parse_category(category_name: str) -> CategoryData:
+    with worker_parser.cache_scope(worker_file):
+        return get_picklable_data(worker_parser.get_category_data(worker_file, category_name), keep_ids=True)
+
+
+def parse_file(path: str) -> dict[str, CategoryData]:
+    ifc_file = ifcopenshell.open(path)
+    results = {}
+    with worker_parser.cache_scope(ifc_file):
+        for category_name in worker_parser.config["categories"]:
+            results[category_name] = get_picklable_data(worker_parser.get_category_data(ifc_file, category_name))
+    return results
+
+
+def read_spreadsheet(path: str) -> dict[str, CategoryData]:
+    return worker_parser.read_spreadsheet(path)
+
+
+class EntityId(int):
+    """The ID of an entity in parsed data sent between processes"""
+
+
+def get_picklable_data(data: CategoryData, keep_ids: bool = False) -> CategoryData:
+    """Replaces entities in parsed data, so that it may be sent between processes
+
+    :param keep_ids: If true, entities are replaced with their :class:`EntityId`
+        so that they may be mapped back using :func:`get_entity_data`.
+        Otherwise, entities are replaced with strings.
+    """
+
+    def get_picklable_value(value: Any) -> Any:
+        if isinstance(value, ifcopenshell.entity_instance):
+            return EntityId(value.id()) if keep_ids and value.id() else str(value)
+        elif isinstance(value, (list, tuple)):
+            return type(value)(get_picklable_value(v) for v in value)
+        return value
+
+    return [(key, {k: get_picklable_value(v) for k, v in row.items()}) for key, row in data]
+
+
+def get_entity_data(ifc_file: ifcopenshell.file, data: CategoryData) -> CategoryData:
+    """Maps each :class:`EntityId` in parsed data back to an entity of the model"""
+
+    def get_entity_value(value: Any) -> Any:
+        if isinstance(value, EntityId):
+            return ifc_file.by_id(value)
+        elif isinstance(value, (list, tuple)):
+            return type(value)(get_entity_value(v) for v in value)
+        return value
+
+    return [(key, {k: get_entity_value(v) for k, v in row.items()}) for key, row in data]
+
+
 class Writer:
     config: dict[str, Any]
     categories: dict[str, dict[str, Any]]
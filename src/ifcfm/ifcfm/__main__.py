@@ -28,7 +28,9 @@ parser.add_argument(
     default="basic",
     help="The FM standard to extract. Built-in preset standards include cobie24, cobie3, aohbsem, and basic.",
 )
-parser.add_argument("-i", "--ifc", type=str, required=True, help="The IFC file")
+parser.add_argument(
+    "-i", "--ifc", type=str, nargs="+", required=True, help="The IFC file, or many IFC files to federate"
+)
 parser.add_argument(
     "-s",
     "--spreadsheet",
@@ -46,11 +48,20 @@ parser.add_argument(
 )
 parser.add_argument("--bool_true", type=str, default="YES", help="How to represent true values. Defaults to YES.")
 parser.add_argument("--bool_false", type=str, default="NO", help="How to represent false values. Defaults to NO.")
+parser.add_argument(
+    "-j",
+    "--processes",
+    type=int,
+    default=None,
+    help="The number of processes to parse with. Defaults to 1 for one IFC file, or the number of CPUs for many.",
+)
 args = parser.parse_args()
 
-ifc_file = ifcopenshell.open(args.ifc)
 parser = ifcfm.Parser(preset=args.preset)
-parser.parse(ifc_file)
+if len(args.ifc) > 1:
+    parser.parse_files(args.ifc, processes=args.processes)
+else:
+    parser.parse(ifcopenshell.open(args.ifc[0]), processes=args.processes)
 writer = ifcfm.Writer(parser)
 writer.write(null=args.null, empty=args.empty, bool_true=args.bool_true, bool_false=args.bool_false)
 if args.format == "csv":
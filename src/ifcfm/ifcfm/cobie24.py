@@ -16,6 +16,9 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcFM.  If not, see <http://www.gnu.org/licenses/>.
 
+import weakref
+import functools
+import contextlib
 import ifcopenshell
 import ifcopenshell.geom
 import ifcopenshell.util.classification
@@ -26,7 +29,7 @@ import ifcopenshell.util.placement
 import ifcopenshell.util.shape
 import ifcopenshell.util.system
 from ifcopenshell.util.shape_builder import np_matrix_to_euler
-from typing import Any, Union, Optional, Generator
+from typing import Any, Callable, Union, Optional, Generator, TypeVar
 
 
 # The original BIMServer plugin has a function called ifcToCOBie:
@@ -39,6 +42,44 @@ from typing import Any, Union, Optional, Generator
 # Impact, Coordinate, Issue, Picklist
 
 
+T = TypeVar("T")
+
+# Lookups which are shared by many rows and categories (such as the COBie types
+# and components) are cached per model, but only within a cache scope, such as
+# for the duration of a parse. Outside a scope, lookups are never stale.
+file_caches: weakref.WeakKeyDictionary[ifcopenshell.file, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def cache_per_file(func: Callable[[ifcopenshell.file], T]) -> Callable[[ifcopenshell.file], T]:
+    @functools.wraps(func)
+    def wrapper(ifc_file: ifcopenshell.file) -> T:
+        cache = file_caches.get(ifc_file)
+        if cache is None:
+            return func(ifc_file)
+        if func.__name__ not in cache:
+            cache[func.__name__] = func(ifc_file)
+        return cache[func.__name__]
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def cache_scope(ifc_file: ifcopenshell.file) -> Generator[None, None, None]:
+    """Caches lookups of a model until the scope ends
+
+    The model should not be edited within the scope. Nested scopes share the
+    cache of the outermost scope.
+    """
+    if ifc_file in file_caches:
+        yield
+        return
+    file_caches[ifc_file] = {}
+    try:
+        yield
+    finally:
+        file_caches.pop(ifc_file, None)
+
+
 def get_contacts(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     return ifc_file.by_type("IfcActor")
 
@@ -47,6 +88,7 @@ def get_facilities(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_inst
     return ifc_file.by_type("IfcBuilding")
 
 
+@cache_per_file
 def get_floors(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     return [
         e
@@ -55,10 +97,12 @@ def get_floors(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance
     ]
 
 
+@cache_per_file
 def get_spaces(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     return ifc_file.by_type("IfcSpace")
 
 
+@cache_per_file
 def get_zones(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     results = []
     zones = ifc_file.by_type("IfcZone")
@@ -74,10 +118,12 @@ def get_zones(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]
     return results
 
 
+@cache_per_file
 def get_types(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     return ifcopenshell.util.fm.get_cobie_types(ifc_file)
 
 
+@cache_per_file
 def get_components(ifc_file: ifcopenshell.file) -> set[ifcopenshell.entity_instance]:
     elements = set()
     for element_type in get_types(ifc_file):
@@ -85,6 +131,7 @@ def get_components(ifc_file: ifcopenshell.file) -> set[ifcopenshell.entity_insta
     return elements
 
 
+@cache_per_file
 def get_systems(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     results = []
     components = get_components(ifc_file)
@@ -107,7 +154,7 @@ def get_assemblies(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_inst
         for layer in layer_set.MaterialLayers:
             results.append((None, layer_set, layer.Material))
     rels = ifc_file.by_type("IfcRelAggregates") + ifc_file.by_type("IfcRelNests")
-    types = get_types(ifc_file)
+    types = set(get_types(ifc_file))
     components = get_components(ifc_file)
     for rel in rels:
         if rel.RelatingObject.is_a("IfcSpace"):
@@ -149,6 +196,7 @@ def get_jobs(ifc_file: ifcopenshell.file) -> list[ifcopenshell.entity_instance]:
     return ifc_file.by_type("IfcTask")
 
 
+@cache_per_file
 def get_documents(
     ifc_file: ifcopenshell.file,
 ) -> list[tuple[ifcopenshell.entity_instance, ifcopenshell.entity_instance, ifcopenshell.entity_instance]]:
@@ -314,15 +362,12 @@ def get_facility_data(ifc_file: ifcopenshell.file, element: ifcopenshell.entity_
         site_name = val(site.Name)
         site_description = val(site.Description)
 
-    project = None
+    project = get_project(ifc_file)
     project_name = None
     project_description = None
-    try:
-        project = ifc_file.by_type("IfcProject")[0]
+    if project:
         project_name = val(project.Name)
         project_description = val(project.Description)
-    except:
-        pass
 
     return {
         "Name": val(element.Name),
@@ -937,6 +982,13 @@ def get_coordinate_data_(element: ifcopenshell.entity_instance) -> Generator[dic
         yield base_data | box_point_data
 
 
+@cache_per_file
+def get_project(ifc_file: ifcopenshell.file) -> Union[ifcopenshell.entity_instance, None]:
+    projects = ifc_file.by_type("IfcProject")
+    if projects:
+        return projects[0]
+
+
 def get_unit_type_name(ifc_file: ifcopenshell.file, unit_type: str) -> Union[str, None]:
     for unit in ifc_file.by_type("IfcUnitAssignment")[0].Units:
         if unit.is_a("IfcNamedUnit") and unit.UnitType == unit_type:
@@ -1085,6 +1137,7 @@ def get_property(
         return round(result, decimals)
 
 
+@cache_per_file
 def get_history(ifc_file: ifcopenshell.file) -> Union[ifcopenshell.entity_instance, None]:
     histories = ifc_file.by_type("IfcOwnerHistory")
     if histories:
@@ -1148,6 +1201,7 @@ config = {
     "empty": "n/a",
     "bool_true": "Yes",
     "bool_false": "No",
+    "cache_scope": cache_scope,
     "categories": {
         "Contact": {
             "colour": "r",
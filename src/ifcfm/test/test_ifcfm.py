@@ -0,0 +1,95 @@
+# IfcFM - IFC for facility management
+# Copyright (C) 2023 Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcFM.
+#
+# IfcFM is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcFM is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcFM.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+import ifcopenshell
+import ifcopenshell.api.aggregate
+import ifcopenshell.api.root
+import ifcopenshell.util.element
+import ifcfm
+import ifcfm.cobie24
+
+
+@pytest.fixture
+def ifc_file():
+    ifc_file = ifcopenshell.file()
+    project = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcProject", name="Project")
+    site = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcSite", name="Site")
+    building = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcBuilding", name="Building")
+    ifcopenshell.api.aggregate.assign_object(ifc_file, products=[site], relating_object=project)
+    ifcopenshell.api.aggregate.assign_object(ifc_file, products=[building], relating_object=site)
+    for i in range(2):
+        storey = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcBuildingStorey", name=f"Storey {i}")
+        ifcopenshell.api.aggregate.assign_object(ifc_file, products=[storey], relating_object=building)
+        for j in range(2):
+            space = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcSpace", name=f"Space {i}{j}")
+            ifcopenshell.api.aggregate.assign_object(ifc_file, products=[space], relating_object=storey)
+    return ifc_file
+
+
+def get_element_storey(ifc_file, element):
+    return {"Storey": ifcopenshell.util.element.get_aggregate(element)}
+
+
+class TestParser:
+    def test_parsing_in_processes_like_a_serial_parse(self, ifc_file):
+        serial = ifcfm.Parser("basic")
+        serial.get_custom_element_data = {"Spaces": get_element_storey}
+        serial.parse(ifc_file)
+        parallel = ifcfm.Parser("basic")
+        parallel.get_custom_element_data = {"Spaces": get_element_storey}
+        parallel.parse(ifc_file, processes=2)
+        assert len(serial.categories["Spaces"]) == 4
+        assert parallel.categories == serial.categories
+        assert parallel.duplicate_keys == serial.duplicate_keys
+        for row in parallel.categories["Spaces"].values():
+            assert row["Storey"].is_a("IfcBuildingStorey")
+
+    def test_parsing_files_in_processes_with_entities_as_strings(self, ifc_file, tmp_path):
+        path = str(tmp_path / "model.ifc")
+        ifc_file.write(path)
+        serial = ifcfm.Parser("basic")
+        serial.get_custom_element_data = {"Spaces": get_element_storey}
+        serial.parse(ifc_file)
+        serial.parse(ifc_file)
+        parallel = ifcfm.Parser("basic")
+        parallel.get_custom_element_data = {"Spaces": get_element_storey}
+        parallel.parse_files([path, path], processes=2)
+        assert parallel.categories.keys() == serial.categories.keys()
+        for category_name, rows in serial.categories.items():
+            assert parallel.categories[category_name].keys() == rows.keys()
+        assert len(parallel.duplicate_keys) == len(serial.duplicate_keys)
+        for key, row in serial.categories["Spaces"].items():
+            assert parallel.categories["Spaces"][key]["Storey"] == str(row["Storey"])
+
+
+class TestCachePerFile:
+    def test_not_caching_outside_a_cache_scope(self):
+        ifc_file = ifcopenshell.file()
+        assert ifcfm.cobie24.get_spaces(ifc_file) == []
+        space = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcSpace")
+        assert ifcfm.cobie24.get_spaces(ifc_file) == [space]
+
+    def test_caching_within_a_cache_scope(self):
+        ifc_file = ifcopenshell.file()
+        with ifcfm.cobie24.cache_scope(ifc_file):
+            spaces = ifcfm.cobie24.get_spaces(ifc_file)
+            ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcSpace")
+            assert ifcfm.cobie24.get_spaces(ifc_file) is spaces
+        assert len(ifcfm.cobie24.get_spaces(ifc_file)) == 1
+        assert ifc_file not in ifcfm.cobie24.file_caches
@@ -58,11 +58,17 @@ import os
 import sys
 import zipfile
 import tempfile
+import importlib
+import importlib.util
 from pathlib import Path
-from typing import Optional, Union, TYPE_CHECKING, Any, overload, Literal
+from typing import Optional, Union, TYPE_CHECKING, Any, Iterable, overload, Literal
 
 if TYPE_CHECKING:
     import ifcopenshell.express.schema_class
+    import ifcopenshell.model_cache
+    from . import guid
+    from .sql import sqlite, sqlite_entity
+    from .stream import stream, stream_entity
 
 
 if hasattr(os, "uname"):
@@ -86,9 +92,7 @@ except Exception:
     raise ImportError("IfcOpenShell not built for '%s'" % python_distribution)
 
 from .file import file
-from . import guid
 from .entity_instance import entity_instance, register_schema_attributes
-from .sql import sqlite, sqlite_entity
 
 # explicitly specify available imported symbols
 # (it's a requirement for a typed library)
@@ -103,10 +107,36 @@ __all__ = [
     "stream_entity",
 ]
 
-try:
-    from .stream import stream, stream_entity
-except:
-    pass
+# Symbols which are only imported on first access, so that importing
+# ifcopenshell doesn't also import sqlite3, lark, etc. Submodules such as
+# ifcopenshell.util or ifcopenshell.geom are similarly imported on first access.
+lazy_attributes = {
+    "guid": (".guid", None),
+    "sqlite": (".sql", "sqlite"),
+    "sqlite_entity": (".sql", "sqlite_entity"),
+    "stream": (".stream", "stream"),
+    "stream_entity": (".stream", "stream_entity"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in lazy_attributes:
+        module_name, attribute = lazy_attributes[name]
+        value = importlib.import_module(module_name, __name__)
+        if attribute:
+            # Raises an AttributeError if the optional dependencies of the submodule are missing
+            value = getattr(value, attribute)
+    elif not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}"):
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Importing .stream binds the submodule to ifcopenshell.stream, so always rebind the requested symbol
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(lazy_attributes))
 
 
 class Error(Exception):
@@ -175,14 +205,63 @@ def open(
                         return open(zf.extract(name, unzipped_path))
                 else:
                     raise LookupError(f"No .ifc or .ifcXML file found in {path}")
+    # Lazily imported symbols are accessed through __getattr__, see lazy_attributes
     if format == ".ifcSQLite":
-        return sqlite(path)
+        return __getattr__("sqlite")(path)
     if should_stream:
-        return stream(path)
+        return __getattr__("stream")(path)
     f = ifcopenshell_wrapper.open(str(path.absolute()))
     return file(f)
 
 
+def open_many(
+    paths: Iterable[Union[os.PathLike, str]],
+    format: Optional[str] = None,
+    workers: Optional[int] = None,
+    cache: Union[ifcopenshell.model_cache.ModelCache, bool, None] = None,
+) -> list[Union[file, sqlite]]:
+    """Loads many IFC datasets concurrently
+
+    Parsing releases the GIL, so models are parsed concurrently in threads of
+    this process, and the results are ordinary :class:`file` objects.
+
+    Optionally, models may be reused from and stored in a
+    :class:`ifcopenshell.model_cache.ModelCache`. Models are only reused if
+    their files haven't changed since they were cached.
+
+    :param paths: The filepaths of the models.
+    :param format: The format of the models, see :func:`open`. If no format
+        is given, it is guessed from the extension of each filepath.
+    :param workers: The maximum number of models to load concurrently.
+        Defaults to the number of CPUs.
+    :param cache: A model cache to use, or True to use the process wide
+        :data:`ifcopenshell.model_cache.default_cache`.
+    :return: The models, in the same order as the filepaths.
+
+    Example:
+
+    .. code:: python
+
+        architecture, structure = ifcopenshell.open_many(["/path/to/arc.ifc", "/path/to/str.ifc"])
+
+        # Reuse models in a long running process, until their files change
+        models = ifcopenshell.open_many(paths, cache=True)
+    """
+    paths = list(paths)
+    if cache is True:
+        import ifcopenshell.model_cache
+
+        cache = ifcopenshell.model_cache.default_cache
+    if cache is not None and cache is not False:
+        return cache.open_many(paths, format, workers=workers)
+    if len(paths) < 2 or workers == 1:
+        return [open(path, format) for path in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(paths))) as executor:
+        return list(executor.map(lambda path: open(path, format), paths))
+
+
 def create_entity(type: str, schema: str = "IFC4", *args: Any, **kwargs: Any) -> entity_instance:
     """Creates a new IFC entity that does not belong to an IFC file object
 
@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
+import ifcopenshell.util.shape_builder
 import ifcopenshell.util.unit
 from typing import Optional, Any
 
@@ -42,6 +44,12 @@ def add_mesh_representation(
     unit_scale: Optional[float] = None,
     # Force using IfcFacetedBreps instead of IfcPolygonalFaceSets
     force_faceted_brep: bool = False,
+    # Use IfcTriangulatedFaceSets instead of IfcPolygonalFaceSets for items where all faces are triangles
+    triangulated: bool = False,
+    # Merge coincident vertices of each item, which is useful for meshes exported as a "triangle soup"
+    deduplicate: bool = False,
+    # Split face sets with more faces than this into multiple items
+    max_faces: Optional[int] = None,
 ) -> ifcopenshell.entity_instance:
     # TODO: Support edges without faces.
     assert faces is not None, f"Currently 'faces' argument is not optional."
@@ -55,6 +63,9 @@ def add_mesh_representation(
         "coordinate_offset": cooridnate_offset,
         "unit_scale": unit_scale,
         "force_faceted_brep": force_faceted_brep,
+        "triangulated": triangulated,
+        "deduplicate": deduplicate,
+        "max_faces": max_faces,
     }
     return usecase.execute()
 
@@ -77,7 +88,8 @@ class Usecase:
         items = []
         for i in range(0, len(self.settings["vertices"])):
             vertices = [
-                self.file.createIfcCartesianPoint(self.convert_si_to_unit(v)) for v in self.settings["vertices"][i]
+                self.file.createIfcCartesianPoint(v)
+                for v in self.convert_si_to_unit(self.settings["vertices"][i]).tolist()
             ]
             faces = [
                 self.file.createIfcFace(
@@ -91,20 +103,24 @@ class Usecase:
         )
 
     def create_polygonal_face_set(self):
+        builder = ifcopenshell.util.shape_builder.ShapeBuilder(self.file)
         items = []
         for i in range(0, len(self.settings["vertices"])):
-            coordinates = self.file.createIfcCartesianPointList3D(
-                [self.convert_si_to_unit(v) for v in self.settings["vertices"][i]]
+            items.extend(
+                builder.face_sets(
+                    self.convert_si_to_unit(self.settings["vertices"][i]),
+                    self.settings["faces"][i],
+                    deduplicate=self.settings["deduplicate"],
+                    max_faces=self.settings["max_faces"],
+                    force_polygonal=not self.settings["triangulated"],
+                )
             )
-            faces = [self.file.createIfcIndexedPolygonalFace([v + 1 for v in f]) for f in self.settings["faces"][i]]
-            items.append(self.file.createIfcPolygonalFaceSet(coordinates, None, faces))
         return self.file.createIfcShapeRepresentation(
             self.settings["context"], self.settings["context"].ContextIdentifier, "Tessellation", items
         )
 
-    def convert_si_to_unit(self, co):
-        if isinstance(co, (tuple, list)):
-            return [self.convert_si_to_unit(o) for o in co]
+    def convert_si_to_unit(self, co) -> np.ndarray:
+        co = np.asarray(co, dtype="d") / self.settings["unit_scale"]
         if self.settings["coordinate_offset"]:
-            return (co / self.settings["unit_scale"]) + self.settings["coordinate_offset"]
-        return co / self.settings["unit_scale"]
+            co += self.settings["coordinate_offset"]
+        return co
@@ -94,7 +94,6 @@ def add_time_period(
     time_periods.append(time_period)
     settings["recurrence_pattern"].TimePeriods = time_periods
 
-    ifcopenshell.util.sequence.is_working_day.cache_clear()
-    ifcopenshell.util.sequence.is_calendar_applicable.cache_clear()
+    ifcopenshell.util.sequence.clear_calendar_cache()
 
     return time_period
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 import ifcopenshell
+import ifcopenshell.util.sequence
 from typing import Literal
 
 TIME_TYPE = Literal["WorkingTimes", "ExceptionTimes"]
@@ -85,4 +86,6 @@ def add_work_time(
         exception_times = list(settings["work_calendar"].ExceptionTimes or [])
         exception_times.append(work_time)
         settings["work_calendar"].ExceptionTimes = exception_times
+
+    ifcopenshell.util.sequence.clear_calendar_cache()
     return work_time
@@ -115,4 +115,6 @@ def assign_recurrence_pattern(
         if (recurrence_old := parent.Recurrence) and file.get_total_inverses(recurrence_old) == 1:
             file.remove(recurrence_old)
         parent.Recurrence = recurrence
+
+    ifcopenshell.util.sequence.clear_calendar_cache()
     return recurrence
@@ -55,5 +55,4 @@ def edit_recurrence_pattern(
     for name, value in attributes.items():
         setattr(recurrence_pattern, name, value)
 
-    ifcopenshell.util.sequence.is_working_day.cache_clear()
-    ifcopenshell.util.sequence.is_calendar_applicable.cache_clear()
+    ifcopenshell.util.sequence.clear_calendar_cache()
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 import ifcopenshell
+import ifcopenshell.util.sequence
 from typing import Any
 
 
@@ -44,3 +45,5 @@ def edit_work_calendar(
     """
     for name, value in attributes.items():
         setattr(work_calendar, name, value)
+
+    ifcopenshell.util.sequence.clear_calendar_cache()
@@ -17,6 +17,7 @@
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
 import ifcopenshell.util.date
+import ifcopenshell.util.sequence
 from typing import Any
 
 
@@ -62,3 +63,5 @@ def edit_work_time(
             work_time[5] = value
         else:
             setattr(work_time, name, value)
+
+    ifcopenshell.util.sequence.clear_calendar_cache()
@@ -21,6 +21,7 @@ import networkx as nx
 import ifcopenshell.api.sequence
 import ifcopenshell.util.date
 import ifcopenshell.util.sequence
+from typing import Literal
 
 
 def recalculate_schedule(file: ifcopenshell.file, work_schedule: ifcopenshell.entity_instance) -> None:
@@ -31,8 +32,9 @@ def recalculate_schedule(file: ifcopenshell.file, work_schedule: ifcopenshell.en
     marked as critical, and both the total and free floats will be
     populated for all task times.
 
-    Cyclical relationships are detected and will result in a recursion
-    error.
+    Tasks are visited once in topological order for each pass. Cyclical
+    relationships are detected before any dates are calculated and will
+    result in a recursion error which describes the cycle.
 
     :param work_schedule: The IfcWorkSchedule to perform the calculation on.
     :return: None
@@ -64,41 +66,37 @@ class Usecase:
         if not self.start_dates:
             return
 
-        is_cyclic = False
-        attempts = 0
-        self.pending_nodes = set(self.g.nodes)
-        max_worst_case_attempts = pow(len(self.pending_nodes), 2)
-        while self.pending_nodes:
-            attempts += 1
-            remaining_nodes = set()
-            for pending_node in self.pending_nodes:
-                if not self.forward_pass(pending_node):
-                    remaining_nodes.add(pending_node)
-            self.pending_nodes = remaining_nodes
-
-            # As we parse nodes, the remaining attempts can drop dramatically, so we recalculate the upper limit
-            max_remaining_attempts = pow(len(self.pending_nodes), 2)
-            if max_remaining_attempts < max_worst_case_attempts:
-                max_worst_case_attempts = max_remaining_attempts
-                attempts = 0
-
-            if attempts > max_worst_case_attempts:
-                is_cyclic = True
-                break  # We have an infinite loop due to a cyclic graph
-
-        if is_cyclic:
-            raise RecursionError("Task graph is cyclic and so critical path method cannot be performed.")
-
-        self.pending_nodes = set(self.g.nodes)
-        while self.pending_nodes:
-            remaining_nodes = set()
-            for pending_node in self.pending_nodes:
-                if not self.backward_pass(pending_node):
-                    remaining_nodes.add(pending_node)
-            self.pending_nodes = remaining_nodes
+        self.check_cycles()
+
+        # Date offsets are repeatedly calculated for the same dates and
+        # calendars across tasks, so they are only computed once.
+        self.offset_dates = {}
+        self.start_or_finish_dates = {}
+        self.working_days = {}
+
+        nodes = list(nx.topological_sort(self.g))
+        for node in nodes:
+            self.forward_pass(node)
+        for node in reversed(nodes):
+            self.backward_pass(node)
 
         self.update_task_times()
 
+    def check_cycles(self) -> None:
+        try:
+            cycle = nx.find_cycle(self.g)
+        except nx.NetworkXNoCycle:
+            return
+        path = " -> ".join(self.get_node_name(edge[0]) for edge in cycle)
+        path += " -> " + self.get_node_name(cycle[-1][1])
+        raise RecursionError(f"Task graph is cyclic and so critical path method cannot be performed: {path}")
+
+    def get_node_name(self, node) -> str:
+        if isinstance(node, int):
+            task = self.file.by_id(node)
+            return f"#{node}={task.Name}" if task.Name else f"#{node}"
+        return str(node)
+
     def build_network_graph(self) -> None:
         self.sequence_type_map = {
             None: "FS",
@@ -198,13 +196,37 @@ class Usecase:
             )
 
     def offset_date(self, date: datetime.datetime, days: int, node: dict) -> datetime.datetime:
-        return ifcopenshell.util.sequence.offset_date(
-            date, datetime.timedelta(days=days), node["duration_type"], node["calendar"]
-        )
+        key = (date, days, node["duration_type"], node["calendar"])
+        if (result := self.offset_dates.get(key)) is None:
+            result = self.offset_dates[key] = ifcopenshell.util.sequence.offset_date(
+                date, datetime.timedelta(days=days), node["duration_type"], node["calendar"]
+            )
+        return result
+
+    def get_start_or_finish_date(
+        self, date: datetime.datetime, node: dict, date_type: Literal["START", "FINISH"]
+    ) -> datetime.datetime:
+        key = (date, node["duration"], node["duration_type"], node["calendar"], date_type)
+        if (result := self.start_or_finish_dates.get(key)) is None:
+            result = self.start_or_finish_dates[key] = ifcopenshell.util.sequence.get_start_or_finish_date(
+                date,
+                datetime.timedelta(days=node["duration"]),
+                node["duration_type"],
+                node["calendar"],
+                date_type=date_type,
+            )
+        return result
 
-    def forward_pass(self, node) -> bool:
-        successors = self.g.successors(node)
-        predecessors = list(self.g.predecessors(node))
+    def count_working_days(self, start: datetime.datetime, finish: datetime.datetime, node: dict) -> int:
+        key = (start, finish, node["calendar"])
+        if (result := self.working_days.get(key)) is None:
+            result = self.working_days[key] = ifcopenshell.util.sequence.count_working_days(
+                start, finish, node["calendar"]
+            )
+        return result
+
+    def forward_pass(self, node) -> None:
+        predecessors = self.g.predecessors(node)
         data = self.g.nodes[node]
 
         if node == "start":
@@ -213,22 +235,14 @@ class Usecase:
             finishes = []
             starts = []
             if data.get("early_start") is not None:
-                data["early_finish"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                    data["early_start"],
-                    datetime.timedelta(days=data["duration"]),
-                    data["duration_type"],
-                    data["calendar"],
-                    date_type="FINISH",
-                )
-                return True  # we're done! We assume this task is constrained and finish processing it
+                data["early_finish"] = self.get_start_or_finish_date(data["early_start"], data, "FINISH")
+                return  # we're done! We assume this task is constrained and finish processing it
 
             for predecessor in predecessors:
                 predecessor_data = self.g.nodes[predecessor]
                 edge = self.g[predecessor][node]
                 if edge["type"] == "FS":
-                    finish = predecessor_data.get("early_finish")
-                    if finish is None:
-                        return
+                    finish = predecessor_data["early_finish"]
                     days = 0 if predecessor_data["duration"] == 0 else 1
                     if edge["lag_time"]:
                         days += edge["lag_time"]
@@ -243,27 +257,21 @@ class Usecase:
                     else:
                         starts.append(finish)
                 elif edge["type"] == "SS":
-                    start = predecessor_data.get("early_start")
-                    if start is None:
-                        return
+                    start = predecessor_data["early_start"]
                     if edge["lag_time"]:
                         starts.append(self.offset_date(start, edge["lag_time"], data))
                         starts.append(self.offset_date(start, edge["lag_time"], predecessor_data))
                     else:
                         starts.append(start)
                 elif edge["type"] == "FF":
-                    finish = predecessor_data.get("early_finish")
-                    if finish is None:
-                        return
+                    finish = predecessor_data["early_finish"]
                     if edge["lag_time"]:
                         finishes.append(self.offset_date(finish, edge["lag_time"], data))
                         finishes.append(self.offset_date(finish, edge["lag_time"], predecessor_data))
                     else:
                         finishes.append(finish)
                 elif edge["type"] == "SF":
-                    start = predecessor_data.get("early_start")
-                    if start is None:
-                        return
+                    start = predecessor_data["early_start"]
                     days = -1
                     if edge["lag_time"]:
                         days += edge["lag_time"]
@@ -282,23 +290,11 @@ class Usecase:
             if starts and finishes:
                 data["early_start"] = max(starts)
                 data["early_finish"] = max(finishes)
-                potential_finish = ifcopenshell.util.sequence.get_start_or_finish_date(
-                    data["early_start"],
-                    datetime.timedelta(days=data["duration"]),
-                    data["duration_type"],
-                    data["calendar"],
-                    date_type="FINISH",
-                )
+                potential_finish = self.get_start_or_finish_date(data["early_start"], data, "FINISH")
                 if potential_finish > data["early_finish"]:
                     data["early_finish"] = potential_finish
                 else:
-                    data["early_start"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                        data["early_finish"],
-                        datetime.timedelta(days=data["duration"]),
-                        data["duration_type"],
-                        data["calendar"],
-                        date_type="START",
-                    )
+                    data["early_start"] = self.get_start_or_finish_date(data["early_finish"], data, "START")
             elif finishes:
                 data["early_finish"] = max(finishes)
             elif starts:
@@ -307,27 +303,12 @@ class Usecase:
                 print("How did this happen?")
 
         if data.get("early_finish") is None:
-            data["early_finish"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                data["early_start"],
-                datetime.timedelta(days=data["duration"]),
-                data["duration_type"],
-                data["calendar"],
-                date_type="FINISH",
-            )
+            data["early_finish"] = self.get_start_or_finish_date(data["early_start"], data, "FINISH")
         elif data.get("early_start") is None:
-            data["early_start"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                data["early_finish"],
-                datetime.timedelta(days=data["duration"]),
-                data["duration_type"],
-                data["calendar"],
-                date_type="START",
-            )
-
-        return True
+            data["early_start"] = self.get_start_or_finish_date(data["early_finish"], data, "START")
 
-    def backward_pass(self, node) -> bool:
-        successors = list(self.g.successors(node))
-        predecessors = self.g.predecessors(node)
+    def backward_pass(self, node) -> None:
+        successors = self.g.successors(node)
         data = self.g.nodes[node]
         free_floats = []
 
@@ -340,9 +321,7 @@ class Usecase:
                 successor_data = self.g.nodes[successor]
                 edge = self.g[node][successor]
                 if edge["type"] == "FS":
-                    start = successor_data.get("late_start")
-                    if start is None:
-                        return
+                    start = successor_data["late_start"]
                     days = 1
                     if edge["lag_time"]:
                         days += edge["lag_time"]
@@ -368,9 +347,7 @@ class Usecase:
                         )
                     )
                 elif edge["type"] == "SS":
-                    start = successor_data.get("late_start")
-                    if start is None:
-                        return
+                    start = successor_data["late_start"]
                     if edge["lag_time"]:
                         starts.append(self.offset_date(start, -edge["lag_time"], data))
                         starts.append(self.offset_date(start, -edge["lag_time"], successor_data))
@@ -386,9 +363,7 @@ class Usecase:
                         )
                     )
                 elif edge["type"] == "FF":
-                    finish = successor_data.get("late_finish")
-                    if finish is None:
-                        return
+                    finish = successor_data["late_finish"]
                     if edge["lag_time"]:
                         finishes.append(self.offset_date(finish, -edge["lag_time"], data))
                         finishes.append(self.offset_date(finish, -edge["lag_time"], successor_data))
@@ -404,9 +379,7 @@ class Usecase:
                         )
                     )
                 elif edge["type"] == "SF":
-                    finish = successor_data.get("late_finish")
-                    if finish is None:
-                        return
+                    finish = successor_data["late_finish"]
                     days = 0 if successor_data["duration"] == 0 else -1
                     if edge["lag_time"]:
                         days += edge["lag_time"]
@@ -435,21 +408,9 @@ class Usecase:
                 data["late_start"] = min(starts)
                 data["late_finish"] = min(finishes)
                 if self.offset_date(data["late_start"], data["duration"], data) < data["late_finish"]:
-                    data["late_finish"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                        data["late_start"],
-                        datetime.timedelta(days=data["duration"]),
-                        data["duration_type"],
-                        data["calendar"],
-                        date_type="FINISH",
-                    )
+                    data["late_finish"] = self.get_start_or_finish_date(data["late_start"], data, "FINISH")
                 else:
-                    data["late_start"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                        data["late_finish"],
-                        datetime.timedelta(days=data["duration"]),
-                        data["duration_type"],
-                        data["calendar"],
-                        date_type="START",
-                    )
+                    data["late_start"] = self.get_start_or_finish_date(data["late_finish"], data, "START")
             elif finishes:
                 data["late_finish"] = min(finishes)
             elif starts:
@@ -458,27 +419,13 @@ class Usecase:
                 print("How did this happen?")
 
         if data.get("late_finish") is None:
-            data["late_finish"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                data["late_start"],
-                datetime.timedelta(days=data["duration"]),
-                data["duration_type"],
-                data["calendar"],
-                date_type="FINISH",
-            )
+            data["late_finish"] = self.get_start_or_finish_date(data["late_start"], data, "FINISH")
         elif data.get("late_start") is None:
-            data["late_start"] = ifcopenshell.util.sequence.get_start_or_finish_date(
-                data["late_finish"],
-                datetime.timedelta(days=data["duration"]),
-                data["duration_type"],
-                data["calendar"],
-                date_type="START",
-            )
+            data["late_start"] = self.get_start_or_finish_date(data["late_finish"], data, "START")
 
         if data["duration_type"] == "WORKTIME":
             data["total_float"] = datetime.timedelta(
-                days=ifcopenshell.util.sequence.count_working_days(
-                    data["early_finish"], data["late_finish"], data["calendar"]
-                )
+                days=self.count_working_days(data["early_finish"], data["late_finish"], data)
             )
         else:
             data["total_float"] = data["late_finish"] - data["early_finish"]
@@ -491,8 +438,6 @@ class Usecase:
         if data["free_float"] and data["free_float"].seconds == 60 * 60 * 8:
             data["free_float"] = datetime.timedelta(days=data["free_float"].days + 1)
 
-        return True
-
     def calculate_free_float(
         self,
         predecessor_date: datetime.datetime,
@@ -512,8 +457,6 @@ class Usecase:
             )
         if predecessor_data["duration_type"] == "WORKTIME":
             return datetime.timedelta(
-                days=ifcopenshell.util.sequence.count_working_days(
-                    predecessor_date, min_successor_date, predecessor_data["calendar"]
-                )
+                days=self.count_working_days(predecessor_date, min_successor_date, predecessor_data)
             )
         return min_successor_date - predecessor_date
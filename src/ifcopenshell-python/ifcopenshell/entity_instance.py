@@ -61,6 +61,15 @@ def set_unsupported_attribute(*args):
 # module.
 _method_dict = {}
 
+INVALID, FORWARD, INVERSE = range(3)
+
+# Similarly, for every schema and its entities populate
+# a table of how each attribute (including inherited and
+# inverse attributes) is accessed by name. Forward
+# attributes map to (FORWARD, index, is_derived) and
+# inverse attributes map to (INVERSE, is_non_aggregate).
+_attribute_dict: dict[str, dict[str, tuple]] = {}
+
 
 def register_schema_attributes(schema: ifcopenshell_wrapper.schema_definition) -> None:
     for decl in schema.declarations():
@@ -97,6 +106,17 @@ def register_schema_attributes(schema: ifcopenshell_wrapper.schema_definition) -
 
             _method_dict[fq_name] = functions
 
+            if isinstance(decl, ifcopenshell_wrapper.entity):
+                accessors = {}
+                for idx, attr in enumerate(decl.all_attributes()):
+                    accessors[attr.name()] = (FORWARD, idx, functions[idx] is set_derived_attribute)
+                for inv in decl.all_inverse_attributes():
+                    accessors[inv.name()] = (INVERSE, (inv.bound1(), inv.bound2()) == (-1, -1))
+            else:
+                # Simple types, such as IfcLabel, only expose their wrapped value
+                accessors = {"wrappedValue": (FORWARD, 0, False)}
+            _attribute_dict[fq_name] = accessors
+
 
 for nm in ifcopenshell_wrapper.schema_names():
     schema = ifcopenshell_wrapper.schema_by_name(nm)
@@ -181,24 +201,27 @@ class entity_instance:
         return file.from_pointer(self.wrapped_data.file_pointer())
 
     def __getattr__(self, name: str) -> Any:
-        INVALID, FORWARD, INVERSE = range(3)
-        attr_cat = self.wrapped_data.get_attribute_category(name)
+        wrapped_data = self.wrapped_data
+        fq_name = wrapped_data.is_a(True)
+        accessors = _attribute_dict.get(fq_name)
+        if accessors is None:
+            # E.g. a schema registered directly through the wrapper
+            register_schema_attributes(ifcopenshell_wrapper.schema_by_name(fq_name.split(".")[0]))
+            accessors = _attribute_dict.setdefault(fq_name, {})
+        accessor = accessors.get(name)
+
+        attr_cat = INVALID if accessor is None else accessor[0]
         if attr_cat == FORWARD:
-            idx = self.wrapped_data.get_argument_index(name)
-            if _method_dict[self.is_a(True)][idx] != set_derived_attribute:
-                # A bit ugly, but we fall through to derived attribute handling below
-                return entity_instance.wrap_value(self.wrapped_data.get_argument(idx), self.wrapped_data.file)
+            if not accessor[2]:
+                # A bit ugly, but derived attributes fall through to derived attribute handling below
+                return entity_instance.wrap_value(wrapped_data.get_argument(accessor[1]), wrapped_data.file)
         elif attr_cat == INVERSE:
-            vs = entity_instance.wrap_value(self.wrapped_data.get_inverse(name), self.wrapped_data.file)
-            if settings.unpack_non_aggregate_inverses:
-                schema_name = self.wrapped_data.is_a(True).split(".")[0]
-                ent = ifcopenshell_wrapper.schema_by_name(schema_name).declaration_by_name(self.is_a())
-                inv = [i for i in ent.all_inverse_attributes() if i.name() == name][0]
-                if (inv.bound1(), inv.bound2()) == (-1, -1):
-                    if vs:
-                        vs = vs[0]
-                    else:
-                        vs = None
+            vs = entity_instance.wrap_value(wrapped_data.get_inverse(name), wrapped_data.file)
+            if settings.unpack_non_aggregate_inverses and accessor[1]:
+                if vs:
+                    vs = vs[0]
+                else:
+                    vs = None
             return vs
 
         # derived attribute perhaps?
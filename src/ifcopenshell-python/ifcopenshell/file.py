@@ -23,9 +23,11 @@ import numbers
 import zipfile
 import functools
 import ifcopenshell
+from array import array
 from pathlib import Path
 from typing import Any
 from typing import Callable
+from typing import Container
 from typing import Generator
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -56,146 +58,300 @@ HEADER_FIELDS = {
 }
 
 
+class _InstanceRef:
+    """A journalled reference to an entity instance by its STEP id."""
+
+    __slots__ = ("id",)
+
+    def __init__(self, id: int):
+        self.id = id
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is _InstanceRef and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash((_InstanceRef, self.id))
+
+
+class _TypedValue:
+    """A journalled simple type instance, such as an IfcLabel in a select."""
+
+    __slots__ = ("type", "value")
+
+    def __init__(self, type: str, value: Any):
+        self.type = type
+        self.value = value
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is _TypedValue and other.type == self.type and other.value == self.value
+
+    def __hash__(self) -> int:
+        return hash((_TypedValue, self.type, self.value))
+
+
+class _Unset:
+    """Marks an attribute value which could not be read when journalled."""
+
+    __slots__ = ()
+
+
+_UNSET = _Unset()
+
+# Reserved value references in the journal value table
+_UNSET_REF, _NONE_REF = 0, 1
+
+
 class Transaction:
+    """Records changes to a file so they may be rolled back or replayed.
+
+    Operations are stored in a compact columnar journal rather than as a dict
+    per operation. Each operation is a row across a set of typed arrays, and
+    attribute values are stored as references into a table of interned values.
+    Entity references are stored by their STEP id, so snapshots of deleted
+    elements and their inverses are cheap even for very large operations.
+
+    The columns of an operation row are interpreted per operation type:
+
+    - ``CREATE`` and ``DELETE``: ``args`` is the class name value reference,
+      and ``olds`` to ``news`` is the slice of ``attribute_values`` holding
+      the value references of every attribute, by attribute index.
+    - ``EDIT``: ``args`` is the attribute index, and ``olds`` and ``news`` are
+      the value references of the previous and new attribute values.
+    - ``DELETE`` and ``BATCH_DELETE``: ``inverse_starts`` to ``inverse_ends``
+      is the slice of inverse records (an inverse id, attribute index, and
+      value reference) to restore on rollback.
+
+    When deleting in a batch, inverses are not captured per deletion. They are
+    captured once when the batch ends (before the file processes the
+    deletions), skipping inverses which are themselves deleted in the batch.
+    """
+
+    CREATE, EDIT, DELETE, BATCH_DELETE = range(4)
+
     def __init__(self, ifc_file: file):
         self.file: file = ifc_file
-        self.operations = []
+
+        # Operation columns
+        self.ops = array("b")
+        self.ids = array("q")
+        self.args = array("q")
+        self.olds = array("q")
+        self.news = array("q")
+        self.inverse_starts = array("q")
+        self.inverse_ends = array("q")
+
+        # Attribute snapshots of created and deleted elements
+        self.attribute_values = array("q")
+
+        # Inverse snapshots of deleted elements
+        self.inverse_ids = array("q")
+        self.inverse_indices = array("q")
+        self.inverse_values = array("q")
+
+        # Interned values
+        self.values: list[Any] = [_UNSET, None]
+        self.value_refs: dict[tuple[type, Any], int] = {(type(None), None): _NONE_REF}
+
         self.is_batched = False
         self.batch_delete_index = 0
-        self.batch_delete_ids = set()
-        self.batch_inverses = []
-
-    def serialise_entity_instance(self, element: ifcopenshell.entity_instance) -> dict[str, Any]:
-        info = element.get_info()
-        for key, value in info.items():
-            info[key] = self.serialise_value(element, value)
-        return info
-
-    def serialise_value(self, element, value):
-        return element.walk(
-            lambda v: isinstance(v, entity_instance),
-            lambda v: {"id": v.id()} if v.id() else {"type": v.is_a(), "value": v.wrappedValue},
-            value,
-        )
-
-    def unserialise_value(self, element, value):
-        return element.walk(
-            lambda v: isinstance(v, dict),
-            lambda v: self.file.by_id(v["id"]) if v.get("id") else self.file.create_entity(v["type"], v["value"]),
-            value,
-        )
+        self.batch_delete_ids: dict[int, None] = {}
+
+    def serialise_value(self, value: Any) -> Any:
+        if isinstance(value, entity_instance):
+            if value.id():
+                return _InstanceRef(value.id())
+            return _TypedValue(value.is_a(), value.wrappedValue)
+        elif isinstance(value, (tuple, list)):
+            return tuple(map(self.serialise_value, value))
+        return value
+
+    def unserialise_value(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type is tuple:
+            return tuple(map(self.unserialise_value, value))
+        elif value_type is _InstanceRef:
+            return self.file.by_id(value.id)
+        elif value_type is _TypedValue:
+            return self.file.create_entity(value.type, value.value)
+        return value
+
+    def store_value(self, value: Any) -> int:
+        """Interns a value and returns its reference in the value table."""
+        value = self.serialise_value(value)
+        if type(value) is tuple:
+            # Aggregates are rarely repeated and may be huge (e.g. coordinate
+            # lists), so don't keep a second copy around as a lookup key.
+            self.values.append(value)
+            return len(self.values) - 1
+        # Key by type so that e.g. True, 1, and 1.0 are distinguished.
+        key = (type(value), value)
+        try:
+            ref = self.value_refs.get(key)
+        except TypeError:  # Unhashable
+            self.values.append(value)
+            return len(self.values) - 1
+        if ref is None:
+            ref = self.value_refs[key] = len(self.values)
+            self.values.append(value)
+        return ref
+
+    def store_attributes(self, element: ifcopenshell.entity_instance) -> tuple[int, int]:
+        start = len(self.attribute_values)
+        for i in range(len(element)):
+            try:
+                self.attribute_values.append(self.store_value(element[i]))
+            except:
+                self.attribute_values.append(_UNSET_REF)
+        return start, len(self.attribute_values)
+
+    def store_operation(
+        self, op: int, id: int, arg: int, old: int, new: int, inverse_start: int = 0, inverse_end: int = 0
+    ) -> None:
+        self.ops.append(op)
+        self.ids.append(id)
+        self.args.append(arg)
+        self.olds.append(old)
+        self.news.append(new)
+        self.inverse_starts.append(inverse_start)
+        self.inverse_ends.append(inverse_end)
 
     def batch(self) -> None:
         self.is_batched = True
-        self.batch_delete_index = len(self.operations)
-        self.batch_delete_ids = set()
-        self.batch_inverses = []
+        self.batch_delete_index = len(self.ops)
+        self.batch_delete_ids = {}
 
     def unbatch(self) -> None:
-        for inverses in self.batch_inverses:
-            if inverses:
-                self.operations.insert(self.batch_delete_index, {"action": "batch_delete", "inverses": inverses})
+        inverse_start = len(self.inverse_ids)
+        # Inverses are still intact, as the file only processes batched deletions after this.
+        stored = set()
+        for element_id in self.batch_delete_ids:
+            self.store_element_inverses(self.file.by_id(element_id), skip=self.batch_delete_ids, stored=stored)
+        if len(self.inverse_ids) > inverse_start:
+            i = self.batch_delete_index
+            self.ops.insert(i, self.BATCH_DELETE)
+            self.ids.insert(i, 0)
+            self.args.insert(i, -1)
+            self.olds.insert(i, 0)
+            self.news.insert(i, 0)
+            self.inverse_starts.insert(i, inverse_start)
+            self.inverse_ends.insert(i, len(self.inverse_ids))
         self.is_batched = False
         self.batch_delete_index = 0
-        self.batch_delete_ids = set()
-        self.batch_inverses = []
+        self.batch_delete_ids = {}
 
     def store_create(self, element: ifcopenshell.entity_instance) -> None:
         if element.id():
-            self.operations.append({"action": "create", "value": self.serialise_entity_instance(element)})
+            start, end = self.store_attributes(element)
+            self.store_operation(self.CREATE, element.id(), self.store_value(element.is_a()), start, end)
 
     def store_edit(self, element: ifcopenshell.entity_instance, index: int, value: Any) -> None:
         if element.id():
-            self.operations.append(
-                {
-                    "action": "edit",
-                    "id": element.id(),
-                    "index": index,
-                    "old": self.serialise_value(element, element[index]),
-                    "new": self.serialise_value(element, value),
-                }
+            self.store_operation(
+                self.EDIT, element.id(), index, self.store_value(element[index]), self.store_value(value)
             )
 
     def store_delete(self, element: ifcopenshell.entity_instance) -> None:
-        inverses = {}
+        inverse_start = inverse_end = len(self.inverse_ids)
         if self.is_batched:
-            if element.id() not in self.batch_delete_ids:
-                self.batch_inverses.append(self.get_element_inverses(element))
-            self.batch_delete_ids.add(element.id())
+            self.batch_delete_ids[element.id()] = None
         else:
-            inverses = self.get_element_inverses(element)
-        self.operations.append(
-            {"action": "delete", "inverses": inverses, "value": self.serialise_entity_instance(element)}
+            self.store_element_inverses(element)
+            inverse_end = len(self.inverse_ids)
+        start, end = self.store_attributes(element)
+        self.store_operation(
+            self.DELETE, element.id(), self.store_value(element.is_a()), start, end, inverse_start, inverse_end
         )
 
-    def get_element_inverses(self, element):
-        inverses = {}
-        for inverse in self.file.get_inverse(element):
-            inverse_references = []
-            for i, attribute in enumerate(inverse):
-                if self.has_element_reference(attribute, element):
-                    inverse_references.append((i, self.serialise_value(inverse, attribute)))
-            inverses[inverse.id()] = inverse_references
-        return inverses
-
-    def has_element_reference(self, value: Any, element: ifcopenshell.entity_instance) -> bool:
-        if isinstance(value, (tuple, list)):
-            for v in value:
-                if self.has_element_reference(v, element):
-                    return True
-            return False
-        return value == element
+    def store_element_inverses(
+        self,
+        element: ifcopenshell.entity_instance,
+        skip: Container[int] = (),
+        stored: Optional[set[tuple[int, int]]] = None,
+    ) -> None:
+        """Stores the attribute values of inverses which reference an element.
+
+        :param element: The element which is about to be deleted.
+        :param skip: IDs of inverses to ignore, such as those also being
+            deleted, whose attributes are already stored with their deletion.
+        :param stored: (inverse ID, attribute index) pairs already stored,
+            which is updated with newly stored pairs.
+        """
+        if stored is None:
+            stored = set()
+        for inverse, index in self.file.get_inverse(element, allow_duplicate=True, with_attribute_indices=True):
+            inverse_id = inverse.id()
+            if inverse_id in skip or (inverse_id, index) in stored:
+                continue
+            stored.add((inverse_id, index))
+            self.inverse_ids.append(inverse_id)
+            self.inverse_indices.append(index)
+            self.inverse_values.append(self.store_value(inverse[index]))
+
+    def restore_attributes(self, element: ifcopenshell.entity_instance, start: int, end: int) -> None:
+        for index, ref in enumerate(self.attribute_values[start:end]):
+            if ref in (_UNSET_REF, _NONE_REF):
+                # Attributes of a newly created element are already null
+                continue
+            try:
+                element[index] = self.unserialise_value(self.values[ref])
+            except:
+                # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
+                pass
+
+    def restore_inverses(self, start: int, end: int) -> None:
+        for i in range(start, end):
+            inverse = self.file.by_id(self.inverse_ids[i])
+            inverse[self.inverse_indices[i]] = self.unserialise_value(self.values[self.inverse_values[i]])
 
     def rollback(self) -> None:
-        for operation in self.operations[::-1]:
-            if operation["action"] == "create":
-                element = self.file.by_id(operation["value"]["id"])
+        i = len(self.ops) - 1
+        while i >= 0:
+            op = self.ops[i]
+            if op == self.DELETE:
+                # Restore consecutive deletions together, so that deleted
+                # elements referencing each other are relinked regardless of
+                # the order in which they were deleted.
+                start = i
+                while start > 0 and self.ops[start - 1] == self.DELETE:
+                    start -= 1
+                deletions = range(i, start - 1, -1)
+                elements = [self.file.create_entity(self.values[self.args[j]], id=self.ids[j]) for j in deletions]
+                for j, element in zip(deletions, elements):
+                    self.restore_attributes(element, self.olds[j], self.news[j])
+                for j in deletions:
+                    self.restore_inverses(self.inverse_starts[j], self.inverse_ends[j])
+                i = start - 1
+                continue
+            elif op == self.CREATE:
+                element = self.file.by_id(self.ids[i])
                 if hasattr(element, "GlobalId") and element.GlobalId is None:
                     # hack, otherwise ifcopenshell gets upset
                     element.GlobalId = "x"
                 self.file.remove(element)
-            elif operation["action"] == "edit":
-                element = self.file.by_id(operation["id"])
+            elif op == self.EDIT:
+                element = self.file.by_id(self.ids[i])
                 try:
-                    element[operation["index"]] = self.unserialise_value(element, operation["old"])
+                    element[self.args[i]] = self.unserialise_value(self.values[self.olds[i]])
                 except:
                     # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
                     pass
-            elif operation["action"] == "delete":
-                e = self.file.create_entity(operation["value"]["type"], id=operation["value"]["id"])
-                for k, v in operation["value"].items():
-                    try:
-                        setattr(e, k, self.unserialise_value(e, v))
-                    except:
-                        # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
-                        pass
-                for inverse_id, data in operation["inverses"].items():
-                    inverse = self.file.by_id(inverse_id)
-                    for index, value in data:
-                        inverse[index] = self.unserialise_value(inverse, value)
-            elif operation["action"] == "batch_delete":
-                for inverse_id, data in operation["inverses"].items():
-                    inverse = self.file.by_id(inverse_id)
-                    for index, value in data:
-                        inverse[index] = self.unserialise_value(inverse, value)
+            elif op == self.BATCH_DELETE:
+                self.restore_inverses(self.inverse_starts[i], self.inverse_ends[i])
+            i -= 1
 
     def commit(self) -> None:
-        for operation in self.operations:
-            if operation["action"] == "create":
-                e = self.file.create_entity(operation["value"]["type"], id=operation["value"]["id"])
-                for k, v in operation["value"].items():
-                    try:
-                        setattr(e, k, self.unserialise_value(e, v))
-                    except:
-                        # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
-                        pass
-            elif operation["action"] == "edit":
-                element = self.file.by_id(operation["id"])
-                element[operation["index"]] = self.unserialise_value(element, operation["new"])
-            elif operation["action"] == "delete":
-                element = self.file.by_id(operation["value"]["id"])
+        for i in range(len(self.ops)):
+            op = self.ops[i]
+            if op == self.CREATE:
+                e = self.file.create_entity(self.values[self.args[i]], id=self.ids[i])
+                self.restore_attributes(e, self.olds[i], self.news[i])
+            elif op == self.EDIT:
+                element = self.file.by_id(self.ids[i])
+                element[self.args[i]] = self.unserialise_value(self.values[self.news[i]])
+            elif op == self.DELETE:
+                element = self.file.by_id(self.ids[i])
                 self.file.remove(element)
-            elif operation["action"] == "batch_delete":
+            elif op == self.BATCH_DELETE:
                 pass
 
 
@@ -29,6 +29,7 @@ from ..entity_instance import entity_instance
 from . import has_occ
 
 from typing import TypeVar, Union, Optional, Generator, Any, Literal, overload, TYPE_CHECKING, Iterable, cast
+from typing import NamedTuple
 
 if TYPE_CHECKING:
     from OCC.Core import TopoDS
@@ -42,6 +43,17 @@ ShapeElementType = Union[
 ShapeType = Union[ifcopenshell_wrapper.BRep, ifcopenshell_wrapper.Triangulation, ifcopenshell_wrapper.Serialization]
 
 
+class InstanceRecord(NamedTuple):
+    """An instance of a geometry placed by a product, see iterator.iter_instances"""
+
+    #: The ID of the product.
+    id: int
+    #: The ID of the geometry, which is yielded before its first instance.
+    geometry_id: str
+    #: The 4x4 column major matrix of the instance as doubles, see ifcopenshell.util.shape.get_shape_matrix.
+    transformation_buffer: bytes
+
+
 def wrap_shape_creation(settings, shape):
     return shape
 
@@ -291,6 +303,41 @@ class iterator(ifcopenshell_wrapper.Iterator):
                 if not self.next():
                     break
 
+    def iter_instances(self) -> Generator[Union[ShapeType, InstanceRecord], None, None]:
+        """Iterates over unique geometries and the products which instance them
+
+        Many products often share a single geometry, such as when an
+        IfcMappedItem is used for thousands of windows. Instead of a shape per
+        product, this yields each unique geometry once, followed by a
+        lightweight :class:`InstanceRecord` for every product placing it.
+        Geometries always precede their first instance, so consumers can store
+        a geometry when it is yielded, and then only handle the product ID,
+        geometry ID, and matrix of each instance, without touching the geometry
+        buffers again.
+
+        This is not supported when using Python OpenCASCADE shapes.
+
+        Example:
+
+        .. code:: python
+
+            iterator = ifcopenshell.geom.iterator(settings, model, multiprocessing.cpu_count())
+            for item in iterator.iter_instances():
+                if isinstance(item, ifcopenshell.geom.InstanceRecord):
+                    matrix = ifcopenshell.util.shape.get_shape_matrix(item)
+                    print(item.id, item.geometry_id, matrix)
+                else:
+                    verts = ifcopenshell.util.shape.get_vertices(item)
+        """
+        geometry_ids = set()
+        for shape in self:
+            geometry = shape.geometry
+            geometry_id = geometry.id
+            if geometry_id not in geometry_ids:
+                geometry_ids.add(geometry_id)
+                yield geometry
+            yield InstanceRecord(shape.id, geometry_id, shape.transformation_buffer)
+
 
 class tree(ifcopenshell_wrapper.tree):
     def __init__(self, file: Optional[file] = None, settings: Optional[settings] = None):
@@ -47,12 +47,22 @@ cf. <https://technical.buildingsmart.org/resources/ifcimplementationguidance/ifc
 # IMPORTS
 # ----------------------------------------------------------------
 
+from __future__ import annotations
 from base64 import b64encode
 from base64 import b64decode
+from binascii import a2b_base64
+from binascii import b2a_base64
+from os import urandom
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Union
 from uuid import uuid4
 import re
 import string
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # ----------------------------------------------------------------
 # EXPORTS
 # ----------------------------------------------------------------
@@ -62,6 +72,10 @@ __all__ = [
     "expand",
     "split",
     "new",
+    "new_many",
+    "compress_many",
+    "expand_many",
+    "validate_many",
 ]
 
 # ----------------------------------------------------------------
@@ -77,6 +91,8 @@ _CHARS64_IFC = string.digits + string.ascii_uppercase + string.ascii_lowercase +
 # translators
 _TRANS_IFC_TO_STD = str.maketrans(_CHARS64_IFC, _CHARS64_STD)
 _TRANS_STD_TO_IFC = str.maketrans(_CHARS64_STD, _CHARS64_IFC)
+_BYTES_IFC_TO_STD = bytes.maketrans(_CHARS64_IFC.encode(), _CHARS64_STD.encode())
+_BYTES_STD_TO_IFC = bytes.maketrans(_CHARS64_STD.encode(), _CHARS64_IFC.encode())
 
 # ----------------------------------------------------------------
 # METHODS
@@ -89,6 +105,16 @@ def compress(uuid: str, /) -> str:
 
     See <https://technical.buildingsmart.org/resources/ifcimplementationguidance/ifc-guid>
     """
+    # fast path for 32 hex digits without separators
+    if len(uuid) == 32:
+        try:
+            uuid_bytes = bytes.fromhex(uuid)
+        except ValueError:
+            pass
+        else:
+            if len(uuid_bytes) == 16:
+                return _compress_bytes(uuid_bytes)
+
     # remove possible separators
     uuid = uuid.lower()
     uuid = re.sub(pattern=r"\W", repl="", string=uuid)
@@ -115,6 +141,10 @@ def expand(guid: str, /) -> str:
 
     See <https://technical.buildingsmart.org/resources/ifcimplementationguidance/ifc-guid>
     """
+    # fast path for 22 ASCII characters
+    if len(guid) == 22 and guid.isascii():
+        return a2b_base64(b"AA" + guid.encode().translate(_BYTES_IFC_TO_STD))[2:].hex()
+
     # translate from ifc-convention to standard-convention
     guid = guid.translate(_TRANS_IFC_TO_STD)
 
@@ -152,6 +182,140 @@ def new() -> str:
     """
     Generates a random UUID and compresses it to a Base 64 IFC GUID.
     """
-    uuid = uuid4().hex
-    guid = compress(uuid)
-    return guid
+    return _compress_bytes(uuid4().bytes)
+
+
+def _compress_bytes(uuid_bytes: bytes) -> str:
+    # pad with two zero bytes, so that the first byte is isolated in the first two digits
+    return b2a_base64(b"\0\0" + uuid_bytes, newline=False)[2:].translate(_BYTES_STD_TO_IFC).decode()
+
+
+# ----------------------------------------------------------------
+# BATCH METHODS
+# ----------------------------------------------------------------
+
+
+# built on first use, so that numpy is only imported by batch methods
+_LOOKUP_TABLES = None
+
+
+def _get_lookup_tables() -> tuple[np.ndarray, np.ndarray]:
+    global _LOOKUP_TABLES
+    if _LOOKUP_TABLES is None:
+        import numpy as np
+
+        chars = np.frombuffer(_CHARS64_IFC.encode(), dtype=np.uint8)
+        # maps a character to its value, or 64 if it isn't a valid digit
+        values = np.full(256, 64, dtype=np.uint8)
+        values[chars] = np.arange(64, dtype=np.uint8)
+        _LOOKUP_TABLES = chars, values
+    return _LOOKUP_TABLES
+
+
+def new_many(n: int, /) -> list[str]:
+    """
+    Generates many random UUIDs (version 4) and compresses them to Base 64 IFC GUIDs.
+    """
+    import numpy as np
+
+    uuids = np.frombuffer(urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    # set the version and variant bits, as uuid4 does
+    uuids[:, 6] = (uuids[:, 6] & 0x0F) | 0x40
+    uuids[:, 8] = (uuids[:, 8] & 0x3F) | 0x80
+    return compress_many(uuids)
+
+
+def compress_many(uuids: Union[np.ndarray, bytes, Iterable[bytes]], /) -> list[str]:
+    """
+    Compresses many UUIDs to base64-encoded GUIDs in IFC-format.
+
+    The UUIDs are given as raw bytes rather than hex, either as an array of
+    shape (n, 16) of uint8, 16 * n concatenated bytes, or an iterable of
+    16 bytes each (e.g. `uuid.UUID.bytes`).
+    """
+    import numpy as np
+
+    if not isinstance(uuids, np.ndarray):
+        uuids = np.frombuffer(uuids if isinstance(uuids, bytes) else b"".join(uuids), dtype=np.uint8)
+    uuids = uuids.astype(np.uint8, copy=False).reshape(-1, 16)
+    n = len(uuids)
+    if not n:
+        return []
+
+    # pad with two zero bytes, then split each 3 bytes into 4 digits of 6 bits
+    padded = np.zeros((n, 18), dtype=np.uint8)
+    padded[:, 2:] = uuids
+    b0, b1, b2 = padded[:, 0::3], padded[:, 1::3], padded[:, 2::3]
+    digits = np.empty((n, 6, 4), dtype=np.uint8)
+    digits[:, :, 0] = b0 >> 2
+    digits[:, :, 1] = ((b0 & 0x03) << 4) | (b1 >> 4)
+    digits[:, :, 2] = ((b1 & 0x0F) << 2) | (b2 >> 6)
+    digits[:, :, 3] = b2 & 0x3F
+
+    # remove result of padding
+    digits = digits.reshape(n, 24)[:, 2:]
+
+    chars, _ = _get_lookup_tables()
+    encoded = chars[digits].tobytes().decode()
+    return [encoded[i : i + 22] for i in range(0, 22 * n, 22)]
+
+
+def _decode_many(guids: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    guids = guids if isinstance(guids, (list, tuple)) else list(guids)
+    lengths = np.fromiter(map(len, guids), dtype=np.int64, count=len(guids))
+    joined = "".join(guids)
+    if (lengths == 22).all() and joined.isascii():
+        encoded = joined.encode()
+    else:
+        # invalid GUIDs are replaced with invalid digits
+        encoded = b"".join(
+            guid.encode("ascii") if len(guid) == 22 and guid.isascii() else b"\xff" * 22 for guid in guids
+        )
+    _, values = _get_lookup_tables()
+    digits = values[np.frombuffer(encoded, dtype=np.uint8).reshape(len(guids), 22)]
+    return digits, (digits < 64).all(axis=1)
+
+
+def expand_many(guids: Iterable[str], /) -> list[str]:
+    """
+    Converts many base64-encoded GUIDs in IFC-format to hex-encoded UUIDs.
+
+    Raises a ValueError if any GUID is not 22 base 64 digits.
+    """
+    import numpy as np
+
+    digits, is_valid = _decode_many(guids)
+    if not is_valid.all():
+        raise ValueError(f"Invalid GUID at index {int(np.argmin(is_valid))}")
+    n = len(digits)
+    if not n:
+        return []
+
+    # pad with two zero digits, then join each 4 digits of 6 bits into 3 bytes
+    padded = np.zeros((n, 24), dtype=np.uint8)
+    padded[:, 2:] = digits
+    d0, d1, d2, d3 = padded[:, 0::4], padded[:, 1::4], padded[:, 2::4], padded[:, 3::4]
+    uuid_bytes = np.empty((n, 6, 3), dtype=np.uint8)
+    uuid_bytes[:, :, 0] = (d0 << 2) | (d1 >> 4)
+    uuid_bytes[:, :, 1] = (d1 << 4) | (d2 >> 2)
+    uuid_bytes[:, :, 2] = (d2 << 6) | d3
+
+    # remove result of padding
+    uuids = uuid_bytes.reshape(n, 18)[:, 2:].tobytes().hex()
+    return [uuids[i : i + 32] for i in range(0, 32 * n, 32)]
+
+
+def validate_many(guids: Iterable[str], /) -> np.ndarray:
+    """
+    Checks whether each of many GUIDs is a valid base64-encoded GUID in IFC-format.
+
+    A valid GUID has 22 base 64 digits, the first of which is 0, 1, 2, or 3.
+
+    Returns an array of booleans.
+    """
+    digits, is_valid = _decode_many(guids)
+    if not len(digits):
+        return is_valid
+    return is_valid & (digits[:, 0] < 4)
@@ -0,0 +1,177 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Thomas Krijnen <thomas@aecgeeks.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Caches opened models, so that they may be reused across tools
+
+Long running services and tools which federate models (such as clash
+detection, diffing, or merging) often open the same models repeatedly. A
+:class:`ModelCache` keeps recently opened models in memory, and reopens a
+model only when its file has changed on disk.
+
+Models in a cache are shared by everyone using the cache, so they should be
+treated as read only. Copy a model if you need to edit it.
+
+Example:
+
+.. code:: python
+
+    import ifcopenshell.model_cache
+
+    # Use the process wide cache, which anyone in the process may share
+    model = ifcopenshell.model_cache.default_cache.open("/path/to/model.ifc")
+
+    # Or create your own, limited to roughly 500MB of IFC files
+    cache = ifcopenshell.model_cache.ModelCache(max_bytes=500 * 1024 * 1024)
+    models = cache.open_many(["/path/to/a.ifc", "/path/to/b.ifc"], workers=2)
+"""
+
+from __future__ import annotations
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+import ifcopenshell
+
+
+class CachedModel(NamedTuple):
+    mtime: int
+    size: int
+    model: Union[ifcopenshell.file, ifcopenshell.sqlite]
+
+
+class ModelCache:
+    """A least recently used cache of opened models, keyed by filepath
+
+    Models are reopened if the modification time or size of their file has
+    changed. The memory budget is measured using the size of the files on
+    disk, as the memory used by a model is roughly proportional to it. When
+    the budget is exceeded, the least recently used models are dropped from
+    the cache. A model larger than the whole budget is opened but not cached.
+
+    The cache is thread safe.
+    """
+
+    def __init__(self, max_bytes: int = 1024 * 1024 * 1024, max_models: Optional[int] = None):
+        """
+        :param max_bytes: The total size of the files of cached models.
+        :param max_models: The maximum number of cached models, if any.
+        """
+        self.max_bytes = max_bytes
+        self.max_models = max_models
+        self.models: OrderedDict[str, CachedModel] = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def __contains__(self, path: Union[os.PathLike, str]) -> bool:
+        return self.get(path) is not None
+
+    def get(self, path: Union[os.PathLike, str]) -> Union[ifcopenshell.file, ifcopenshell.sqlite, None]:
+        """Gets a cached model, if it is cached and its file is unchanged
+
+        :param path: The filepath of the model.
+        :return: The cached model, or None.
+        """
+        key, mtime, size = self.get_key(path)
+        with self.lock:
+            cached = self.models.get(key)
+            if cached is None:
+                return None
+            if cached.mtime != mtime or cached.size != size:
+                self.size -= self.models.pop(key).size
+                return None
+            self.models.move_to_end(key)
+            return cached.model
+
+    def open(
+        self, path: Union[os.PathLike, str], format: Optional[str] = None
+    ) -> Union[ifcopenshell.file, ifcopenshell.sqlite]:
+        """Opens a model, or reuses it if it is cached and its file is unchanged
+
+        :param path: The filepath of the model.
+        :param format: The format of the model, see :func:`ifcopenshell.open`.
+        :return: The model.
+        """
+        if (model := self.get(path)) is not None:
+            return model
+        model = ifcopenshell.open(path, format)
+        self.add(path, model)
+        return model
+
+    def open_many(
+        self, paths: list[Union[os.PathLike, str]], format: Optional[str] = None, workers: Optional[int] = None
+    ) -> list[Union[ifcopenshell.file, ifcopenshell.sqlite]]:
+        """Opens many models, concurrently opening those which aren't cached
+
+        :param paths: The filepaths of the models.
+        :param format: The format of the models, see :func:`ifcopenshell.open`.
+        :param workers: The maximum number of models to open concurrently.
+        :return: The models, in the same order as the filepaths.
+        """
+        models = [self.get(path) for path in paths]
+        missing = list({self.get_key(path)[0]: path for path, model in zip(paths, models) if model is None}.values())
+        opened = {}
+        for path, model in zip(missing, ifcopenshell.open_many(missing, format, workers=workers)):
+            opened[self.get_key(path)[0]] = model
+            self.add(path, model)
+        return [model if model is not None else opened[self.get_key(path)[0]] for path, model in zip(paths, models)]
+
+    def add(self, path: Union[os.PathLike, str], model: Union[ifcopenshell.file, ifcopenshell.sqlite]) -> None:
+        """Adds an opened model to the cache
+
+        :param path: The filepath the model was opened from.
+        :param model: The model.
+        """
+        key, mtime, size = self.get_key(path)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if (previous := self.models.pop(key, None)) is not None:
+                self.size -= previous.size
+            self.models[key] = CachedModel(mtime, size, model)
+            self.size += size
+            while self.size > self.max_bytes or (self.max_models is not None and len(self.models) > self.max_models):
+                self.size -= self.models.popitem(last=False)[1].size
+
+    def remove(self, path: Union[os.PathLike, str]) -> None:
+        """Removes a model from the cache, if it is cached
+
+        :param path: The filepath of the model.
+        """
+        key = str(Path(path).resolve())
+        with self.lock:
+            if (cached := self.models.pop(key, None)) is not None:
+                self.size -= cached.size
+
+    def clear(self) -> None:
+        """Removes all models from the cache"""
+        with self.lock:
+            self.models.clear()
+            self.size = 0
+
+    def get_key(self, path: Union[os.PathLike, str]) -> tuple[str, int, int]:
+        path = Path(path).resolve()
+        stat = path.stat()
+        return str(path), stat.st_mtime_ns, stat.st_size
+
+
+#: A process wide cache, which tools may share
+default_cache = ModelCache()
@@ -22,13 +22,15 @@ import ifcopenshell
 import ifcopenshell.util.attribute
 import ifcopenshell.util.schema
 from pathlib import Path
-from typing import Any, NoReturn, Union, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, NoReturn, Union, Optional, TYPE_CHECKING
 from . import ifcopenshell_wrapper
 from .file import file
 from .entity_instance import entity_instance
 
 if TYPE_CHECKING:
     import sqlite3
+    import numpy as np
 
 try:
     import sqlite3
@@ -38,8 +40,15 @@ except ImportError as e:
 
 class sqlite(file):
     schema: ifcopenshell.util.schema.IFC_SCHEMA = "IFC4"
-
-    def __init__(self, filepath: str):
+    geometry_query = (
+        "SELECT shape.ifc_id, x, y, z, matrix, geometry, verts, edges, faces, material_ids, materials "
+        "FROM shape LEFT JOIN geometry ON shape.geometry = geometry.id"
+    )
+    geometry_chunk_size = 10000
+    # SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds.
+    prefetch_chunk_size = 900
+
+    def __init__(self, filepath: str, entity_cache_size: Optional[int] = None, cached_statements: int = 256):
         """
         Open existing sqlite IFC database.
 
@@ -48,6 +57,12 @@ class sqlite(file):
         https://docs.ifcopenshell.org/autoapi/ifcpatch/recipes/Ifc2Sql/index.html
 
         :param filepath: Path to sqlite database.
+        :param entity_cache_size: Maximum number of entities kept in the
+            entity cache, evicting the least recently used ones. If None, the
+            cache is unbounded.
+        :param cached_statements: Number of prepared statements kept by the
+            sqlite3 connection. All per-entity queries are parametrised, so
+            they are prepared once per IFC class and then reused.
         """
 
         if not Path(filepath).exists():
@@ -60,7 +75,7 @@ class sqlite(file):
         self.transaction = None
 
         self.filepath = filepath
-        self.db = sqlite3.connect(self.filepath)
+        self.db = sqlite3.connect(self.filepath, cached_statements=cached_statements)
         self.db.row_factory = sqlite3.Row
 
         # import mysql.connector
@@ -87,7 +102,9 @@ class sqlite(file):
         self.cursor.execute("SELECT ifc_id, ifc_class FROM id_map")
         self.id_map: dict[int, str] = {}
         self.class_map: dict[str, list[int]] = {}
-        self.entity_cache: dict[int, sqlite_entity] = {}
+        self.entity_cache_size = entity_cache_size
+        self.entity_cache: OrderedDict[int, sqlite_entity] = OrderedDict()
+        self.queries: dict[tuple[str, str], str] = {}
         for row in self.cursor.fetchall():
             ifc_id, ifc_class = row
             self.id_map[ifc_id] = ifc_class
@@ -139,7 +156,69 @@ class sqlite(file):
             self.ifc_class_references[declaration.name()] = {"entity": entity, "entity_list": entity_list}
 
     def clear_cache(self) -> None:
-        self.entity_cache = {}
+        self.entity_cache = OrderedDict()
+
+    def get_query(self, query_type: str, ifc_class: str) -> str:
+        """Get a parametrised query for an IFC class.
+
+        Query strings are built once per class so that the sqlite3 statement
+        cache can reuse the prepared statement.
+
+        :param query_type: Either ``attributes`` or ``inverses``.
+        :param ifc_class: The IFC class (i.e. table name) to query.
+        """
+        key = (query_type, ifc_class)
+        query = self.queries.get(key)
+        if query is None:
+            if query_type == "attributes":
+                query = f"SELECT * FROM `{ifc_class}` WHERE `ifc_id` = ? LIMIT 1"
+            elif query_type == "inverses":
+                query = f"SELECT inverses FROM `{ifc_class}` WHERE `ifc_id` = ? LIMIT 1"
+            else:
+                raise ValueError(f"Unknown query type: {query_type}")
+            self.queries[key] = query
+        return query
+
+    def cache_entity(self, entity: sqlite_entity) -> None:
+        self.entity_cache[entity.sqlite_wrapper.id] = entity
+        if self.entity_cache_size is not None and len(self.entity_cache) > self.entity_cache_size:
+            self.entity_cache.popitem(last=False)
+
+    def prefetch(self, entities: Iterable[sqlite_entity], inverses: bool = False) -> None:
+        """Load attributes for many entities using batched queries.
+
+        Entities are grouped by class and their rows are fetched with a single
+        ``WHERE ifc_id IN (...)`` query per class (and chunk), filling each
+        entity's attribute cache. Entities that are already loaded are skipped.
+
+        :param entities: Entities to prefetch.
+        :param inverses: Whether to also prefetch the inverse references used
+            by inverse attributes and :meth:`get_inverse`.
+        """
+        by_class: dict[str, dict[int, sqlite_wrapper]] = {}
+        for entity in entities:
+            wrapper = entity.sqlite_wrapper
+            if not wrapper.attribute_cache or (inverses and wrapper.inverse_ids is None):
+                by_class.setdefault(wrapper.ifc_class, {})[wrapper.id] = wrapper
+
+        for ifc_class, wrappers in by_class.items():
+            ids = list(wrappers.keys())
+            for i in range(0, len(ids), self.prefetch_chunk_size):
+                chunk = ids[i : i + self.prefetch_chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self.db.execute(f"SELECT * FROM `{ifc_class}` WHERE `ifc_id` IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    wrapper = wrappers.pop(row["ifc_id"])
+                    if not wrapper.attribute_cache:
+                        wrapper.load_attributes(row)
+                    if inverses and wrapper.inverse_ids is None:
+                        wrapper.load_inverses(row)
+            # Rows that don't exist are cached as null so we don't query again.
+            for wrapper in wrappers.values():
+                if not wrapper.attribute_cache:
+                    wrapper.load_attributes(None)
+                if inverses and wrapper.inverse_ids is None:
+                    wrapper.inverse_ids = []
 
     def create_entity(self, type, *args, **kawrgs) -> NoReturn:
         """Not supported for sqlite database."""
@@ -148,11 +227,13 @@ class sqlite(file):
     def by_id(self, id: int) -> Union[sqlite_entity, None]:
         entity = self.entity_cache.get(id, None)
         if entity:
+            if self.entity_cache_size is not None:
+                self.entity_cache.move_to_end(id)
             return entity
         ifc_class = self.id_map.get(id, None)
         if ifc_class:
             entity = sqlite_entity(id, ifc_class, self)
-            self.entity_cache[id] = entity
+            self.cache_entity(entity)
             return entity
         self.cursor.execute("SELECT ifc_id, ifc_class FROM id_map WHERE ifc_id = ? LIMIT 1", (id,))
         row = self.cursor.fetchone()
@@ -160,10 +241,17 @@ class sqlite(file):
             _, ifc_class = row
             self.id_map[id] = ifc_class
             entity = sqlite_entity(id, ifc_class, self)
-            self.entity_cache[id] = entity
+            self.cache_entity(entity)
             return entity
 
-    def by_type(self, type: str, include_subtypes: bool = True) -> list[sqlite_entity]:
+    def by_type(self, type: str, include_subtypes: bool = True, prefetch: bool = False) -> list[sqlite_entity]:
+        """Get all entities of a class.
+
+        :param type: The IFC class name.
+        :param include_subtypes: Whether to include subtypes of the class.
+        :param prefetch: Whether to load the attributes of all results in
+            batched queries, instead of one query per entity on first access.
+        """
         # TODO use cached subtypes
         import ifcopenshell.util.schema
 
@@ -172,22 +260,40 @@ class sqlite(file):
             subtypes = self.ifc_class_subtypes[type] if include_subtypes else self.ifc_class_subtypes[type][0:1]
             for subtype in subtypes:
                 results.extend([self.by_id(i) for i in self.class_map.get(subtype.name(), [])])
-            return results
-        if include_subtypes:
+        elif include_subtypes:
             declaration = self.ifc_schema.declaration_by_name(type)
             subtypes = ",".join([f"'{st.name()}'" for st in ifcopenshell.util.schema.get_subtypes(declaration)])
             self.cursor.execute(f"SELECT ifc_id, ifc_class FROM id_map WHERE ifc_class IN ({subtypes})")
             rows = self.cursor.fetchall()
-            return [self.by_id(r[0]) for r in rows]
-        self.cursor.execute(f"SELECT ifc_id FROM id_map WHERE ifc_class='{type}'")
-        rows = self.cursor.fetchall()
-        return [self.by_id(r[0]) for r in rows]
+            results = [self.by_id(r[0]) for r in rows]
+        else:
+            self.cursor.execute("SELECT ifc_id FROM id_map WHERE ifc_class = ?", (type,))
+            rows = self.cursor.fetchall()
+            results = [self.by_id(r[0]) for r in rows]
+        if prefetch:
+            self.prefetch(results)
+        return results
 
     def traverse(
-        self, inst: sqlite_entity, max_levels: Optional[int] = None, breadth_first: bool = False
+        self,
+        inst: sqlite_entity,
+        max_levels: Optional[int] = None,
+        breadth_first: bool = False,
+        prefetch: bool = False,
     ) -> list[sqlite_entity]:
+        """Get all entities referenced by an entity, recursively.
+
+        :param inst: The entity to start traversing from.
+        :param max_levels: Maximum depth to traverse. If None, traverse fully.
+        :param breadth_first: Unused, kept for compatibility with
+            :meth:`ifcopenshell.file.traverse`.
+        :param prefetch: Whether to load the attributes of the references of
+            each entity in a batched query as they are found.
+        """
         results = [inst]
         queue = [inst]
+        if prefetch:
+            self.prefetch(queue)
         while queue:
             if max_levels is not None:
                 max_levels -= 1
@@ -198,6 +304,7 @@ class sqlite(file):
             if not attributes:
                 continue
 
+            references = []
             for attribute in attributes:
                 result = getattr(cur, attribute, [])
                 if not result:
@@ -205,25 +312,24 @@ class sqlite(file):
                 elif isinstance(result, tuple):
                     results.extend(result)
                     if max_levels is None or max_levels:
-                        queue.extend(result)
+                        references.extend(result)
                 else:
                     results.append(result)
                     if max_levels is None or max_levels:
-                        queue.append(result)
+                        references.append(result)
+
+            # Only the newly found references are prefetched, as everything
+            # else in the queue was already prefetched when it was found.
+            if prefetch and references:
+                self.prefetch(references)
+            queue.extend(references)
         # print('traverse results', results)
         return results
 
     def get_inverse(
         self, inst: sqlite_entity, allow_duplicate: bool = False, with_attribute_indices: bool = False
     ) -> set[sqlite_entity]:
-        query = (
-            f"SELECT inverses FROM {inst.sqlite_wrapper.ifc_class} WHERE `ifc_id` = {inst.sqlite_wrapper.id} LIMIT 1"
-        )
-        self.cursor.execute(query)
-        row = self.cursor.fetchone()
-        if not row or not row[0]:
-            return set()
-        return {self.by_id(e) for e in json.loads(row[0])}
+        return {self.by_id(e) for e in inst.sqlite_wrapper.get_inverse_ids()}
 
     def is_entity_list(self, attribute: ifcopenshell_wrapper.attribute) -> bool:
         attribute = str(attribute.type_of_attribute())
@@ -235,38 +341,114 @@ class sqlite(file):
         return False
 
     def get_geometry(self, ids: list[int]) -> dict[str, dict]:
-        import numpy as np
+        """Get shape placements and geometry data for a list of element IDs.
+
+        Buffers are returned as read-only NumPy arrays which are views over
+        the sqlite blobs, so no Python lists are materialised. Call
+        ``.tolist()`` or ``np.copy`` on them if you need to mutate them.
 
-        ids_csv = ",".join(map(str, ids))
-        query = f"SELECT ifc_id, x, y, z, matrix, geometry, verts, edges, faces, material_ids, materials FROM shape LEFT JOIN geometry ON shape.geometry = geometry.id WHERE `ifc_id` IN ({ids_csv})"
-        self.cursor.execute(query)
-        rows = self.cursor.fetchall()
+        :param ids: List of element IDs to retrieve geometry for.
+        :return: Dictionary with ``shapes`` (keyed by element ID) and
+            ``geometry`` (keyed by geometry ID).
+        """
         shapes = {}
         geometry = {}
+        for i in range(0, len(ids), self.geometry_chunk_size):
+            chunk = ids[i : i + self.geometry_chunk_size]
+            ids_csv = ",".join(map(str, chunk))
+            self.cursor.execute(f"{self.geometry_query} WHERE shape.ifc_id IN ({ids_csv})")
+            self.process_geometry_rows(self.cursor.fetchall(), shapes, geometry)
+        ids_without_geometry = set(ids) - set(shapes.keys())
+        for id in ids_without_geometry:
+            shapes[id] = self.get_empty_shape()
+        return {"shapes": shapes, "geometry": geometry}
+
+    def iter_geometry(
+        self, ids: Optional[list[int]] = None, chunk_size: Optional[int] = None
+    ) -> Iterator[dict[str, dict]]:
+        """Stream shape placements and geometry data in chunks.
+
+        Each yielded chunk has the same structure as :meth:`get_geometry`.
+        A geometry shared by several shapes is only yielded once, in the
+        first chunk that references it, so consumers should keep their own
+        geometry ID lookup across chunks.
+
+        :param ids: Element IDs to retrieve geometry for. If omitted, all
+            shapes stored in the database are streamed in ``ifc_id`` order.
+        :param chunk_size: Number of shapes per chunk. Defaults to
+            :attr:`geometry_chunk_size`.
+        :return: Generator of ``{"shapes": ..., "geometry": ...}`` dicts.
+        """
+        chunk_size = chunk_size or self.geometry_chunk_size
+        seen_geometry = set()
+
+        if ids is not None:
+            for i in range(0, len(ids), chunk_size):
+                chunk = ids[i : i + chunk_size]
+                ids_csv = ",".join(map(str, chunk))
+                cursor = self.db.execute(f"{self.geometry_query} WHERE shape.ifc_id IN ({ids_csv})")
+                shapes, geometry = {}, {}
+                self.process_geometry_rows(cursor.fetchall(), shapes, geometry, seen_geometry)
+                for id in set(chunk) - set(shapes.keys()):
+                    shapes[id] = self.get_empty_shape()
+                yield {"shapes": shapes, "geometry": geometry}
+            return
+
+        # Keyset pagination over id ranges avoids OFFSET scans on large tables.
+        last_id = -1
+        while True:
+            cursor = self.db.execute(
+                f"{self.geometry_query} WHERE shape.ifc_id > ? ORDER BY shape.ifc_id LIMIT ?", (last_id, chunk_size)
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            shapes, geometry = {}, {}
+            self.process_geometry_rows(rows, shapes, geometry, seen_geometry)
+            last_id = rows[-1]["ifc_id"]
+            yield {"shapes": shapes, "geometry": geometry}
+
+    def process_geometry_rows(
+        self,
+        rows: list[sqlite3.Row],
+        shapes: dict[int, dict],
+        geometry: dict[str, dict],
+        seen_geometry: Optional[set[str]] = None,
+    ) -> None:
+        import numpy as np
+
+        if seen_geometry is None:
+            seen_geometry = set()
         for row in rows:
-            if row["geometry"] and row["geometry"] not in geometry:
-                geometry[row["geometry"]] = {
-                    "verts": np.frombuffer(row["verts"]).tolist() if row["verts"] else [],
-                    "edges": np.frombuffer(row["edges"], dtype=np.int64).tolist() if row["edges"] else [],
-                    "faces": np.frombuffer(row["faces"], dtype=np.int64).tolist() if row["faces"] else [],
-                    "material_ids": (
-                        np.frombuffer(row["material_ids"], dtype=np.int64).tolist() if row["material_ids"] else []
-                    ),
+            geometry_id = row["geometry"]
+            if geometry_id and geometry_id not in seen_geometry and geometry_id not in geometry:
+                seen_geometry.add(geometry_id)
+                geometry[geometry_id] = {
+                    "verts": self.get_buffer(row["verts"], np.float64),
+                    "edges": self.get_buffer(row["edges"], np.int64),
+                    "faces": self.get_buffer(row["faces"], np.int64),
+                    "material_ids": self.get_buffer(row["material_ids"], np.int64),
                     "materials": json.loads(row["materials"]) if row["materials"] else [],
                 }
             shapes[row["ifc_id"]] = {
                 "co": [row["x"], row["y"], row["z"]],
+                # Placement matrices are small and often modified in place, so copy.
                 "matrix": np.copy(np.frombuffer(row["matrix"]).reshape((4, 4))),
-                "geometry": row["geometry"],
-            }
-        ids_without_geometry = set(ids) - set(shapes.keys())
-        for id in ids_without_geometry:
-            shapes[id] = {
-                "co": [0.0, 0.0, 0.0],
-                "matrix": np.eye(4),
-                "geometry": None,
+                "geometry": geometry_id,
             }
-        return {"shapes": shapes, "geometry": geometry}
+
+    def get_buffer(self, blob: Optional[bytes], dtype: type) -> np.ndarray:
+        import numpy as np
+
+        if not blob:
+            return np.empty(0, dtype=dtype)
+        # A read-only view over the blob, no copy is made.
+        return np.frombuffer(blob, dtype=dtype)
+
+    def get_empty_shape(self) -> dict[str, Any]:
+        import numpy as np
+
+        return {"co": [0.0, 0.0, 0.0], "matrix": np.eye(4), "geometry": None}
 
     def __del__(self) -> None:
         # Override to avoid clean up data unrelated to sqlite file.
@@ -308,36 +490,12 @@ class sqlite_entity(entity_instance):
         INVALID, FORWARD, INVERSE = range(3)
         attr_cat = self.wrapped_data.get_attribute_category(name)
         if attr_cat == FORWARD:
-            if self.sqlite_wrapper.attribute_cache:
-                # print(self.sqlite_wrapper.ifc_class)
-                # print(self.sqlite_wrapper.attribute_cache)
-                return self.sqlite_wrapper.attribute_cache[name]
-
-            # print('first time for', self.sqlite_wrapper.ifc_class)
-
-            # print("IT IS A FORWARD")
-            query = f"SELECT * FROM {self.sqlite_wrapper.ifc_class} WHERE `ifc_id` = {self.sqlite_wrapper.id} LIMIT 1"
-            self.sqlite_wrapper.file.cursor.execute(query)
-            row = self.sqlite_wrapper.file.cursor.fetchone()
-
-            for attribute in self.sqlite_wrapper.attributes.values():
-                # attribute = self.sqlite_wrapper.attributes[name]
-                aname = attribute.name()
-                primitive = ifcopenshell.util.attribute.get_primitive_type(attribute)
-
-                if not row or row[aname] is None:
-                    self.sqlite_wrapper.attribute_cache[aname] = None
-                elif primitive == "entity":
-                    self.sqlite_wrapper.attribute_cache[aname] = self.sqlite_wrapper.file.by_id(row[aname])
-                elif isinstance(primitive, tuple):
-                    if isinstance(row[aname], int):
-                        self.sqlite_wrapper.attribute_cache[aname] = self.sqlite_wrapper.file.by_id(row[aname])
-                    else:
-                        self.sqlite_wrapper.attribute_cache[aname] = self.unserialise_value(json.loads(row[aname]))
-                else:
-                    self.sqlite_wrapper.attribute_cache[aname] = row[aname]
-                if isinstance(self.sqlite_wrapper.attribute_cache[aname], list):
-                    self.sqlite_wrapper.attribute_cache[aname] = tuple(self.sqlite_wrapper.attribute_cache[aname])
+            if not self.sqlite_wrapper.attribute_cache:
+                file = self.sqlite_wrapper.file
+                file.cursor.execute(
+                    file.get_query("attributes", self.sqlite_wrapper.ifc_class), (self.sqlite_wrapper.id,)
+                )
+                self.sqlite_wrapper.load_attributes(file.cursor.fetchone())
             return self.sqlite_wrapper.attribute_cache[name]
         elif attr_cat == INVERSE:
             if self.sqlite_wrapper.inverse_attribute_cache:
@@ -347,10 +505,8 @@ class sqlite_entity(entity_instance):
 
             results = []
 
-            query = f"SELECT inverses FROM {self.sqlite_wrapper.ifc_class} WHERE `ifc_id` = {self.sqlite_wrapper.id} LIMIT 1"
-            self.sqlite_wrapper.file.cursor.execute(query)
-            row = self.sqlite_wrapper.file.cursor.fetchone()
-            if not row or not row[0]:
+            element_ids = self.sqlite_wrapper.get_inverse_ids()
+            if not element_ids:
                 self.sqlite_wrapper.inverse_attribute_cache[name] = tuple()
                 return self.sqlite_wrapper.inverse_attribute_cache[name]
 
@@ -359,20 +515,19 @@ class sqlite_entity(entity_instance):
             declaration = self.sqlite_wrapper.file.ifc_schema.declaration_by_name(entity_class)
             forward_name = attribute.attribute_reference().name()
 
-            subtypes = [st.name() for st in ifcopenshell.util.schema.get_subtypes(declaration)]
-            element_ids = json.loads(row[0])
-            for element_id in element_ids:
-                ifc_class = self.sqlite_wrapper.file.id_map[element_id]
-                if ifc_class in subtypes:
-                    potential_result = self.sqlite_wrapper.file.by_id(element_id)
-                    forward_value = getattr(potential_result, forward_name, None)
-                    if not forward_value:
-                        pass
-                    elif isinstance(forward_value, tuple):
-                        if self.sqlite_wrapper.id in [e.id() for e in forward_value]:
-                            results.append(potential_result)
-                    elif forward_value.id() == self.sqlite_wrapper.id:
+            subtypes = {st.name() for st in ifcopenshell.util.schema.get_subtypes(declaration)}
+            file = self.sqlite_wrapper.file
+            potential_results = [file.by_id(e) for e in element_ids if file.id_map[e] in subtypes]
+            file.prefetch(potential_results)
+            for potential_result in potential_results:
+                forward_value = getattr(potential_result, forward_name, None)
+                if not forward_value:
+                    pass
+                elif isinstance(forward_value, tuple):
+                    if self.sqlite_wrapper.id in [e.id() for e in forward_value]:
                         results.append(potential_result)
+                elif forward_value.id() == self.sqlite_wrapper.id:
+                    results.append(potential_result)
 
             self.sqlite_wrapper.inverse_attribute_cache[name] = tuple(results)
             return self.sqlite_wrapper.inverse_attribute_cache[name]
@@ -382,17 +537,7 @@ class sqlite_entity(entity_instance):
         )
 
     def unserialise_value(self, value):
-        if isinstance(value, (tuple, list)):
-            for i, value2 in enumerate(value):
-                value[i] = self.unserialise_value(value2)
-            return value
-        elif isinstance(value, int):
-            return self.sqlite_wrapper.file.by_id(value)
-        elif isinstance(value, dict):
-            value2 = ifcopenshell.create_entity(value["type"])
-            value2[0] = value["value"]
-            return value2
-        return value
+        return self.sqlite_wrapper.unserialise_value(value)
 
     def __eq__(self, other: sqlite_entity) -> bool:
         if not isinstance(self, type(other)):
@@ -459,6 +604,55 @@ class sqlite_wrapper:
         self.inverse_attributes = self.file.ifc_class_inverse_attributes[self.ifc_class]
         self.attribute_cache: dict[str, Any] = {}
         self.inverse_attribute_cache = {}
+        self.inverse_ids: Optional[list[int]] = None
+
+    def load_attributes(self, row: Optional[sqlite3.Row]) -> None:
+        """Populate the attribute cache from a row of the class table."""
+        for attribute in self.attributes.values():
+            aname = attribute.name()
+            primitive = ifcopenshell.util.attribute.get_primitive_type(attribute)
+
+            if not row or row[aname] is None:
+                value = None
+            elif primitive == "entity":
+                value = self.file.by_id(row[aname])
+            elif isinstance(primitive, tuple):
+                if isinstance(row[aname], int):
+                    value = self.file.by_id(row[aname])
+                else:
+                    value = self.unserialise_value(json.loads(row[aname]))
+            else:
+                value = row[aname]
+            if isinstance(value, list):
+                value = tuple(value)
+            self.attribute_cache[aname] = value
+
+    def load_inverses(self, row: Optional[sqlite3.Row]) -> None:
+        """Populate the inverse IDs from a row of the class table."""
+        try:
+            inverses = row["inverses"] if row else None
+        except IndexError:  # Database was created without inverses
+            inverses = None
+        self.inverse_ids = json.loads(inverses) if inverses else []
+
+    def get_inverse_ids(self) -> list[int]:
+        if self.inverse_ids is None:
+            self.file.cursor.execute(self.file.get_query("inverses", self.ifc_class), (self.id,))
+            self.load_inverses(self.file.cursor.fetchone())
+        return self.inverse_ids
+
+    def unserialise_value(self, value):
+        if isinstance(value, (tuple, list)):
+            for i, value2 in enumerate(value):
+                value[i] = self.unserialise_value(value2)
+            return value
+        elif isinstance(value, int):
+            return self.file.by_id(value)
+        elif isinstance(value, dict):
+            value2 = ifcopenshell.create_entity(value["type"])
+            value2[0] = value["value"]
+            return value2
+        return value
 
     def __repr__(self) -> str:
         return f"sqlite_wrapper '#{self.id}={self.ifc_class}(...)'"
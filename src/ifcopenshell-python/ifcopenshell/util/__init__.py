@@ -42,3 +42,13 @@ The most commonly used utilities to help you get started are:
 - See :mod:`ifcopenshell.util.shape` to calculate quantities from processed
   geometry.
 """
+
+import importlib
+import importlib.util
+
+
+def __getattr__(name: str):
+    # Utility modules are imported on first access, e.g. ifcopenshell.util.element
+    if not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}"):
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,13 +17,16 @@
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
 import json
+import sqlite3
 from pathlib import Path
 import copy
 import ifcopenshell
 import ifcopenshell.ifcopenshell_wrapper as ifcopenshell_wrapper
 import ifcopenshell.util.attribute
 import ifcopenshell.util.schema
-from typing import Optional, Literal
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from typing import Any, Optional, Literal, Union
 
 try:
     import glob
@@ -82,7 +85,10 @@ SCHEMA_FILES: dict[SUPPORTED_SCHEMA, dict] = {
     },
 }
 
-db = None
+# An optional compact index of all documentation, see build_index
+INDEX_PATH = BASE_MODULE_PATH / "schema/ifc_docs.sqlite"
+
+db: dict[SUPPORTED_SCHEMA, "DocDatabase"] = {}
 schema_by_name: dict[SUPPORTED_SCHEMA, Optional[ifcopenshell_wrapper.schema_definition]] = {
     "IFC2X3": None,
     "IFC4": None,
@@ -90,23 +96,144 @@ schema_by_name: dict[SUPPORTED_SCHEMA, Optional[ifcopenshell_wrapper.schema_defi
 }
 
 
-def get_db(version):
-    global db
-    if not db:
-        db = {ifc_version: dict() for ifc_version in SCHEMA_FILES}
-        for ifc_version in SCHEMA_FILES:
-            for data_type in SCHEMA_FILES[ifc_version]:
-                schema_path = SCHEMA_FILES[ifc_version][data_type]
-                if not schema_path.is_file():
-                    print(f"Schema file {schema_path} wasn't found.")
-                    files_missing = True
-                    continue
+class DocDatabase(Mapping):
+    """Documentation of a single schema version, loaded one data type at a time
+
+    Each data type (entities, properties, types, or classes_suggestions) is
+    only loaded when it is first accessed. If an index has been built using
+    :func:`build_index`, each key is looked up in the index instead, without
+    loading the rest of the data type into memory.
+    """
+
+    def __init__(self, version: SUPPORTED_SCHEMA, index_path: Optional[Path] = None):
+        self.version = version
+        self.index_path = index_path
+        self.data_types: dict[str, Mapping[str, Any]] = {}
+
+    def __getitem__(self, data_type: str) -> Mapping[str, Any]:
+        if (data := self.data_types.get(data_type)) is not None:
+            return data
+        if data_type not in SCHEMA_FILES[self.version]:
+            raise KeyError(data_type)
+        if self.index_path:
+            data = IndexedDocs(self.index_path, self.version, data_type)
+        else:
+            data = load_json(SCHEMA_FILES[self.version][data_type])
+        self.data_types[data_type] = data
+        return data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(SCHEMA_FILES[self.version])
+
+    def __len__(self) -> int:
+        return len(SCHEMA_FILES[self.version])
+
+
+class IndexedDocs(Mapping):
+    """Documentation of a single data type, looked up by key from an index"""
+
+    def __init__(self, index_path: Path, version: str, data_type: str):
+        self.connection = get_index_connection(index_path)
+        self.version = version
+        self.data_type = data_type
+
+    def __getitem__(self, key: str) -> Any:
+        row = self.connection.execute(
+            "SELECT value FROM docs WHERE version = ? AND data_type = ? AND key = ?",
+            (self.version, self.data_type, key),
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self.connection.execute(
+            "SELECT key FROM docs WHERE version = ? AND data_type = ?", (self.version, self.data_type)
+        )
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM docs WHERE version = ? AND data_type = ?", (self.version, self.data_type)
+        ).fetchone()[0]
+
+
+@lru_cache(maxsize=None)
+def load_json(path: Path) -> dict[str, Any]:
+    # Cached by path, as class suggestions are shared by all versions
+    if not path.is_file():
+        print(f"Schema file {path} wasn't found.")
+        return {}
+    with open(path, "r") as fi:
+        return json.load(fi)
+
+
+@lru_cache(maxsize=None)
+def get_index_connection(index_path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{Path(index_path).as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+
+def build_index(index_path: Union[Path, str] = INDEX_PATH) -> None:
+    """Builds a compact index of the documentation of all schema versions
+
+    The index is a SQLite database with one row per entity, property set,
+    type, or class suggestion. Once built, :func:`get_db` will look up
+    documentation from the index one key at a time instead of loading the
+    JSON documentation files into memory.
+
+    :param index_path: Where to save the index. Defaults to
+        ``INDEX_PATH``, which is used automatically if it exists.
+    """
+    index_path = Path(index_path)
+    temporary_path = index_path.with_suffix(".tmp")
+    temporary_path.unlink(missing_ok=True)
+    connection = sqlite3.connect(temporary_path)
+    with connection:
+        connection.execute(
+            "CREATE TABLE docs (version TEXT, data_type TEXT, key TEXT, value TEXT, "
+            "PRIMARY KEY (version, data_type, key)) WITHOUT ROWID"
+        )
+        for version, data_types in SCHEMA_FILES.items():
+            for data_type, schema_path in data_types.items():
+                connection.executemany(
+                    "INSERT INTO docs VALUES (?, ?, ?, ?)",
+                    (
+                        (version, data_type, key, json.dumps(value, separators=(",", ":")))
+                        for key, value in load_json(schema_path).items()
+                    ),
+                )
+    connection.execute("VACUUM")
+    connection.close()
+    temporary_path.replace(index_path)
+    clear_db()
+
+
+def clear_db() -> None:
+    """Forgets all loaded documentation, such as after (re)building an index"""
+    db.clear()
+    load_json.cache_clear()
+    get_index_connection.cache_clear()
+
+
+def get_db(version: str) -> Optional[DocDatabase]:
+    """Gets the documentation of a schema version
 
-                with open(schema_path, "r") as fi:
-                    db[ifc_version][data_type] = json.load(fi)
+    Documentation is loaded lazily, only for the schema version and data
+    types that are actually accessed. If an index exists at ``INDEX_PATH``
+    (see :func:`build_index`), documentation is looked up from it instead.
 
+    :param version: The schema identifier, such as IFC4 or IFC4X3_ADD2.
+    :return: A mapping of data type (entities, properties, types, or
+        classes_suggestions) to documentation, or None if the schema isn't
+        supported.
+    """
     version = ifcopenshell.util.schema.get_fallback_schema(version)
-    return db.get(version)
+    if version not in SCHEMA_FILES:
+        return None
+    if (version_db := db.get(version)) is None:
+        index_path = INDEX_PATH if INDEX_PATH and INDEX_PATH.is_file() else None
+        version_db = db[version] = DocDatabase(version, index_path)
+    return version_db
 
 
 def get_schema_by_name(version: str) -> ifcopenshell_wrapper.schema_definition:
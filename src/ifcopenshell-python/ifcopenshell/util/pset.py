@@ -17,6 +17,8 @@
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
+import json
+import weakref
 import pathlib
 import ifcopenshell
 import ifcopenshell.ifcopenshell_wrapper as W
@@ -24,10 +26,13 @@ import ifcopenshell.util.schema
 import ifcopenshell.util.type
 from ifcopenshell.entity_instance import entity_instance
 from functools import lru_cache
-from typing import Optional, Literal
+from typing import Any, Iterator, Optional, Literal, Union
 
 templates: dict[str, "PsetQto"] = {}
 
+# Applicability indices of template files, shared by all PsetQto instances
+applicability_indices: "weakref.WeakKeyDictionary[ifcopenshell.file, ApplicabilityIndex]" = weakref.WeakKeyDictionary()
+
 
 def get_template(schema: str) -> "PsetQto":
     global templates
@@ -36,6 +41,215 @@ def get_template(schema: str) -> "PsetQto":
     return templates[schema]
 
 
+@lru_cache()
+def get_template_file(schema_identifier: str) -> ifcopenshell.file:
+    """Opens a bundled buildingSMART template file, once per process
+
+    :param schema_identifier: IFC2X3, IFC4, or IFC4X3_ADD2.
+    :return: The template file.
+    """
+    folder_path = pathlib.Path(__file__).parent.absolute()
+    path = str(folder_path.joinpath("schema", PsetQto.templates_path[schema_identifier]))
+    template = ifcopenshell.open(path)
+    # See bug 3583. We backport this change from IFC4X3 because it just makes sense.
+    # Users aren't forced to use it.
+    if schema_identifier == "IFC4":
+        for element in template.by_type("IfcPropertySetTemplate"):
+            if element.TemplateType == "QTO_OCCURRENCEDRIVEN":
+                element.TemplateType = "QTO_TYPEDRIVENOVERRIDE"
+    return template
+
+
+def get_applicability_index(template: ifcopenshell.file) -> "ApplicabilityIndex":
+    """Gets the applicability index of a template file, building it on first use
+
+    :param template: A file containing property set templates.
+    :return: The applicability index of the template file.
+    """
+    index = applicability_indices.get(template)
+    if index is None:
+        index = applicability_indices[template] = ApplicabilityIndex.from_template(template)
+    return index
+
+
+class ApplicabilityIndex:
+    """An index of which property set templates apply to which IFC classes
+
+    The applicable entities of each template are parsed once. The templates
+    applicable to an IFC class are then resolved once per class and predefined
+    type, and remembered. The index only stores names and IDs, so it may be
+    saved to disk and loaded again for the same template file, to avoid
+    resolving applicability again in a new process.
+    """
+
+    def __init__(
+        self,
+        ids: list[int],
+        names: list[str],
+        template_types: list[Optional[str]],
+        applicables: list[list[tuple[str, Optional[str]]]],
+        classes: Optional[dict[str, tuple[list[int], dict[str, list[int]]]]] = None,
+    ):
+        self.ids = ids
+        self.names = names
+        self.template_types = template_types
+        #: The (IFC class, lowercase predefined type) pairs each template applies to
+        self.applicables = applicables
+        #: Maps a resolved "schema:schema_name:ifc_class" key to templates which apply to
+        #: any predefined type, and templates which apply to a specific lowercase predefined type
+        self.classes = classes or {}
+        self.index_by_name = {name: i for i, name in reversed(list(enumerate(names)))}
+        self.psets = {i for i, t in enumerate(template_types) if not (t and t.startswith("QTO_"))}
+        self.qtos = {i for i, t in enumerate(template_types) if not (t and t.startswith("PSET_"))}
+        self.applicables_by_class: dict[str, list[tuple[int, Optional[str]]]] = {}
+        for i, applicables_of_template in enumerate(applicables):
+            for applicable_class, predefined_type in applicables_of_template:
+                self.applicables_by_class.setdefault(applicable_class.lower(), []).append((i, predefined_type))
+        self.applicables_by_type_class: dict[tuple[str, str], dict[str, list[tuple[int, Optional[str]]]]] = {}
+
+    @classmethod
+    def from_template(cls, template: ifcopenshell.file) -> "ApplicabilityIndex":
+        ids, names, template_types, applicables = [], [], [], []
+        for prop_set in template.by_type("IfcPropertySetTemplate"):
+            ids.append(prop_set.id())
+            names.append(prop_set.Name)
+            template_types.append(prop_set.TemplateType)
+            applicables.append(cls.parse_applicables(prop_set.ApplicableEntity or "IfcRoot"))
+        return cls(ids, names, template_types, applicables)
+
+    @staticmethod
+    def parse_applicables(applicables: str) -> list[tuple[str, Optional[str]]]:
+        """applicables can have multiple possible patterns :
+        IfcBoilerType                               (IfcClass)
+        IfcBoilerType/STEAM                         (IfcClass/PREDEFINEDTYPE)
+        IfcBoilerType[PerformanceHistory]           (IfcClass[PerformanceHistory])
+        IfcBoilerType/STEAM[PerformanceHistory]     (IfcClass/PREDEFINEDTYPE[PerformanceHistory])
+        """
+        results = []
+        for applicable in applicables.split(","):
+            match = re.match(r"(\w+)(\[\w+\])*/*(\w+)*(\[\w+\])*", applicable)
+            if not match:
+                continue
+            # Uncomment if usage found
+            # applicable_perf_history = match.group(2) or match.group(4)
+            # Case insensitive to handle things like material categories
+            matched_type = match.group(3)
+            results.append((match.group(1), matched_type.lower() if matched_type else None))
+        return results
+
+    def get_applicable(
+        self,
+        ifc_schema: W.schema_definition,
+        entity: W.entity,
+        predefined_type: str = "",
+        schema: ifcopenshell.util.schema.IFC_SCHEMA = "IFC4",
+    ) -> list[int]:
+        """Gets the positions of the templates applicable to an IFC class
+
+        :param ifc_schema: The schema the IFC class is defined in.
+        :param entity: The IFC class.
+        :param predefined_type: The predefined type, object type, or
+            material category, matched case insensitively.
+        :param schema: The schema used to find the type classes of occurrence
+            classes.
+        :return: Sorted positions of templates, see ids and names.
+        """
+        key = f"{schema}:{ifc_schema.name()}:{entity.name()}"
+        if (resolved := self.classes.get(key)) is None:
+            resolved = self.classes[key] = self.resolve(ifc_schema, entity, schema)
+        any_type, by_type = resolved
+        if predefined_type and (specific := by_type.get(predefined_type.lower())):
+            return sorted(any_type + specific)
+        return any_type
+
+    def resolve(
+        self, ifc_schema: W.schema_definition, entity: W.entity, schema: ifcopenshell.util.schema.IFC_SCHEMA
+    ) -> tuple[list[int], dict[str, list[int]]]:
+        supertypes = [entity] + ifcopenshell.util.schema.get_supertypes(entity)
+        applicables = []
+        for supertype in supertypes:
+            name = supertype.name().lower()
+            applicables.extend(self.applicables_by_class.get(name, []))
+            # There is an implementer agreement that if the template type is
+            # type based, the type need not be explicitly mentioned
+            # https://github.com/buildingSMART/IFC4.3.x-development/issues/22
+            # This will be fixed in IFC4.3
+            if name == "ifctypeobject":
+                type_classes = self.get_applicables_by_type_class(ifc_schema, schema)
+                for type_supertype in supertypes:
+                    applicables.extend(type_classes.get(type_supertype.name().lower(), []))
+        any_type, by_type = set(), {}
+        for i, predefined_type in applicables:
+            if predefined_type:
+                by_type.setdefault(predefined_type, set()).add(i)
+            else:
+                any_type.add(i)
+        return sorted(any_type), {k: sorted(v - any_type) for k, v in by_type.items()}
+
+    def get_applicables_by_type_class(
+        self, ifc_schema: W.schema_definition, schema: ifcopenshell.util.schema.IFC_SCHEMA
+    ) -> dict[str, list[tuple[int, Optional[str]]]]:
+        key = (schema, ifc_schema.name())
+        if (results := self.applicables_by_type_class.get(key)) is not None:
+            return results
+        results = self.applicables_by_type_class[key] = {}
+        for i, applicables_of_template in enumerate(self.applicables):
+            if "TYPE" not in (self.template_types[i] or ""):
+                continue
+            for applicable_class, predefined_type in applicables_of_template:
+                types = ifcopenshell.util.type.get_applicable_types(applicable_class, schema)
+                if not types:
+                    # Abstract classes will not have an "applicable type" but
+                    # the implementer agreement still applies to them.
+                    occurrence_class = None
+                    try:
+                        occurrence_class = ifc_schema.declaration_by_name(applicable_class + "Type")
+                    except:
+                        try:
+                            occurrence_class = ifc_schema.declaration_by_name("IfcType" + applicable_class[3:])
+                        except:
+                            pass
+                    if occurrence_class:
+                        types = [occurrence_class.name()]
+                for ifc_type in types:
+                    results.setdefault(ifc_type.lower(), []).append((i, predefined_type))
+        return results
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ids": self.ids,
+            "names": self.names,
+            "template_types": self.template_types,
+            "applicables": self.applicables,
+            "classes": self.classes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ApplicabilityIndex":
+        return cls(
+            data["ids"],
+            data["names"],
+            data["template_types"],
+            [[tuple(a) for a in applicables] for applicables in data["applicables"]],
+            {k: (v[0], v[1]) for k, v in data["classes"].items()},
+        )
+
+    def save(self, path: Union[str, pathlib.Path]) -> None:
+        """Saves the index, including all IFC classes resolved so far, as JSON"""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: Union[str, pathlib.Path]) -> "ApplicabilityIndex":
+        """Loads a saved index
+
+        The index must have been built from the same template file. To use it,
+        store it in ``applicability_indices`` with the template file as key.
+        """
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+
 class PsetQto:
     # fmt: off
     templates_path = {
@@ -50,18 +264,9 @@ class PsetQto:
             schema_identifier = "IFC4X3_ADD2"
         self.schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema_identifier)
         if not templates:
-            folder_path = pathlib.Path(__file__).parent.absolute()
-            path = str(folder_path.joinpath("schema", self.templates_path[schema_identifier]))
-            templates = [ifcopenshell.open(path)]
-            # See bug 3583. We backport this change from IFC4X3 because it just makes sense.
-            # Users aren't forced to use it.
-            if schema_identifier == "IFC4":
-                for element in templates[0].by_type("IfcPropertySetTemplate"):
-                    if element.TemplateType == "QTO_OCCURRENCEDRIVEN":
-                        element.TemplateType = "QTO_TYPEDRIVENOVERRIDE"
+            templates = [get_template_file(schema_identifier)]
         self.templates = templates
 
-    @lru_cache()
     def get_applicable(
         self,
         ifc_class="",
@@ -70,26 +275,11 @@ class PsetQto:
         qto_only=False,
         schema: ifcopenshell.util.schema.IFC_SCHEMA = "IFC4",
     ) -> list[entity_instance]:
-        any_class = not ifc_class
-        if not any_class:
-            entity: W.entity
-            entity = self.schema.declaration_by_name(ifc_class)
-        result = []
-        for template in self.templates:
-            for prop_set in template.by_type("IfcPropertySetTemplate"):
-                if pset_only:
-                    if prop_set.TemplateType and prop_set.TemplateType.startswith("QTO_"):
-                        continue
-                if qto_only:
-                    if prop_set.TemplateType and prop_set.TemplateType.startswith("PSET_"):
-                        continue
-                if any_class or self.is_applicable(
-                    entity, prop_set.ApplicableEntity or "IfcRoot", predefined_type, prop_set.TemplateType, schema
-                ):
-                    result.append(prop_set)
-        return result
-
-    @lru_cache()
+        return [
+            template.by_id(index.ids[i])
+            for template, index, i in self.iter_applicable(ifc_class, predefined_type, pset_only, qto_only, schema)
+        ]
+
     def get_applicable_names(
         self,
         ifc_class: str,
@@ -100,9 +290,32 @@ class PsetQto:
     ) -> list[str]:
         """Return names instead of objects for other use eg. enum"""
         return [
-            prop_set.Name for prop_set in self.get_applicable(ifc_class, predefined_type, pset_only, qto_only, schema)
+            index.names[i]
+            for _, index, i in self.iter_applicable(ifc_class, predefined_type, pset_only, qto_only, schema)
         ]
 
+    def iter_applicable(
+        self,
+        ifc_class: str = "",
+        predefined_type: str = "",
+        pset_only: bool = False,
+        qto_only: bool = False,
+        schema: ifcopenshell.util.schema.IFC_SCHEMA = "IFC4",
+    ) -> Iterator[tuple[ifcopenshell.file, ApplicabilityIndex, int]]:
+        entity = self.schema.declaration_by_name(ifc_class) if ifc_class else None
+        for template in self.templates:
+            index = get_applicability_index(template)
+            if entity:
+                applicable = index.get_applicable(self.schema, entity, predefined_type, schema)
+            else:
+                applicable = range(len(index.ids))
+            if pset_only:
+                applicable = [i for i in applicable if i in index.psets]
+            if qto_only:
+                applicable = [i for i in applicable if i in index.qtos]
+            for i in applicable:
+                yield template, index, i
+
     def is_applicable(
         self,
         entity: W.entity,
@@ -117,53 +330,14 @@ class PsetQto:
         IfcBoilerType[PerformanceHistory]           (IfcClass[PerformanceHistory])
         IfcBoilerType/STEAM[PerformanceHistory]     (IfcClass/PREDEFINEDTYPE[PerformanceHistory])
         """
-        for applicable in applicables.split(","):
-            match = re.match(r"(\w+)(\[\w+\])*/*(\w+)*(\[\w+\])*", applicable)
-            if not match:
-                continue
-            # Uncomment if usage found
-            # applicable_perf_history = match.group(2) or match.group(4)
-            matched_type = match.group(3)
-            if matched_type and not predefined_type:
-                continue
-            # Case insensitive to handle things like material categories
-            elif matched_type and predefined_type.lower() != match.group(3).lower():
-                continue
-
-            applicable_class = match.group(1)
-            if ifcopenshell.util.schema.is_a(entity, applicable_class):
-                return True
-            # There is an implementer agreement that if the template type is
-            # type based, the type need not be explicitly mentioned
-            # https://github.com/buildingSMART/IFC4.3.x-development/issues/22
-            # This will be fixed in IFC4.3
-            template_type = template_type or ""
-            if "TYPE" in template_type and ifcopenshell.util.schema.is_a(entity, "IfcTypeObject"):
-                types = ifcopenshell.util.type.get_applicable_types(applicable_class, schema)
-                if not types:
-                    # Abstract classes will not have an "applicable type" but
-                    # the implementer agreement still applies to them.
-                    occurrence_class = None
-                    try:
-                        occurrence_class = self.schema.declaration_by_name(applicable_class + "Type")
-                    except:
-                        try:
-                            occurrence_class = self.schema.declaration_by_name("IfcType" + applicable_class[3:])
-                        except:
-                            pass
-                    if occurrence_class:
-                        types = [occurrence_class.name()]
-                for ifc_type in types:
-                    if ifcopenshell.util.schema.is_a(entity, ifc_type):
-                        return True
-        return False
+        index = ApplicabilityIndex([0], [""], [template_type], [ApplicabilityIndex.parse_applicables(applicables)])
+        return bool(index.get_applicable(self.schema, entity, predefined_type, schema))
 
-    @lru_cache()
     def get_by_name(self, name: str) -> Optional[entity_instance]:
         for template in self.templates:
-            for prop_set in template.by_type("IfcPropertySetTemplate"):
-                if prop_set.Name == name:
-                    return prop_set
+            index = get_applicability_index(template)
+            if (i := index.index_by_name.get(name)) is not None:
+                return template.by_id(index.ids[i])
         return None
 
     def is_templated(self, name: str) -> bool:
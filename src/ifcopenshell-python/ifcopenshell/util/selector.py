@@ -35,7 +35,8 @@ import ifcopenshell.util.shape
 import ifcopenshell.util.system
 import ifcopenshell.util.unit
 from decimal import Decimal
-from typing import Optional, Any, Union, Iterable
+from functools import lru_cache
+from typing import Optional, Any, Union, Iterable, Literal
 
 if sys.version_info >= (3, 10):
     from types import EllipsisType
@@ -43,8 +44,7 @@ else:
     EllipsisType = type(...)
 
 
-filter_elements_grammar = lark.Lark(
-    """start: filter_group
+filter_elements_grammar_source = """start: filter_group
     filter_group: facet_list ("+" facet_list)*
     facet_list: facet ("," facet)*
 
@@ -116,10 +116,8 @@ filter_elements_grammar = lark.Lark(
 
     %ignore WS // Disregard spaces in text
 """
-)
 
-get_element_grammar = lark.Lark(
-    """start: keys
+get_element_grammar_source = """start: keys
 
     keys: key ("." key)*
     key: quoted_string | regex_string | unquoted_string
@@ -135,10 +133,8 @@ get_element_grammar = lark.Lark(
 
     %ignore WS // Disregard spaces in text
  """
-)
 
-format_grammar = lark.Lark(
-    """start: function
+format_grammar_source = """start: function
 
     function: round | number | int | format_length | lower | upper | title | concat | substr | ESCAPED_STRING | NUMBER
 
@@ -181,7 +177,35 @@ format_grammar = lark.Lark(
 
     %ignore WS // Disregard spaces in text
 """
-)
+
+grammar_sources = {
+    "filter_elements": filter_elements_grammar_source,
+    "get_element": get_element_grammar_source,
+    "format": format_grammar_source,
+}
+
+
+@lru_cache(maxsize=None)
+def get_grammar(name: Literal["filter_elements", "get_element", "format"]) -> lark.Lark:
+    """Returns a query grammar parser, compiling it on first use
+
+    Compiling the grammars is relatively slow, so this is deferred until a
+    query is first parsed rather than when this module is imported. Compiled
+    parsers are cached for the lifetime of the process.
+
+    :param name: The name of the grammar, either filter_elements, get_element,
+        or format.
+    :return: The Lark parser for the grammar.
+    """
+    return lark.Lark(grammar_sources[name])
+
+
+def __getattr__(name: str) -> Any:
+    # The filter_elements_grammar, get_element_grammar, and format_grammar
+    # parsers were previously module attributes and are kept for compatibility.
+    if name.endswith("_grammar") and (grammar := name.removesuffix("_grammar")) in grammar_sources:
+        return get_grammar(grammar)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class FormatTransformer(lark.Transformer):
@@ -284,11 +308,11 @@ class GetElementTransformer(lark.Transformer):
 
 
 def format(query: str) -> str:
-    return FormatTransformer().transform(format_grammar.parse(query))
+    return FormatTransformer().transform(get_grammar("format").parse(query))
 
 
 def get_element_value(element: ifcopenshell.entity_instance, query: str) -> Any:
-    keys: list[str] = GetElementTransformer().transform(get_element_grammar.parse(query))
+    keys: list[str] = GetElementTransformer().transform(get_grammar("get_element").parse(query))
     return _get_element_value(element, keys)
 
 
@@ -419,6 +443,52 @@ def _get_element_value(element: ifcopenshell.entity_instance, keys: list[str]) -
     return value
 
 
+def get_element_values(elements: Iterable[ifcopenshell.entity_instance], queries: list[str]) -> list[list[Any]]:
+    """Gets the values of many queries for many elements
+
+    This is equivalent to calling :func:`get_element_value` for every element
+    and query, but each query is only parsed once, and when several queries
+    start with the same key (such as the same property set, or ``type``) that
+    key is only resolved once per element.
+
+    :param elements: The elements to get values from.
+    :param queries: The queries, using the same syntax as
+        :func:`get_element_value`.
+    :return: One list of values per query (i.e. columns), each with a value
+        for every element in order.
+
+    Example:
+
+    .. code:: python
+
+        names, fire_ratings, is_externals = ifcopenshell.util.selector.get_element_values(
+            walls, ["Name", "Pset_WallCommon.FireRating", "Pset_WallCommon.IsExternal"]
+        )
+    """
+    parsed_queries = [GetElementTransformer().transform(get_grammar("get_element").parse(q)) for q in queries]
+    shared_keys: dict[str, list[int]] = {}
+    unshared_queries: list[int] = []
+    for i, keys in enumerate(parsed_queries):
+        if len(keys) > 1 and isinstance(keys[0], str):
+            shared_keys.setdefault(keys[0], []).append(i)
+        else:
+            unshared_queries.append(i)
+    for key, indices in list(shared_keys.items()):
+        if len(indices) == 1:
+            unshared_queries.extend(indices)
+            del shared_keys[key]
+
+    results: list[list[Any]] = [[] for _ in queries]
+    for element in elements:
+        for i in unshared_queries:
+            results[i].append(_get_element_value(element, parsed_queries[i]))
+        for key, indices in shared_keys.items():
+            value = _get_element_value(element, [key])
+            for i in indices:
+                results[i].append(None if value is None else _get_element_value(value, parsed_queries[i][1:]))
+    return results
+
+
 def filter_elements(
     ifc_file: ifcopenshell.file,
     query: str,
@@ -458,10 +528,78 @@ def filter_elements(
     if elements and not edit_in_place:
         elements = elements.copy()
     transformer = FacetTransformer(ifc_file, elements)
-    transformer.transform(filter_elements_grammar.parse(query))
+    transformer.transform(get_grammar("filter_elements").parse(query))
     return transformer.get_results()
 
 
+def process_pset_prop_value(
+    ifc_file: ifcopenshell.file,
+    pset: ifcopenshell.entity_instance,
+    prop: str,
+    value: Any,
+    current_value: Any,
+    concat: str = ", ",
+) -> Union[Any, EllipsisType]:
+    """Try to process value for edit_pset.
+
+    `edit_pset` is expecting a sequence of values
+    for enum properties, not just a string of some-symbol-separated values.
+
+    Return `...` if property can be skipped as it has the same value.
+    """
+    if not isinstance(value, str):
+        return value
+
+    # Check if previous value is a list as a fast way to identify enum properties.
+    if not isinstance(current_value, (EllipsisType, list)):
+        return value
+
+    if isinstance(current_value, list):
+        # Value won't change, safe to skip editing IFC.
+        enum_values = value.split(concat)
+        if len(enum_values) == len(current_value) and set(enum_values) == set(current_value):
+            return ...
+
+    template = ifcopenshell.util.pset.get_template(ifc_file.schema)
+    pset_template = template.get_by_name(pset.Name)
+    if pset_template is None:
+        return value
+    for prop_template in pset_template.HasPropertyTemplates:
+        # 2 IfcSimplePropertyTemplate.Name
+        if prop_template[2] != prop:
+            continue
+
+        # 4 IfcSimplePropertyTemplate.TemplateType
+        if prop_template[4] != "P_ENUMERATEDVALUE":
+            # Not a enum property.
+            return value
+
+        # 7 IfcSimplePropertyTemplate.Enumerators
+        if (enumeration := prop_template[7]) is None:
+            # Enum property but without enumerators,
+            # make it a sequence to keep it assignable as a enum.
+            return (value,)
+
+        # 1 IfcPropertyEnumeration.EnumerationValues
+        available_enum_values = {v.wrappedValue for v in enumeration[1]}
+        if value in available_enum_values:
+            # Valid enum item, just keep it a sequence.
+            return (value,)
+
+        # Taking a wild guess that it's `concat` separated list.
+        enum_values = value.split(concat)
+        if not all(v in available_enum_values for v in enum_values):
+            raise Exception(
+                "Error setting pset enum property.\n"
+                f"Invalid enum values for property '{prop} in pset '{pset}': '{', '.join(enum_values)}'.\n"
+                f"Possible enum values for this property: {', '.join(available_enum_values)}."
+            )
+        return enum_values
+
+    # Couldn't find property template for this prop - delegate decision to edit_pset.
+    return value
+
+
 class SetElementValueException(Exception): ...
 
 
@@ -490,7 +628,7 @@ def set_element_value(
     if isinstance(query, (list, tuple)):
         keys = query
     else:
-        keys = GetElementTransformer().transform(get_element_grammar.parse(query))
+        keys = GetElementTransformer().transform(get_grammar("get_element").parse(query))
 
     for i, key in enumerate(keys):
         if element is None:
@@ -661,71 +799,7 @@ def set_element_value(
                         elif pset.is_a("IfcElementQuantity") and prop_value != float(value):
                             ifcopenshell.api.pset.edit_qto(ifc_file, qto=pset, properties={prop: float(value)})
             elif pset.is_a("IfcPropertySet") and element.get(key, None) != value:
-
-                def process_pset_prop_value(
-                    pset: ifcopenshell.entity_instance, prop: str, value: Any
-                ) -> Union[Any, EllipsisType]:
-                    """Try to process value for edit_pset.
-
-                    `edit_pset` is expecting a sequence of values
-                    for enum properties, not just a string of some-symbol-separated values.
-
-                    Return `...` if property can be skipped as it has the same value.
-                    """
-                    if not isinstance(value, str):
-                        return value
-
-                    current_value = element.get(key, ...)
-                    # Check if previous value is a list as a fast way to identify enum properties.
-                    if not isinstance(current_value, (EllipsisType, list)):
-                        return value
-
-                    if isinstance(current_value, list):
-                        # Value won't change, safe to skip editing IFC.
-                        enum_values = value.split(concat)
-                        if len(enum_values) == len(current_value) and set(enum_values) == set(current_value):
-                            return ...
-
-                    template = ifcopenshell.util.pset.get_template(ifc_file.schema)
-                    pset_template = template.get_by_name(pset.Name)
-                    if pset_template is None:
-                        return value
-                    for prop_template in pset_template.HasPropertyTemplates:
-                        # 2 IfcSimplePropertyTemplate.Name
-                        if prop_template[2] != prop:
-                            continue
-
-                        # 4 IfcSimplePropertyTemplate.TemplateType
-                        if prop_template[4] != "P_ENUMERATEDVALUE":
-                            # Not a enum property.
-                            return value
-
-                        # 7 IfcSimplePropertyTemplate.Enumerators
-                        if (enumeration := prop_template[7]) is None:
-                            # Enum property but without enumerators,
-                            # make it a sequence to keep it assignable as a enum.
-                            return (value,)
-
-                        # 1 IfcPropertyEnumeration.EnumerationValues
-                        available_enum_values = {v.wrappedValue for v in enumeration[1]}
-                        if value in available_enum_values:
-                            # Valid enum item, just keep it a sequence.
-                            return (value,)
-
-                        # Taking a wild guess that it's `concat` separated list.
-                        enum_values = value.split(concat)
-                        if not all(v in available_enum_values for v in enum_values):
-                            raise Exception(
-                                "Error setting pset enum property.\n"
-                                f"Invalid enum values for property '{prop} in pset '{pset}': '{', '.join(enum_values)}'.\n"
-                                f"Possible enum values for this property: {', '.join(available_enum_values)}."
-                            )
-                        return enum_values
-
-                    # Couldn't find property template for this prop - delegate decision to edit_pset.
-                    return value
-
-                value = process_pset_prop_value(pset, key, value)
+                value = process_pset_prop_value(ifc_file, pset, key, value, element.get(key, ...), concat)
                 if value == ...:
                     return
                 ifcopenshell.api.pset.edit_pset(ifc_file, pset=pset, properties={key: value})
@@ -753,6 +827,118 @@ def set_element_value(
     )
 
 
+# Keys which are not treated as property or quantity set names by set_element_value
+SET_ELEMENT_VALUE_KEYWORDS = {
+    "type",
+    "material",
+    "mat",
+    "materials",
+    "mats",
+    "styles",
+    "item",
+    "i",
+    "container",
+    "space",
+    "storey",
+    "building",
+    "site",
+    "parent",
+    "class",
+    "id",
+    "predefined_type",
+    "classification",
+    "x",
+    "y",
+    "z",
+    "easting",
+    "northing",
+    "elevation",
+}
+
+
+def set_element_values(
+    ifc_file: ifcopenshell.file,
+    element: ifcopenshell.entity_instance,
+    values: dict[Union[str, tuple[str, ...]], Any],
+    *,
+    concat: str = ", ",
+) -> None:
+    """Set many values of an element based on the provided queries.
+
+    This is equivalent to calling :func:`set_element_value` for each query
+    and value, except that properties (such as ``Pset_WallCommon.FireRating``)
+    of the same property or quantity set are read once and edited with a
+    single API call. Unchanged properties are not edited.
+
+    :param element: IFC element to change.
+    :param values: A dictionary of queries (or tuples of already parsed keys)
+        and the values to set.
+    :param concat: Concatenation symbol, used only to deserialize property
+        set enum values from string values.
+
+    Example:
+
+    .. code:: python
+
+        ifcopenshell.util.selector.set_element_values(ifc_file, wall, {
+            "Name": "Foo",
+            "Pset_WallCommon.FireRating": "2HR",
+            "Pset_WallCommon.IsExternal": True,
+        })
+    """
+    pset_values: dict[str, dict[str, Any]] = {}
+    for query, value in values.items():
+        if isinstance(query, tuple):
+            keys = list(query)
+        else:
+            keys = GetElementTransformer().transform(get_grammar("get_element").parse(query))
+        if (
+            len(keys) == 2
+            and isinstance(keys[0], str)
+            and isinstance(keys[1], str)
+            and keys[0] not in SET_ELEMENT_VALUE_KEYWORDS
+            and getattr(element, keys[0], ...) is ...
+        ):
+            pset_values.setdefault(keys[0], {})[keys[1]] = value
+        else:
+            set_element_value(ifc_file, element, keys, value, concat=concat)
+
+    for pset_name, properties in pset_values.items():
+        current_values = ifcopenshell.util.element.get_pset(element, pset_name)
+        if current_values:
+            pset = ifc_file.by_id(current_values["id"])
+        elif any(properties.values()):
+            name = pset_name.lower()
+            if "qto" in name or "quantity" in name or "quantities" in name:
+                pset = ifcopenshell.api.pset.add_qto(ifc_file, product=element, name=pset_name)
+            else:
+                pset = ifcopenshell.api.pset.add_pset(ifc_file, product=element, name=pset_name)
+            current_values = {}
+        else:
+            continue
+
+        edited_properties = {}
+        if pset.is_a("IfcPropertySet"):
+            for prop, value in properties.items():
+                if current_values.get(prop, None) == value:
+                    continue
+                value = process_pset_prop_value(ifc_file, pset, prop, value, current_values.get(prop, ...), concat)
+                if value is not ...:
+                    edited_properties[prop] = value
+            if edited_properties:
+                ifcopenshell.api.pset.edit_pset(ifc_file, pset=pset, properties=edited_properties)
+        elif pset.is_a("IfcElementQuantity"):
+            for prop, value in properties.items():
+                try:
+                    value = float(value)
+                except:
+                    continue
+                if current_values.get(prop, None) != value:
+                    edited_properties[prop] = value
+            if edited_properties:
+                ifcopenshell.api.pset.edit_qto(ifc_file, qto=pset, properties=edited_properties)
+
+
 class FacetTransformer(lark.Transformer):
     results: list[set[ifcopenshell.entity_instance]]
     base_elements: Optional[set[ifcopenshell.entity_instance]]
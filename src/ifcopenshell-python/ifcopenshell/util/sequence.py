@@ -19,10 +19,11 @@
 import datetime
 import ifcopenshell.util.date
 from math import floor
+from bisect import bisect_left, bisect_right
 from functools import lru_cache
+from itertools import accumulate
 from typing import Union, Literal, Optional, Iterator
 
-
 DURATION_TYPE = Literal["ELAPSEDTIME", "WORKTIME", "NOTDEFINED"]
 RECURRENCE_TYPE = Literal[
     "BY_DAY_COUNT",
@@ -35,6 +36,9 @@ RECURRENCE_TYPE = Literal[
     "YEARLY_BY_POSITION",
 ]
 
+# Working calendars, compiled on demand by get_working_calendar
+working_calendars: dict[ifcopenshell.entity_instance, "WorkingCalendar"] = {}
+
 
 def derive_date(
     task: ifcopenshell.entity_instance,
@@ -92,18 +96,11 @@ def get_calendar(task: ifcopenshell.entity_instance) -> Union[ifcopenshell.entit
 
 
 def count_working_days(start, finish, calendar: ifcopenshell.entity_instance) -> int:
-    result = 0
     if start == finish:
         return 0
-    current_date = datetime.date(start.year, start.month, start.day)
-    finish_date = datetime.date(finish.year, finish.month, finish.day)
-    while current_date <= finish_date:
-        if calendar and calendar.WorkingTimes and is_working_day(current_date, calendar):
-            result += 1
-        elif not calendar or not is_calendar_applicable(current_date, calendar):
-            result += 1
-        current_date += datetime.timedelta(days=1)
-    return result
+    if not calendar or not calendar.WorkingTimes:
+        return max((finish.toordinal() - start.toordinal()) + 1, 0)
+    return get_working_calendar(calendar).count_working_days(start, finish)
 
 
 def get_start_or_finish_date(
@@ -131,43 +128,178 @@ def get_start_or_finish_date(
 
 
 def offset_date(start, duration, duration_type: DURATION_TYPE, calendar: ifcopenshell.entity_instance):
-    current_date = start
     months = getattr(duration, "months", 0)
     years = getattr(duration, "years", 0)
 
     abs_duration = abs((duration.days + months * 30 + years * 12 * 30))
-    date_offset = datetime.timedelta(days=1 if duration.days > 0 else -1)
-    while abs_duration > 0:
-        if duration_type == "ELAPSEDTIME" or not is_calendar_applicable(current_date, calendar):
-            abs_duration -= 1
-        elif is_working_day(current_date, calendar):
-            abs_duration -= 1
-        current_date += date_offset
-    if duration.days > 0:
-        current_date = get_soonest_working_day(current_date, duration_type, calendar)
-    else:
-        current_date = get_recent_working_day(current_date, duration_type, calendar)
-    return current_date
+    if duration_type == "ELAPSEDTIME" or not calendar or not calendar.WorkingTimes:
+        return start + datetime.timedelta(days=abs_duration if duration.days > 0 else -abs_duration)
+    return get_working_calendar(calendar).offset_date(start, abs_duration if duration.days > 0 else -abs_duration)
 
 
 def get_soonest_working_day(start, duration_type: DURATION_TYPE, calendar: ifcopenshell.entity_instance):
-    if duration_type == "ELAPSEDTIME" or not is_calendar_applicable(start, calendar):
+    if duration_type == "ELAPSEDTIME" or not calendar or not calendar.WorkingTimes:
         return start
-    while not is_working_day(start, calendar):
-        if not is_calendar_applicable(start, calendar):
-            break
-        start += datetime.timedelta(days=1)
-    return start
+    return get_working_calendar(calendar).get_soonest_working_day(start)
 
 
 def get_recent_working_day(start, duration_type: DURATION_TYPE, calendar: ifcopenshell.entity_instance):
-    if duration_type == "ELAPSEDTIME" or not is_calendar_applicable(start, calendar):
+    if duration_type == "ELAPSEDTIME" or not calendar or not calendar.WorkingTimes:
         return start
-    while not is_working_day(start, calendar):
-        if not is_calendar_applicable(start, calendar):
-            break
-        start -= datetime.timedelta(days=1)
-    return start
+    return get_working_calendar(calendar).get_recent_working_day(start)
+
+
+def get_working_calendar(
+    calendar: ifcopenshell.entity_instance,
+    start: Optional[datetime.date] = None,
+    finish: Optional[datetime.date] = None,
+) -> "WorkingCalendar":
+    """Gets the compiled working days of a calendar
+
+    Working calendars are cached, and are compiled over a range of dates
+    which grows as dates outside of it are queried. If the date range of a
+    schedule is known, it may be provided to compile it in one go.
+
+    If a calendar, its work times, or its recurrence patterns are edited,
+    :func:`clear_calendar_cache` must be called. This is done automatically
+    by the sequence API.
+
+    :param calendar: The IfcWorkCalendar.
+    :param start: The first date the calendar should cover, if known.
+    :param finish: The last date the calendar should cover, if known.
+    :return: The compiled working calendar.
+    """
+    working_calendar = working_calendars.get(calendar)
+    if working_calendar is None:
+        working_calendar = working_calendars[calendar] = WorkingCalendar(calendar)
+    if start and finish:
+        working_calendar.expand(start.toordinal(), finish.toordinal())
+    return working_calendar
+
+
+def clear_calendar_cache() -> None:
+    """Clears cached working days, to be called whenever a calendar is edited"""
+    working_calendars.clear()
+    is_working_day.cache_clear()
+    is_calendar_applicable.cache_clear()
+
+
+class WorkingCalendar:
+    """The working days of a calendar, compiled into lookup tables
+
+    Checking whether a single day is a working day requires testing it
+    against every work time and recurrence pattern in the calendar. Instead,
+    each day in a range of dates is checked once, and a running count of
+    days which consume a duration is stored. These are working days, and
+    days which are not covered by any of the calendar's working times.
+
+    Counting working days between two dates is then a subtraction, and
+    offsetting a date by a number of working days is a binary search.
+    """
+
+    # How many days to extend the range by when a date outside of it is queried
+    padding = 366
+    # How far to search for a working day before assuming there are none
+    max_search_days = 3660
+
+    def __init__(self, calendar: ifcopenshell.entity_instance):
+        self.calendar = calendar
+        self.first = 0  # The ordinal of the first day in the range
+        self.working = bytearray()
+        self.applicable = bytearray()
+        self.counts = [0]  # counts[i] is the number of counted days before the ith day
+
+    @property
+    def last(self) -> int:
+        return self.first + len(self.working) - 1
+
+    def expand(self, first: int, last: int) -> None:
+        if not self.working:
+            self.first = first - self.padding
+            self.working, self.applicable = self.evaluate(range(self.first, last + self.padding + 1))
+        elif first >= self.first and last <= self.last:
+            return
+        else:
+            if first < self.first:
+                working, applicable = self.evaluate(range(first - self.padding, self.first))
+                self.working[:0] = working
+                self.applicable[:0] = applicable
+                self.first = first - self.padding
+            if last > self.last:
+                working, applicable = self.evaluate(range(self.last + 1, last + self.padding + 1))
+                self.working.extend(working)
+                self.applicable.extend(applicable)
+        self.counts = [0, *accumulate(1 if w or not a else 0 for w, a in zip(self.working, self.applicable))]
+
+    def evaluate(self, ordinals: range) -> tuple[bytearray, bytearray]:
+        working = bytearray(len(ordinals))
+        applicable = bytearray(len(ordinals))
+        for i, ordinal in enumerate(ordinals):
+            day = datetime.date.fromordinal(ordinal)
+            # Bypass the caches, since each day is only evaluated once
+            if is_calendar_applicable.__wrapped__(day, self.calendar):
+                applicable[i] = 1
+                working[i] = is_working_day.__wrapped__(day, self.calendar)
+        return working, applicable
+
+    def is_working_day(self, day) -> bool:
+        ordinal = day.toordinal()
+        self.expand(ordinal, ordinal)
+        return bool(self.working[ordinal - self.first])
+
+    def count_working_days(self, start, finish) -> int:
+        """Counts days in an inclusive range which are working days or not covered by the calendar"""
+        first, last = start.toordinal(), finish.toordinal()
+        if last < first:
+            return 0
+        self.expand(first, last)
+        return self.counts[last - self.first + 1] - self.counts[first - self.first]
+
+    def offset_date(self, start, days: int):
+        """Offsets a date by a number of working days
+
+        The offset is counted from the start date itself. The result is moved
+        forwards to the next working day if the offset is positive, otherwise
+        backwards to the most recent working day.
+        """
+        ordinal = start.toordinal()
+        if days > 0:
+            result = self.get_next_counted_day(self.get_next_counted_day(ordinal, days) + 1)
+        elif days < 0:
+            result = self.get_previous_counted_day(self.get_previous_counted_day(ordinal, -days) - 1)
+        else:
+            result = self.get_previous_counted_day(ordinal)
+        return start + datetime.timedelta(days=result - ordinal)
+
+    def get_soonest_working_day(self, start):
+        return start + datetime.timedelta(days=self.get_next_counted_day(start.toordinal()) - start.toordinal())
+
+    def get_recent_working_day(self, start):
+        return start + datetime.timedelta(days=self.get_previous_counted_day(start.toordinal()) - start.toordinal())
+
+    def get_next_counted_day(self, ordinal: int, n: int = 1) -> int:
+        """Gets the ordinal of the nth counted day on or after a day"""
+        self.expand(ordinal, ordinal)
+        while True:
+            target = self.counts[ordinal - self.first] + n
+            if self.counts[-1] >= target:
+                return self.first + bisect_left(self.counts, target) - 1
+            if self.last - ordinal > self.max_search_days + n:
+                raise ValueError(f"No working days found after {datetime.date.fromordinal(ordinal)} in {self.calendar}")
+            self.expand(ordinal, self.last + 1)
+
+    def get_previous_counted_day(self, ordinal: int, n: int = 1) -> int:
+        """Gets the ordinal of the nth counted day on or before a day"""
+        self.expand(ordinal, ordinal)
+        while True:
+            target = self.counts[ordinal - self.first + 1] - n
+            if target >= 0:
+                return self.first + bisect_right(self.counts, target) - 1
+            if ordinal - self.first > self.max_search_days + n:
+                raise ValueError(
+                    f"No working days found before {datetime.date.fromordinal(ordinal)} in {self.calendar}"
+                )
+            self.expand(self.first - 1, ordinal)
 
 
 @lru_cache(maxsize=None)
@@ -26,8 +26,8 @@ import ifcopenshell.util.placement
 import ifcopenshell.util.representation
 from ifcopenshell.util.shape_builder import VectorType
 from math import radians, cos
-from ifcopenshell.geom import ShapeElementType, ShapeType
-from typing import Optional, Literal, Union, Iterable
+from ifcopenshell.geom import InstanceRecord, ShapeElementType, ShapeType
+from typing import NamedTuple, Optional, Literal, Union, Iterable
 
 tol = 1e-6
 AXIS_LITERAL = Literal["X", "Y", "Z"]
@@ -139,10 +139,11 @@ def get_min_xyz(geometry: ShapeType) -> float:
     return min(get_x(geometry), get_y(geometry), get_z(geometry))
 
 
-def get_shape_matrix(shape: ShapeElementType) -> MatrixType:
+def get_shape_matrix(shape: Union[ShapeElementType, InstanceRecord]) -> MatrixType:
     """Formats the transformation matrix of a shape as a 4x4 numpy array
 
-    :param shape: Shape output calculated by IfcOpenShell
+    :param shape: Shape output calculated by IfcOpenShell, or an instance
+        record yielded by ``ifcopenshell.geom.iterator.iter_instances``
     :return: A 4x4 numpy array representing the transformation matrix
     """
     return np.frombuffer(shape.transformation_buffer, "d").reshape((4, 4), order="F")
@@ -345,6 +346,115 @@ def get_element_vertices(element: ifcopenshell.entity_instance, geometry: ShapeT
     return np.delete((mat @ np.hstack((verts, np.ones((len(verts), 1)))).T).T, -1, axis=1)
 
 
+class ShapesMesh(NamedTuple):
+    """Concatenated world space meshes of many shapes
+
+    The vertices of the i-th shape are ``verts[vert_offsets[i]:vert_offsets[i + 1]]``
+    and its faces are ``faces[face_offsets[i]:face_offsets[i + 1]]``.
+    """
+
+    #: IDs of the elements of each shape.
+    ids: npt.NDArray[np.int32]
+    #: Geometry ID of each shape. Shapes with the same geometry ID are instances of one geometry.
+    geometry_ids: list[str]
+    #: World space vertices. Array shape: (n, 3).
+    verts: npt.NDArray[np.float64]
+    #: Faces, indexing into verts. Array shape: (m, 3).
+    faces: npt.NDArray[np.int32]
+    #: Index into materials for each face, or -1 if a face has no material. Array shape: (m,).
+    material_ids: npt.NDArray[np.int32]
+    #: Material styles, see get_shape_material_styles. Styles are listed once per unique geometry.
+    materials: list[W.style]
+    #: Offsets into verts for each shape. Array shape: (k + 1,).
+    vert_offsets: npt.NDArray[np.int64]
+    #: Offsets into faces and material_ids for each shape. Array shape: (k + 1,).
+    face_offsets: npt.NDArray[np.int64]
+
+
+def get_shapes_mesh(shapes: Iterable[ShapeElementType]) -> ShapesMesh:
+    """Get the world space meshes of many shapes, concatenated into single arrays
+
+    This is equivalent to calling ``get_shape_vertices``, ``get_faces``, and
+    ``get_faces_material_style_ids`` for each shape, but vertices are
+    transformed in one vectorised pass per unique geometry. The buffers of
+    geometry shared by multiple shapes (i.e. instances with the same
+    ``shape.geometry.id``) are only read once, and all instances are
+    transformed from that shared source buffer.
+
+    :param shapes: Shapes calculated by IfcOpenShell, such as an
+        ``ifcopenshell.geom.iterator`` or a list of shapes.
+    :return: The concatenated meshes and the offsets of each shape within them.
+
+    Example:
+
+    .. code:: python
+
+        iterator = ifcopenshell.geom.iterator(settings, model, multiprocessing.cpu_count())
+        mesh = ifcopenshell.util.shape.get_shapes_mesh(iterator)
+        for i, element_id in enumerate(mesh.ids):
+            verts = mesh.verts[mesh.vert_offsets[i] : mesh.vert_offsets[i + 1]]
+    """
+    ids = []
+    geometry_ids = []
+    matrices = []
+    instances: dict[str, list[int]] = {}  # Geometry ID to the positions of shapes
+    sources: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}  # Geometry ID to verts, faces, material IDs
+    materials = []
+    for i, shape in enumerate(shapes):
+        geometry = shape.geometry
+        ids.append(shape.id)
+        geometry_ids.append(geometry.id)
+        matrices.append(shape.transformation_buffer)
+        if (positions := instances.get(geometry.id)) is not None:
+            positions.append(i)
+            continue
+        instances[geometry.id] = [i]
+        material_ids = get_faces_material_style_ids(geometry)
+        # Offset material IDs into the list of materials of all geometries, keeping -1 for no material
+        material_ids = np.where(material_ids == -1, -1, material_ids + len(materials)).astype(np.int32)
+        materials.extend(get_shape_material_styles(geometry))
+        sources[geometry.id] = (get_vertices(geometry), get_faces(geometry), material_ids)
+
+    n = len(ids)
+    vert_counts = np.zeros(n, dtype=np.int64)
+    face_counts = np.zeros(n, dtype=np.int64)
+    for geometry_id, positions in instances.items():
+        verts, faces, _ = sources[geometry_id]
+        vert_counts[positions] = len(verts)
+        face_counts[positions] = len(faces)
+    vert_offsets = np.zeros(n + 1, dtype=np.int64)
+    face_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(vert_counts, out=vert_offsets[1:])
+    np.cumsum(face_counts, out=face_offsets[1:])
+
+    all_matrices = np.frombuffer(b"".join(matrices), "d").reshape((-1, 4, 4)).transpose((0, 2, 1))
+    all_verts = np.empty((vert_offsets[-1], 3), dtype=np.float64)
+    all_faces = np.empty((face_offsets[-1], 3), dtype=np.int32)
+    all_material_ids = np.empty(face_offsets[-1], dtype=np.int32)
+    for geometry_id, positions in instances.items():
+        verts, faces, material_ids = sources[geometry_id]
+        positions = np.array(positions)
+        matrix = all_matrices[positions]
+        # (instances, verts, xyz), i.e. every instance transformed from the same source vertices
+        world_verts = np.einsum("kij,nj->kni", matrix[:, :3, :3], verts) + matrix[:, None, :3, 3]
+        vert_indices = vert_offsets[positions][:, None] + np.arange(len(verts))
+        all_verts[vert_indices] = world_verts
+        face_indices = face_offsets[positions][:, None] + np.arange(len(faces))
+        all_faces[face_indices] = faces[None] + vert_offsets[positions][:, None, None]
+        all_material_ids[face_indices] = material_ids
+
+    return ShapesMesh(
+        ids=np.array(ids, dtype=np.int32),
+        geometry_ids=geometry_ids,
+        verts=all_verts,
+        faces=all_faces,
+        material_ids=all_material_ids,
+        materials=materials,
+        vert_offsets=vert_offsets,
+        face_offsets=face_offsets,
+    )
+
+
 def get_bottom_elevation(geometry: ShapeType) -> float:
     """Gets the lowest local Z ordinate of the geometry
 
@@ -28,7 +28,7 @@ import ifcopenshell.util.placement
 import ifcopenshell.util.representation
 import ifcopenshell.util.unit
 from math import cos, sin, pi, tan, radians, degrees, atan, sqrt
-from typing import Union, Optional, Literal, Any, Sequence, TYPE_CHECKING
+from typing import Union, Optional, Literal, Any, Sequence, Iterator, TYPE_CHECKING
 from itertools import chain
 
 PRECISION = 1.0e-5
@@ -86,6 +86,69 @@ def np_round_to_precision(v: np.ndarray, si_conversion: float) -> np.ndarray:
     return np.round(v * si_conversion, 5) / si_conversion
 
 
+def flatten_faces(faces: Union[Sequence[Sequence[int]], np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert faces to a flat array of point indices and an array of face sizes
+
+    :param faces: A 2D array of faces with the same number of points, such as
+        triangles, or a sequence of faces with any number of points.
+    :return: The point indices of all faces, and the number of points in each face.
+    """
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        return faces.astype(np.int64).ravel(), np.full(len(faces), faces.shape[1], dtype=np.int64)
+    sizes = np.fromiter((len(f) for f in faces), dtype=np.int64, count=len(faces))
+    indices = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=int(sizes.sum()))
+    return indices, sizes
+
+
+def deduplicate_mesh(
+    points: np.ndarray, indices: np.ndarray, sizes: np.ndarray, tolerance: float = PRECISION
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge coincident points of a mesh
+
+    Faces which have less than 3 distinct points once consecutive duplicate
+    points are merged are removed.
+
+    :param points: An array of 3D points.
+    :param indices: The point indices of all faces, see :func:`flatten_faces`.
+    :param sizes: The number of points in each face.
+    :param tolerance: Points which round to the same multiple of the
+        tolerance are merged.
+    :return: The merged points, point indices and face sizes.
+    """
+    keys = np.round(points / tolerance).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    points = points[first]
+    indices = inverse.ravel()[indices]
+
+    face_ids = np.repeat(np.arange(len(sizes)), sizes)
+    starts = np.cumsum(sizes) - sizes
+    is_last = np.zeros(len(indices), dtype=bool)
+    is_last[np.cumsum(sizes)[sizes > 0] - 1] = True
+    next_indices = np.where(is_last, indices[starts[face_ids]], np.roll(indices, -1))
+    is_kept = indices != next_indices
+    new_sizes = np.bincount(face_ids[is_kept], minlength=len(sizes))
+    is_kept &= (new_sizes >= 3)[face_ids]
+    return points, indices[is_kept], new_sizes[new_sizes >= 3]
+
+
+def split_mesh(
+    points: np.ndarray, indices: np.ndarray, sizes: np.ndarray, max_faces: int
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Split a mesh into chunks of faces, each with only the points they use
+
+    :param points: An array of 3D points.
+    :param indices: The point indices of all faces, see :func:`flatten_faces`.
+    :param sizes: The number of points in each face.
+    :param max_faces: The maximum number of faces in each chunk.
+    :return: A generator of the points, point indices and face sizes of each chunk.
+    """
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    for start in range(0, len(sizes), max_faces):
+        end = min(start + max_faces, len(sizes))
+        used, chunk_indices = np.unique(indices[offsets[start] : offsets[end]], return_inverse=True)
+        yield points[used], chunk_indices.ravel(), sizes[start:end]
+
+
 def np_normalized(v: VectorType) -> np.ndarray:
     return np.divide(v, np.linalg.norm(v))
 
@@ -1318,7 +1381,10 @@ class ShapeBuilder:
         :return: IfcTriangulatedFaceSet
         """
         ifc_points = self.file.createIfcCartesianPointList3D(ifc_safe_vector_type(points))
-        ifc_faces = [[i + 1 for i in face][:3] for face in faces]
+        if isinstance(faces, np.ndarray):
+            ifc_faces = (faces[:, :3].astype(np.int64) + 1).tolist()
+        else:
+            ifc_faces = [[i + 1 for i in face][:3] for face in faces]
         return self.file.createIfcTriangulatedFaceSet(Coordinates=ifc_points, CoordIndex=ifc_faces)
 
     def polygonal_face_set(
@@ -1337,6 +1403,68 @@ class ShapeBuilder:
         ifc_faces = [self.file.createIfcIndexedPolygonalFace([i + 1 for i in face]) for face in faces]
         return self.file.createIfcPolygonalFaceSet(Coordinates=ifc_points, Faces=ifc_faces)
 
+    def face_sets(
+        self,
+        points: SequenceOfVectors,
+        faces: Union[Sequence[Sequence[int]], np.ndarray],
+        deduplicate: bool = False,
+        max_faces: Optional[int] = None,
+        force_polygonal: bool = False,
+        tolerance: float = PRECISION,
+    ) -> list[ifcopenshell.entity_instance]:
+        """
+        Generate face sets for a large mesh
+
+        Points and faces are processed as arrays, so this is suitable for
+        meshes with millions of faces, such as scans. If all faces are
+        triangles, an IfcTriangulatedFaceSet is created, which only requires
+        a few entities regardless of the number of faces. Otherwise, an
+        IfcPolygonalFaceSet is created.
+
+        Note that this is not available in IFC2X3.
+
+        :param points: Array of 3d coordinates
+        :param faces: Array of triangles, or a list of faces consisted of
+            point indices (points indices starting from 0)
+        :param deduplicate: If True, coincident points are merged, and faces
+            which collapse as a result are removed.
+        :param max_faces: If provided, the mesh is split into face sets with
+            at most this many faces, each with only the points it uses.
+        :param force_polygonal: If True, an IfcPolygonalFaceSet is created
+            even if all faces are triangles.
+        :param tolerance: Points which round to the same multiple of the
+            tolerance are merged when deduplicating.
+        :return: List of IfcTriangulatedFaceSet or IfcPolygonalFaceSet. Face
+            sets require at least one face, so this is empty if the mesh has
+            no faces, such as when every face collapses when deduplicating.
+        """
+        points = np.asarray(points, dtype="d")
+        indices, sizes = flatten_faces(faces)
+        if deduplicate:
+            points, indices, sizes = deduplicate_mesh(points, indices, sizes, tolerance)
+        if max_faces and len(sizes) > max_faces:
+            chunks = split_mesh(points, indices, sizes, max_faces)
+        else:
+            chunks = [(points, indices, sizes)]
+
+        face_sets = []
+        for chunk_points, chunk_indices, chunk_sizes in chunks:
+            if not len(chunk_sizes):
+                continue
+            ifc_points = self.file.createIfcCartesianPointList3D(chunk_points.tolist())
+            if not force_polygonal and (chunk_sizes == 3).all():
+                ifc_faces = (chunk_indices.reshape(-1, 3) + 1).tolist()
+                face_sets.append(self.file.createIfcTriangulatedFaceSet(Coordinates=ifc_points, CoordIndex=ifc_faces))
+                continue
+            ifc_indices = (chunk_indices + 1).tolist()
+            offsets = np.concatenate(([0], np.cumsum(chunk_sizes))).tolist()
+            ifc_faces = [
+                self.file.createIfcIndexedPolygonalFace(ifc_indices[start:end])
+                for start, end in zip(offsets[:-1], offsets[1:])
+            ]
+            face_sets.append(self.file.createIfcPolygonalFaceSet(Coordinates=ifc_points, Faces=ifc_faces))
+        return face_sets
+
     def extrude_face_set(
         self,
         points: SequenceOfVectors,
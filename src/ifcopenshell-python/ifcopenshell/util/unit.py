@@ -17,6 +17,7 @@
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
 from fractions import Fraction
+from functools import lru_cache
 from math import pi
 from typing import Any
 from typing import Dict
@@ -803,23 +804,36 @@ def is_attr_type(
     return None
 
 
+@lru_cache(maxsize=None)
+def get_attributes_per_type(
+    schema_identifier: str, ifc_class: str, attr_type_name: str
+) -> tuple[tuple[int, ifcopenshell_wrapper.attribute], ...]:
+    """Gets the attributes of a class which may hold values of a type
+
+    This includes attributes which are aggregates of the type, or selects
+    which include the type. Results are cached, so the declared types of
+    each class are only resolved once.
+
+    :param schema_identifier: The schema, such as "IFC4".
+    :param ifc_class: The name of the class, such as "IfcCartesianPoint".
+    :param attr_type_name: The name of the type, such as "IfcLengthMeasure".
+    :return: The index and attribute of each matching attribute.
+    """
+    schema = ifcopenshell_wrapper.schema_by_name(schema_identifier)
+    entity = schema.declaration_by_name(ifc_class)
+    return tuple(
+        (i, attr)
+        for i, (attr, is_derived) in enumerate(zip(entity.all_attributes(), entity.derived()))
+        if not is_derived and is_attr_type(attr.type_of_attribute(), attr_type_name) is not None
+    )
+
+
 def iter_element_and_attributes_per_type(
     ifc_file: ifcopenshell.file, attr_type_name: str
 ) -> Iterable[tuple[ifcopenshell.entity_instance, ifcopenshell_wrapper.attribute, Any]]:
-    schema: ifcopenshell_wrapper.schema_definition = ifcopenshell_wrapper.schema_by_name(ifc_file.schema_identifier)
-
     for element in ifc_file:
-        entity = schema.declaration_by_name(element.is_a())
-        attrs = entity.all_attributes()
-        for attr, val, is_derived in zip(attrs, list(element), entity.derived()):
-            if is_derived:
-                continue
-
-            # Get all methods and attributes of the element
-            attr_type = attr.type_of_attribute()
-            base_type = is_attr_type(attr_type, attr_type_name)
-            if base_type is None:
-                continue
+        for i, attr in get_attributes_per_type(ifc_file.schema_identifier, element.is_a(), attr_type_name):
+            val = element[i]
 
             if val is None:
                 continue
@@ -830,8 +844,23 @@ def iter_element_and_attributes_per_type(
             yield element, attr, val
 
 
-def convert_file_length_units(ifc_file: ifcopenshell.file, target_units: str = "METER") -> ifcopenshell.file:
-    """Converts all units in an IFC file to the specified target units. Returns a new file."""
+def convert_file_length_units(
+    ifc_file: ifcopenshell.file, target_units: str = "METER", in_place: bool = False
+) -> ifcopenshell.file:
+    """Converts all length units in an IFC file to the specified target units
+
+    Every length measure in the file is scaled by the same factor, including
+    those in selects (such as property values) and aggregates (such as point
+    lists). Point lists are scaled as arrays.
+
+    :param ifc_file: The IFC file to convert.
+    :param target_units: A singular unit name, such as "CENTIMETER", "METER"
+        or "FOOT".
+    :param in_place: Whether to convert the file itself. Otherwise, the file
+        is left untouched and a converted copy is returned.
+    :return: The converted file.
+    """
+    import numpy as np
     import ifcopenshell.util.element
     import ifcopenshell.util.geolocation
     import ifcopenshell.api.georeference
@@ -839,37 +868,15 @@ def convert_file_length_units(ifc_file: ifcopenshell.file, target_units: str = "
 
     prefix = get_prefix(target_units)
     si_unit = get_unit_name(target_units)
-
-    # Copy all elements from the original file to the patched file
-    file_patched = ifcopenshell.file.from_string(ifc_file.wrapped_data.to_string())
-
-    old_length = get_project_unit(file_patched, "LENGTHUNIT")
-    if si_unit:
-        new_length = ifcopenshell.api.unit.add_si_unit(file_patched, unit_type="LENGTHUNIT", prefix=prefix)
-    else:
+    if not si_unit:
         target_units = target_units.lower()
         if imperial_types.get(target_units) != "LENGTHUNIT":
             raise Exception(
                 f'Couldn\'t identify target units "{target_units}". '
                 'The method supports singular unit names like "CENTIMETER", "METER", "FOOT", etc.'
             )
-        new_length = ifcopenshell.api.unit.add_conversion_based_unit(file_patched, name=target_units)
-
-    # support tuple of tuples, as in IfcCartesianPointList3D.CoordList
-    def convert_value(value):
-        if not isinstance(value, tuple):
-            return convert_unit(value, old_length, new_length)
-        return tuple(convert_value(v) for v in value)
-
-    # Traverse all elements and their nested attributes in the file and convert them
-    for element, attr, val in iter_element_and_attributes_per_type(file_patched, "IfcLengthMeasure"):
-        if isinstance(val, ifcopenshell.entity_instance):
-            new_value = convert_value(val.wrappedValue)
-            getattr(element, attr.name()).wrappedValue = new_value
-        else:
-            new_value = convert_value(val)
-            setattr(element, attr.name(), new_value)
 
+    # Georeferencing is read before any lengths in the file are converted
     has_map_unit = False
     if (
         ifc_file.schema == "IFC2X3"
@@ -877,16 +884,60 @@ def convert_file_length_units(ifc_file: ifcopenshell.file, target_units: str = "
         and crs.get("MapUnit")
     ) or (ifc_file.schema != "IFC2X3" and (crs := ifc_file.by_type("IfcProjectedCRS")) and crs[0].MapUnit):
         has_map_unit = True
+        parameters = ifcopenshell.util.geolocation.get_helmert_transformation_parameters(ifc_file)
+
+    if in_place:
+        file_patched = ifc_file
+    else:
+        file_patched = ifcopenshell.file.from_string(ifc_file.wrapped_data.to_string())
+
+    old_length = get_project_unit(file_patched, "LENGTHUNIT")
+    factor = convert(1.0, getattr(old_length, "Prefix", None), old_length.Name, prefix, si_unit or target_units)
+
+    def convert_value(value):
+        if isinstance(value, tuple):
+            if value and isinstance(value[0], ifcopenshell.entity_instance):
+                return None  # Aggregates of selects are rebuilt separately
+            try:
+                return np.multiply(value, factor).tolist()
+            except ValueError:  # Ragged aggregates of aggregates
+                return [convert_value(v) for v in value]
+        return value * factor
+
+    # Aggregates of selects need new instances, which shouldn't be created while iterating
+    select_aggregates = []
+    schema_identifier = file_patched.schema_identifier
+    for element in file_patched:
+        for i, _ in get_attributes_per_type(schema_identifier, element.is_a(), "IfcLengthMeasure"):
+            if (value := element[i]) is None:
+                continue
+            if isinstance(value, ifcopenshell.entity_instance):
+                if value.is_a("IfcLengthMeasure"):
+                    value.wrappedValue = value.wrappedValue * factor
+            elif (new_value := convert_value(value)) is not None:
+                element[i] = new_value
+            elif any(v.is_a("IfcLengthMeasure") for v in value):
+                select_aggregates.append((element, i, value))
+
+    for element, i, value in select_aggregates:
+        element[i] = [
+            file_patched.create_entity("IfcLengthMeasure", v.wrappedValue * factor) if v.is_a("IfcLengthMeasure") else v
+            for v in value
+        ]
+
+    if si_unit:
+        new_length = ifcopenshell.api.unit.add_si_unit(file_patched, unit_type="LENGTHUNIT", prefix=prefix)
+    else:
+        new_length = ifcopenshell.api.unit.add_conversion_based_unit(file_patched, name=target_units)
 
     if has_map_unit:
-        parameters = ifcopenshell.util.geolocation.get_helmert_transformation_parameters(ifc_file)
         ifcopenshell.api.georeference.edit_georeferencing(
             file_patched,
             coordinate_operation={
                 "Eastings": parameters.e,
                 "Northings": parameters.n,
                 "OrthogonalHeight": parameters.h,
-                "Scale": parameters.scale / convert_value(1),
+                "Scale": parameters.scale / factor,
             },
         )
 
@@ -0,0 +1,130 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2025 Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+import test.bootstrap
+import ifcopenshell.api.context
+import ifcopenshell.api.geometry
+import ifcopenshell.api.root
+
+
+class TestAddMeshRepresentation(test.bootstrap.IFC4):
+    def setup_context(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        return ifcopenshell.api.context.add_context(self.file, context_type="Model")
+
+    def test_adding_a_polygonal_face_set(self):
+        context = self.setup_context()
+        vertices = [[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]]
+        faces = [[[0, 1, 2, 3]]]
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file, context=context, vertices=vertices, faces=faces, unit_scale=1.0
+        )
+        assert rep.RepresentationType == "Tessellation"
+        (item,) = rep.Items
+        assert item.is_a("IfcPolygonalFaceSet")
+        assert item.Coordinates.CoordList == ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0))
+        assert [f.CoordIndex for f in item.Faces] == [(1, 2, 3, 4)]
+
+    def test_scaling_and_offsetting_coordinates(self):
+        context = self.setup_context()
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file,
+            context=context,
+            vertices=[[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)]],
+            faces=[[[0, 1, 2]]],
+            cooridnate_offset=(10.0, 20.0, 30.0),
+            unit_scale=0.001,
+        )
+        coords = rep.Items[0].Coordinates.CoordList
+        assert coords == ((10.0, 20.0, 30.0), (1010.0, 20.0, 30.0), (1010.0, 1020.0, 30.0))
+
+    def test_offsetting_the_coordinates_of_a_faceted_brep(self):
+        context = self.setup_context()
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file,
+            context=context,
+            vertices=[[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)]],
+            faces=[[[0, 1, 2]]],
+            cooridnate_offset=(10.0, 20.0, 30.0),
+            unit_scale=1.0,
+            force_faceted_brep=True,
+        )
+        assert rep.RepresentationType == "Brep"
+        (face,) = rep.Items[0].Outer.CfsFaces
+        points = [p.Coordinates for p in face.Bounds[0].Bound.Polygon]
+        assert points == [(10.0, 20.0, 30.0), (11.0, 20.0, 30.0), (11.0, 21.0, 30.0)]
+
+    def test_adding_a_triangulated_face_set(self):
+        context = self.setup_context()
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file,
+            context=context,
+            vertices=[[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]],
+            faces=[[[0, 1, 2], [0, 2, 3]]],
+            unit_scale=1.0,
+            triangulated=True,
+        )
+        (item,) = rep.Items
+        assert item.is_a("IfcTriangulatedFaceSet")
+        assert item.CoordIndex == ((1, 2, 3), (1, 3, 4))
+
+    def test_keeping_a_polygonal_face_set_for_polygons_even_if_triangulated(self):
+        context = self.setup_context()
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file,
+            context=context,
+            vertices=[[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]],
+            faces=[[[0, 1, 2, 3]]],
+            unit_scale=1.0,
+            triangulated=True,
+        )
+        assert rep.Items[0].is_a("IfcPolygonalFaceSet")
+
+    def test_deduplicating_vertices(self):
+        context = self.setup_context()
+        # A triangle soup, where each triangle has its own vertices
+        vertices = [
+            [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+        ]
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file,
+            context=context,
+            vertices=vertices,
+            faces=[[[0, 1, 2], [3, 4, 5]]],
+            unit_scale=1.0,
+            triangulated=True,
+            deduplicate=True,
+        )
+        (item,) = rep.Items
+        assert len(item.Coordinates.CoordList) == 4
+        assert len(item.CoordIndex) == 2
+
+    def test_splitting_items_with_many_faces(self):
+        context = self.setup_context()
+        rep = ifcopenshell.api.geometry.add_mesh_representation(
+            self.file,
+            context=context,
+            vertices=[[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]],
+            faces=[[[0, 1, 2], [0, 2, 3], [0, 3, 4]]],
+            unit_scale=1.0,
+            triangulated=True,
+            max_faces=2,
+        )
+        assert len(rep.Items) == 2
+        assert [len(item.CoordIndex) for item in rep.Items] == [2, 1]
+        assert [len(item.Coordinates.CoordList) for item in rep.Items] == [4, 3]
@@ -19,6 +19,7 @@
 import datetime
 import test.bootstrap
 import ifcopenshell.api.sequence
+import ifcopenshell.util.sequence
 
 
 # NOTE: IfcWorkTime was introduced in IFC4
@@ -42,6 +43,23 @@ class TestEditWorkTime(test.bootstrap.IFC4):
         assert work_time[4] == "2020-01-01"
         assert work_time[5] == "2020-02-01"
 
+    def test_clearing_compiled_working_calendars(self):
+        calendar = self.file.createIfcWorkCalendar()
+        work_time = ifcopenshell.api.sequence.add_work_time(self.file, work_calendar=calendar, time_type="WorkingTimes")
+        pattern = ifcopenshell.api.sequence.assign_recurrence_pattern(
+            self.file, parent=work_time, recurrence_type="WEEKLY"
+        )
+        ifcopenshell.api.sequence.edit_recurrence_pattern(
+            self.file, recurrence_pattern=pattern, attributes={"WeekdayComponent": [1, 2, 3, 4, 5]}
+        )
+        start, finish = datetime.date(2020, 1, 1), datetime.date(2020, 1, 7)
+        assert ifcopenshell.util.sequence.count_working_days(start, finish, calendar) == 5
+        ifcopenshell.api.sequence.edit_work_time(
+            self.file, work_time=work_time, attributes={"Finish": datetime.date(2020, 1, 3)}
+        )
+        # Days after the work time are no longer restricted to weekdays
+        assert ifcopenshell.util.sequence.count_working_days(start, finish, calendar) == 7
+
 
 class TestEditWorkTimeIFC4X3(test.bootstrap.IFC4X3):
     def test_run(self):
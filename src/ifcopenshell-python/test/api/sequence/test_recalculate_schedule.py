@@ -44,8 +44,10 @@ class TestRecalculateSchedule(test.bootstrap.IFC4):
         self._create_sequence(task2, task3, "FINISH_START")
         with pytest.raises(RecursionError):
             self._create_sequence(task3, task2, "FINISH_START")
-        with pytest.raises(RecursionError):
+        with pytest.raises(RecursionError) as e:
             ifcopenshell.api.sequence.recalculate_schedule(self.file, work_schedule=self.work_schedule)
+        assert f"#{task2.id()}" in str(e.value)
+        assert f"#{task3.id()}" in str(e.value)
 
     def test_recalculating_for_a_single_task(self):
         self._add_work_schedule()
@@ -0,0 +1,79 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Thomas Krijnen <thomas@aecgeeks.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares entity_instance attribute access against the legacy schema
+lookups per access.
+
+Usage: python test/benchmarks/entity_instance.py [number of accesses]
+"""
+
+import sys
+import timeit
+import ifcopenshell
+import ifcopenshell.api.root
+import ifcopenshell.api.project
+from ifcopenshell import entity_instance, ifcopenshell_wrapper, settings
+from ifcopenshell.entity_instance import _method_dict, set_derived_attribute
+
+# ----------------------------------------------------------------
+# ORIGINAL IMPLEMENTATION
+# ----------------------------------------------------------------
+
+# NOTE: written as in legacy code, without the derived attribute fallback
+
+
+def legacy_getattr(self, name):
+    INVALID, FORWARD, INVERSE = range(3)
+    attr_cat = self.wrapped_data.get_attribute_category(name)
+    if attr_cat == FORWARD:
+        idx = self.wrapped_data.get_argument_index(name)
+        if _method_dict[self.is_a(True)][idx] != set_derived_attribute:
+            return entity_instance.wrap_value(self.wrapped_data.get_argument(idx), self.wrapped_data.file)
+    elif attr_cat == INVERSE:
+        vs = entity_instance.wrap_value(self.wrapped_data.get_inverse(name), self.wrapped_data.file)
+        if settings.unpack_non_aggregate_inverses:
+            schema_name = self.wrapped_data.is_a(True).split(".")[0]
+            ent = ifcopenshell_wrapper.schema_by_name(schema_name).declaration_by_name(self.is_a())
+            inv = [i for i in ent.all_inverse_attributes() if i.name() == name][0]
+            if (inv.bound1(), inv.bound2()) == (-1, -1):
+                if vs:
+                    vs = vs[0]
+                else:
+                    vs = None
+        return vs
+
+
+# ----------------------------------------------------------------
+# BENCHMARK
+# ----------------------------------------------------------------
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    model = ifcopenshell.api.project.create_file()
+    wall = ifcopenshell.api.root.create_entity(model, ifc_class="IfcWall", name="Wall")
+
+    for unpack in (False, True):
+        settings.unpack_non_aggregate_inverses = unpack
+        for name in ("Name", "GlobalId", "IsDefinedBy", "ContainedInStructure"):
+            legacy = timeit.timeit(lambda: legacy_getattr(wall, name), number=n)
+            current = timeit.timeit(lambda: getattr(wall, name), number=n)
+            print(
+                f"{name:>20} (unpack={unpack!s:>5}): "
+                f"legacy {legacy / n * 1e6:.2f}us, current {current / n * 1e6:.2f}us, {legacy / current:.1f}x"
+            )
+    settings.unpack_non_aggregate_inverses = False
@@ -0,0 +1,129 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Thomas Krijnen <thomas@aecgeeks.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares generating, compressing, expanding and validating GUIDs one at a
+time using the legacy methods, one at a time using ifcopenshell.guid, and in
+batches using ifcopenshell.guid.
+
+Usage: python test/benchmarks/guid.py [number of GUIDs]
+"""
+
+from __future__ import annotations
+import re
+import sys
+import time
+import string
+from base64 import b64decode, b64encode
+from typing import Callable
+from uuid import uuid4
+import ifcopenshell.guid
+
+# ----------------------------------------------------------------
+# ORIGINAL IMPLEMENTATION
+# ----------------------------------------------------------------
+
+# NOTE: written exactly as in legacy code
+
+_CHARS64_STD = string.ascii_uppercase + string.ascii_lowercase + string.digits + "+/"
+_CHARS64_IFC = string.digits + string.ascii_uppercase + string.ascii_lowercase + "_$"
+_TRANS_IFC_TO_STD = str.maketrans(_CHARS64_IFC, _CHARS64_STD)
+_TRANS_STD_TO_IFC = str.maketrans(_CHARS64_STD, _CHARS64_IFC)
+
+
+def legacy_compress(uuid: str, /) -> str:
+    uuid = uuid.lower()
+    uuid = re.sub(pattern=r"\W", repl="", string=uuid)
+    uuid = "0000" + uuid
+    uuid_bytes = bytes.fromhex(uuid)
+    guid = b64encode(uuid_bytes).decode()
+    guid = guid[2:]
+    guid = guid.translate(_TRANS_STD_TO_IFC)
+    return guid
+
+
+def legacy_expand(guid: str, /) -> str:
+    guid = guid.translate(_TRANS_IFC_TO_STD)
+    guid = "AA" + guid
+    uuid = b64decode(guid).hex()
+    uuid = uuid[4:]
+    return uuid
+
+
+def legacy_new() -> str:
+    uuid = uuid4().hex
+    guid = legacy_compress(uuid)
+    return guid
+
+
+def legacy_validate(guid: str) -> bool:
+    if len(guid) != 22 or guid[0] not in "0123":
+        return False
+    try:
+        legacy_expand(guid)
+    except:
+        return False
+    return True
+
+
+# ----------------------------------------------------------------
+# BENCHMARK
+# ----------------------------------------------------------------
+
+
+def measure(callable: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    callable()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    uuids = [uuid4() for _ in range(n)]
+    hexes = [uuid.hex for uuid in uuids]
+    raw = b"".join(uuid.bytes for uuid in uuids)
+    guids = ifcopenshell.guid.compress_many(raw)
+    assert guids == [legacy_compress(h) for h in hexes[:1000]] + guids[1000:]
+    assert ifcopenshell.guid.expand_many(guids) == hexes
+
+    print(f"{n} GUIDs")
+    results = {
+        "new": (
+            lambda: [legacy_new() for _ in range(n)],
+            lambda: [ifcopenshell.guid.new() for _ in range(n)],
+            lambda: ifcopenshell.guid.new_many(n),
+        ),
+        "compress": (
+            lambda: [legacy_compress(h) for h in hexes],
+            lambda: [ifcopenshell.guid.compress(h) for h in hexes],
+            lambda: ifcopenshell.guid.compress_many(raw),
+        ),
+        "expand": (
+            lambda: [legacy_expand(g) for g in guids],
+            lambda: [ifcopenshell.guid.expand(g) for g in guids],
+            lambda: ifcopenshell.guid.expand_many(guids),
+        ),
+        "validate": (
+            lambda: [legacy_validate(g) for g in guids],
+            None,
+            lambda: ifcopenshell.guid.validate_many(guids),
+        ),
+    }
+    print(f"{'':>8}  {'legacy':>8}  {'single':>8}  {'batch':>8}")
+    for name, (legacy, single, batch) in results.items():
+        durations = [f"{measure(f):7.2f}s" if f else f"{'-':>8}" for f in (legacy, single, batch)]
+        print(f"{name:>8}: {'  '.join(durations)}")
@@ -0,0 +1,82 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Thomas Krijnen <thomas@aecgeeks.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the time to import ifcopenshell and commonly used submodules,
+each in a fresh interpreter, and checks that optional dependencies are only
+imported when they are used.
+
+Exits with a non-zero status if importing ifcopenshell takes longer than the
+given number of seconds, so it may be used as a regression check.
+
+Usage: python test/benchmarks/imports.py [max seconds to import ifcopenshell]
+"""
+
+from __future__ import annotations
+import sys
+import json
+import subprocess
+
+STATEMENTS = [
+    "import ifcopenshell",
+    "import ifcopenshell.guid",
+    "import ifcopenshell.util.element",
+    "import ifcopenshell.util.selector",
+    "import ifcopenshell.util.selector; ifcopenshell.util.selector.get_grammar('filter_elements')",
+    "import ifcopenshell.api",
+    "import ifcopenshell.geom",
+]
+
+# Modules which should not be imported by a plain "import ifcopenshell"
+DEFERRED_MODULES = ["sqlite3", "lark", "ifcopenshell.sql", "ifcopenshell.stream", "ifcopenshell.util.selector"]
+
+SCRIPT = """
+import sys, json, time
+start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - start
+print(json.dumps({{"duration": duration, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str, repeat: int = 5) -> tuple[float, list[str]]:
+    durations = []
+    modules = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", SCRIPT.format(statement=statement)], text=True)
+        result = json.loads(output.splitlines()[-1])
+        durations.append(result["duration"])
+        modules = result["modules"]
+    return min(durations), modules
+
+
+if __name__ == "__main__":
+    max_duration = float(sys.argv[1]) if len(sys.argv) > 1 else None
+    base_duration = None
+    for statement in STATEMENTS:
+        duration, modules = measure(statement)
+        if base_duration is None:
+            base_duration = duration
+            deferred = [m for m in DEFERRED_MODULES if m in modules]
+        print(f"{duration * 1000:8.1f}ms {len(modules):5} modules  {statement}")
+
+    if deferred:
+        print(f"Expected these modules to be imported lazily: {', '.join(deferred)}")
+    if max_duration is not None and base_duration > max_duration:
+        print(f"Importing ifcopenshell took {base_duration:.3f}s, longer than {max_duration:.3f}s")
+    if deferred or (max_duration is not None and base_duration > max_duration):
+        sys.exit(1)
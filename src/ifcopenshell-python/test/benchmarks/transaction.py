@@ -0,0 +1,237 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Thomas Krijnen <thomas@aecgeeks.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares the undo journal of ifcopenshell.file.Transaction against the
+legacy dict based journal on a bulk edit.
+
+Usage: python test/benchmarks/transaction.py [number of walls]
+"""
+
+from __future__ import annotations
+import sys
+import time
+import tracemalloc
+from typing import Any
+import ifcopenshell
+import ifcopenshell.api.project
+import ifcopenshell.api.pset
+import ifcopenshell.api.root
+from ifcopenshell import entity_instance
+from ifcopenshell.file import Transaction
+
+# ----------------------------------------------------------------
+# ORIGINAL IMPLEMENTATION
+# ----------------------------------------------------------------
+
+# NOTE: written exactly as in legacy code
+
+
+class LegacyTransaction:
+    def __init__(self, ifc_file: file):
+        self.file: file = ifc_file
+        self.operations = []
+        self.is_batched = False
+        self.batch_delete_index = 0
+        self.batch_delete_ids = set()
+        self.batch_inverses = []
+
+    def serialise_entity_instance(self, element: ifcopenshell.entity_instance) -> dict[str, Any]:
+        info = element.get_info()
+        for key, value in info.items():
+            info[key] = self.serialise_value(element, value)
+        return info
+
+    def serialise_value(self, element, value):
+        return element.walk(
+            lambda v: isinstance(v, entity_instance),
+            lambda v: {"id": v.id()} if v.id() else {"type": v.is_a(), "value": v.wrappedValue},
+            value,
+        )
+
+    def unserialise_value(self, element, value):
+        return element.walk(
+            lambda v: isinstance(v, dict),
+            lambda v: self.file.by_id(v["id"]) if v.get("id") else self.file.create_entity(v["type"], v["value"]),
+            value,
+        )
+
+    def batch(self) -> None:
+        self.is_batched = True
+        self.batch_delete_index = len(self.operations)
+        self.batch_delete_ids = set()
+        self.batch_inverses = []
+
+    def unbatch(self) -> None:
+        for inverses in self.batch_inverses:
+            if inverses:
+                self.operations.insert(self.batch_delete_index, {"action": "batch_delete", "inverses": inverses})
+        self.is_batched = False
+        self.batch_delete_index = 0
+        self.batch_delete_ids = set()
+        self.batch_inverses = []
+
+    def store_create(self, element: ifcopenshell.entity_instance) -> None:
+        if element.id():
+            self.operations.append({"action": "create", "value": self.serialise_entity_instance(element)})
+
+    def store_edit(self, element: ifcopenshell.entity_instance, index: int, value: Any) -> None:
+        if element.id():
+            self.operations.append(
+                {
+                    "action": "edit",
+                    "id": element.id(),
+                    "index": index,
+                    "old": self.serialise_value(element, element[index]),
+                    "new": self.serialise_value(element, value),
+                }
+            )
+
+    def store_delete(self, element: ifcopenshell.entity_instance) -> None:
+        inverses = {}
+        if self.is_batched:
+            if element.id() not in self.batch_delete_ids:
+                self.batch_inverses.append(self.get_element_inverses(element))
+            self.batch_delete_ids.add(element.id())
+        else:
+            inverses = self.get_element_inverses(element)
+        self.operations.append(
+            {"action": "delete", "inverses": inverses, "value": self.serialise_entity_instance(element)}
+        )
+
+    def get_element_inverses(self, element):
+        inverses = {}
+        for inverse in self.file.get_inverse(element):
+            inverse_references = []
+            for i, attribute in enumerate(inverse):
+                if self.has_element_reference(attribute, element):
+                    inverse_references.append((i, self.serialise_value(inverse, attribute)))
+            inverses[inverse.id()] = inverse_references
+        return inverses
+
+    def has_element_reference(self, value: Any, element: ifcopenshell.entity_instance) -> bool:
+        if isinstance(value, (tuple, list)):
+            for v in value:
+                if self.has_element_reference(v, element):
+                    return True
+            return False
+        return value == element
+
+    def rollback(self) -> None:
+        for operation in self.operations[::-1]:
+            if operation["action"] == "create":
+                element = self.file.by_id(operation["value"]["id"])
+                if hasattr(element, "GlobalId") and element.GlobalId is None:
+                    # hack, otherwise ifcopenshell gets upset
+                    element.GlobalId = "x"
+                self.file.remove(element)
+            elif operation["action"] == "edit":
+                element = self.file.by_id(operation["id"])
+                try:
+                    element[operation["index"]] = self.unserialise_value(element, operation["old"])
+                except:
+                    # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
+                    pass
+            elif operation["action"] == "delete":
+                e = self.file.create_entity(operation["value"]["type"], id=operation["value"]["id"])
+                for k, v in operation["value"].items():
+                    try:
+                        setattr(e, k, self.unserialise_value(e, v))
+                    except:
+                        # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
+                        pass
+                for inverse_id, data in operation["inverses"].items():
+                    inverse = self.file.by_id(inverse_id)
+                    for index, value in data:
+                        inverse[index] = self.unserialise_value(inverse, value)
+            elif operation["action"] == "batch_delete":
+                for inverse_id, data in operation["inverses"].items():
+                    inverse = self.file.by_id(inverse_id)
+                    for index, value in data:
+                        inverse[index] = self.unserialise_value(inverse, value)
+
+    def commit(self) -> None:
+        for operation in self.operations:
+            if operation["action"] == "create":
+                e = self.file.create_entity(operation["value"]["type"], id=operation["value"]["id"])
+                for k, v in operation["value"].items():
+                    try:
+                        setattr(e, k, self.unserialise_value(e, v))
+                    except:
+                        # Catch discrepancy where IfcOpenShell creates but doesn't allow editing of invalid values
+                        pass
+            elif operation["action"] == "edit":
+                element = self.file.by_id(operation["id"])
+                element[operation["index"]] = self.unserialise_value(element, operation["new"])
+            elif operation["action"] == "delete":
+                element = self.file.by_id(operation["value"]["id"])
+                self.file.remove(element)
+            elif operation["action"] == "batch_delete":
+                pass
+
+
+# ----------------------------------------------------------------
+# BENCHMARK
+# ----------------------------------------------------------------
+
+
+def create_model(n: int) -> ifcopenshell.file:
+    model = ifcopenshell.api.project.create_file()
+    for i in range(n):
+        wall = ifcopenshell.api.root.create_entity(model, ifc_class="IfcWall", name=f"Wall {i}")
+        pset = ifcopenshell.api.pset.add_pset(model, product=wall, name="Pset_WallCommon")
+        ifcopenshell.api.pset.edit_pset(model, pset=pset, properties={"IsExternal": False, "Reference": "W"})
+    return model
+
+
+def bulk_edit(model: ifcopenshell.file) -> None:
+    for pset in model.by_type("IfcPropertySet"):
+        ifcopenshell.api.pset.edit_pset(model, pset=pset, properties={"IsExternal": True, "Reference": "X"})
+    walls = model.by_type("IfcWall")
+    for wall in walls:
+        wall.Description = "Edited"
+    model.batch()
+    for wall in walls[::2]:
+        model.remove(wall)
+    model.unbatch()
+
+
+def run(transaction_class: type, n: int) -> tuple[float, int, float]:
+    model = create_model(n)
+    tracemalloc.start()
+    start = time.perf_counter()
+    model.transaction = transaction_class(model)
+    bulk_edit(model)
+    transaction = model.transaction
+    model.transaction = None
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    transaction.rollback()
+    rollback_duration = time.perf_counter() - start
+    return duration, peak, rollback_duration
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"Bulk edit of {n} walls")
+    for name, transaction_class in (("legacy", LegacyTransaction), ("journal", Transaction)):
+        duration, peak, rollback_duration = run(transaction_class, n)
+        print(
+            f"{name:>8}: record {duration:.2f}s, peak {peak / 1024 / 1024:.1f} MiB, rollback {rollback_duration:.2f}s"
+        )
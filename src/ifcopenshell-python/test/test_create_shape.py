@@ -1,10 +1,13 @@
 import pytest
 import test.bootstrap
 import ifcopenshell
+import numpy as np
 import ifcopenshell.api.context
+import ifcopenshell.api.geometry
 import ifcopenshell.api.owner.settings
 import ifcopenshell.api.project
 import ifcopenshell.api.root
+import ifcopenshell.api.type
 import ifcopenshell.api.unit
 import ifcopenshell.geom
 import ifcopenshell.ifcopenshell_wrapper as W
@@ -181,6 +184,69 @@ class TestAssignObject:
         assert len(set(vs)) == 12
 
 
+class TestIterInstances(test.bootstrap.IFC4):
+    def create_elements(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        ifcopenshell.api.unit.assign_unit(self.file)
+        model = ifcopenshell.api.context.add_context(self.file, context_type="Model")
+        body = ifcopenshell.api.context.add_context(
+            self.file, context_type="Model", context_identifier="Body", target_view="MODEL_VIEW", parent=model
+        )
+        builder = ShapeBuilder(self.file)
+
+        # Two walls mapping the geometry of their type
+        wall_type = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWallType")
+        item = builder.extrude(builder.rectangle(size=(1000.0, 200.0)), magnitude=3000.0)
+        representation = builder.get_representation(body, [item])
+        ifcopenshell.api.geometry.assign_representation(self.file, product=wall_type, representation=representation)
+        for x in (0.0, 5.0):
+            wall = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWall")
+            ifcopenshell.api.type.assign_type(self.file, related_objects=[wall], relating_type=wall_type)
+            matrix = np.eye(4)
+            matrix[:3, 3] = (x, 1.0, 0.0)
+            ifcopenshell.api.geometry.edit_object_placement(self.file, product=wall, matrix=matrix)
+
+        # A slab with its own geometry
+        slab = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcSlab")
+        item = builder.extrude(builder.rectangle(size=(2000.0, 2000.0)), magnitude=200.0)
+        representation = builder.get_representation(body, [item])
+        ifcopenshell.api.geometry.assign_representation(self.file, product=slab, representation=representation)
+
+    def test_yielding_each_geometry_once_before_its_instances(self):
+        self.create_elements()
+        settings = ifcopenshell.geom.settings()
+        shapes = {}
+        iterator = ifcopenshell.geom.iterator(settings, self.file)
+        if iterator.initialize():
+            while True:
+                shape = iterator.get()
+                shapes[shape.id] = shape
+                if not iterator.next():
+                    break
+
+        geometry_ids = []
+        records = []
+        iterator = ifcopenshell.geom.iterator(settings, self.file)
+        for item in iterator.iter_instances():
+            if isinstance(item, ifcopenshell.geom.InstanceRecord):
+                assert item.geometry_id in geometry_ids
+                records.append(item)
+            else:
+                geometry_ids.append(item.id)
+
+        assert len(geometry_ids) == len(set(geometry_ids)) == 2
+        assert sorted(r.id for r in records) == sorted(shapes)
+        walls = [r for r in records if self.file.by_id(r.id).is_a("IfcWall")]
+        assert len(walls) == 2
+        assert walls[0].geometry_id == walls[1].geometry_id
+        for record in records:
+            shape = shapes[record.id]
+            assert record.geometry_id == shape.geometry.id
+            matrix = ifcopenshell.util.shape.get_shape_matrix(record)
+            assert np.array_equal(matrix, ifcopenshell.util.shape.get_shape_matrix(shape))
+        assert not np.array_equal(*[ifcopenshell.util.shape.get_shape_matrix(r) for r in walls])
+
+
 if __name__ == "__main__":
     import pytest
 
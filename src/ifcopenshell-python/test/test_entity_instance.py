@@ -67,3 +67,39 @@ class TestGetInfo2(test.bootstrap.IFC4):
             "Outer": {"CfsFaces": None, "type": "IfcClosedShell"},
             "type": "IfcFacetedBrep",
         }
+
+
+class TestGetAttr(test.bootstrap.IFC4):
+    def test_forward_attribute(self):
+        wall = self.file.create_entity("IfcWall", Name="Foo")
+        assert wall.Name == "Foo"
+        assert wall.Description is None
+
+    def test_simple_type_wrapped_value(self):
+        assert self.file.createIfcLabel("Foo").wrappedValue == "Foo"
+
+    def test_inverse_attribute(self):
+        wall = self.file.create_entity("IfcWall")
+        rel = self.file.create_entity("IfcRelContainedInSpatialStructure", RelatedElements=[wall])
+        assert wall.ContainedInStructure == (rel,)
+
+    def test_unpacking_non_aggregate_inverse_attribute(self):
+        layer = self.file.create_entity("IfcMaterialLayer")
+        layer_set = self.file.create_entity("IfcMaterialLayerSet", MaterialLayers=[layer])
+        wall = self.file.create_entity("IfcWall")
+        ifcopenshell.settings.unpack_non_aggregate_inverses = True
+        try:
+            assert layer.ToMaterialLayerSet == layer_set
+            assert self.file.create_entity("IfcMaterialLayer").ToMaterialLayerSet is None
+            assert wall.ContainedInStructure == ()
+        finally:
+            ifcopenshell.settings.unpack_non_aggregate_inverses = False
+        assert layer.ToMaterialLayerSet == (layer_set,)
+
+    def test_derived_attribute(self):
+        point = self.file.create_entity("IfcCartesianPoint", (0.0, 0.0, 0.0))
+        assert point.Dim == 3
+
+    def test_invalid_attribute(self):
+        with pytest.raises(AttributeError):
+            self.file.create_entity("IfcWall").Foo
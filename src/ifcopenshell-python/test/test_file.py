@@ -51,6 +51,18 @@ class TestTransaction(test.bootstrap.IFC4):
         self.file.redo()
         assert element.Name == "bar"
 
+    def test_that_you_can_undo_and_redo_editing_equal_values_of_different_types(self):
+        element = self.file.createIfcPropertySingleValue(Name="foo", NominalValue=self.file.createIfcInteger(1))
+        self.file.begin_transaction()
+        element.NominalValue = self.file.createIfcBoolean(True)
+        element.NominalValue = self.file.createIfcReal(1.0)
+        self.file.end_transaction()
+        self.file.undo()
+        assert element.NominalValue.is_a("IfcInteger")
+        assert element.NominalValue.wrappedValue == 1
+        self.file.redo()
+        assert element.NominalValue.is_a("IfcReal")
+
     def test_that_you_can_undo_and_redo_deletion(self):
         element = self.file.createIfcWall(GlobalId="id")
         self.file.begin_transaction()
@@ -88,6 +100,22 @@ class TestTransaction(test.bootstrap.IFC4):
         self.file.redo()
         assert rel.RelatingObject is None
 
+    def test_that_you_can_undo_and_redo_batched_deletion_of_elements_referencing_each_other(self):
+        element = self.file.createIfcWall(GlobalId="id")
+        rel = self.file.createIfcRelAggregates(GlobalId="rel", RelatingObject=element)
+        rel2 = self.file.createIfcRelAggregates(RelatedObjects=[element])
+        self.file.begin_transaction()
+        self.file.batch()
+        self.file.remove(element)
+        self.file.remove(rel)
+        self.file.unbatch()
+        self.file.end_transaction()
+        self.file.undo()
+        assert self.file.by_id(2).RelatingObject == self.file.by_id(1)
+        assert rel2.RelatedObjects == (self.file.by_id(1),)
+        self.file.redo()
+        assert len(rel2.RelatedObjects) == 0
+
     def test_that_you_can_undo_and_redo_deletion_with_aggregated_inverse_relationships(self):
         element = self.file.createIfcWall(GlobalId="id")
         rel = self.file.createIfcRelAggregates()
@@ -24,11 +24,16 @@ from functools import reduce
 from unittest import TestCase
 from pytest import mark
 from pytest import fixture
+from uuid import UUID
 from uuid import uuid4
 import string
 
 from ifcopenshell.guid import compress
+from ifcopenshell.guid import compress_many
 from ifcopenshell.guid import expand
+from ifcopenshell.guid import expand_many
+from ifcopenshell.guid import new_many
+from ifcopenshell.guid import validate_many
 
 # ----------------------------------------------------------------
 # FIXTURES
@@ -195,3 +200,46 @@ def test_compare_with_legacy_RANDOM(
         uuid_old = legacy_expand(guid_old)
         check.assertEqual(guid, guid_old, "new compression method should yield the same base64 GUID")  # fmt: skip
         check.assertEqual(uuid, uuid_old, "new expansion method should yield the same hex UUID")  # fmt: skip
+
+
+# ----------------------------------------------------------------
+# TESTS - batch methods
+# ----------------------------------------------------------------
+
+
+def test_compress_many_SAME_AS_COMPRESS(
+    # fixtures
+    check: TestCase,
+):
+    uuids = [uuid4() for _ in range(100)] + [UUID(f"{n:0x}" * 32) for n in range(16)]
+    guids = compress_many([uuid.bytes for uuid in uuids])
+    check.assertEqual(guids, [compress(uuid.hex) for uuid in uuids], "batch compression should yield the same base64 GUIDs")  # fmt: skip
+    check.assertEqual(expand_many(guids), [uuid.hex for uuid in uuids], "batch expansion should recover the original UUIDs")  # fmt: skip
+
+
+def test_compress_SEPARATED_AND_UPPERCASE_UUIDS(
+    # fixtures
+    check: TestCase,
+):
+    uuid_orig = uuid4()
+    guid = compress(uuid_orig.hex)
+    check.assertEqual(compress(str(uuid_orig)), guid, "separators should be ignored")  # fmt: skip
+    check.assertEqual(compress(uuid_orig.hex.upper()), guid, "case should be ignored")  # fmt: skip
+
+
+def test_new_many_VERSION_4_UUIDS(
+    # fixtures
+    check: TestCase,
+):
+    guids = new_many(100)
+    check.assertEqual(len(set(guids)), 100, "new GUIDs should be unique")  # fmt: skip
+    check.assertTrue(all(UUID(expand(guid)).version == 4 for guid in guids), "new GUIDs should be version 4 UUIDs")  # fmt: skip
+
+
+def test_validate_many(
+    # fixtures
+    check: TestCase,
+):
+    guid = compress(uuid4().hex)
+    guids = [guid, "4" + guid[1:], guid[:21], guid + "0", guid[:21] + "!", guid[:21] + "\u00e9"]
+    check.assertEqual(validate_many(guids).tolist(), [True, False, False, False, False, False], "only 22 base 64 digits starting with 0-3 are valid")  # fmt: skip
@@ -16,9 +16,11 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 from pathlib import Path
 import pytest
 import ifcopenshell
+import ifcopenshell.model_cache
 
 
 TEST_FILE_DIR = Path("../../test/input/")
@@ -67,3 +69,41 @@ class TestOpen:
     def test_invalid_ifcxml(self):
         with pytest.raises(IOError):
             assert ifcopenshell.open(TEST_FILE_DIR / "invalid.ifcxml")
+
+
+class TestOpenMany:
+    def test_opening_many_files_in_order(self):
+        paths = [TEST_FILE_DIR / "WallInstance_IFC4Add2.ifc", TEST_FILE_DIR / "WallInstance_IFC4Add2_ifcspf_format.zip"]
+        models = ifcopenshell.open_many(paths, workers=2)
+        assert len(models) == 2
+        assert all(model.by_type("IfcWall") for model in models)
+
+    def test_reusing_cached_models(self, tmp_path):
+        path = tmp_path / "model.ifc"
+        ifcopenshell.file().write(path)
+        cache = ifcopenshell.model_cache.ModelCache()
+        assert len(cache) == 0
+        model = ifcopenshell.open_many([path], cache=cache)[0]
+        assert len(cache) == 1
+        models = ifcopenshell.open_many([path, path], cache=cache)
+        assert models[0] is model
+        assert models[1] is model
+
+    def test_reopening_cached_models_after_they_change(self, tmp_path):
+        path = tmp_path / "model.ifc"
+        ifcopenshell.file().write(path)
+        cache = ifcopenshell.model_cache.ModelCache()
+        model = cache.open(path)
+        ifcopenshell.file(schema="IFC2X3").write(path)
+        os.utime(path, ns=(0, 0))
+        assert cache.open(path) is not model
+        assert cache.open(path).schema == "IFC2X3"
+
+    def test_dropping_least_recently_used_models(self, tmp_path):
+        paths = [tmp_path / "a.ifc", tmp_path / "b.ifc"]
+        for path in paths:
+            ifcopenshell.file().write(path)
+        cache = ifcopenshell.model_cache.ModelCache(max_models=1)
+        cache.open_many(paths)
+        assert paths[0] not in cache
+        assert paths[1] in cache
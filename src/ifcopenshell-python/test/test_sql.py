@@ -57,6 +57,27 @@ class TestFile:
         assert (elements := ifc_sqlite.by_type("IfcProject"))
         assert str(elements[0]) == "#1=IFCPROJECT('3kv235yMjDO9tHiTzD8QuS',$,'My Project',$,$,$,$,(#14,#26),#9);"
 
+    def test_by_type_prefetch(self):
+        ifc_sqlite = get_ifc_sqlite()
+        elements = ifc_sqlite.by_type("IfcRoot", prefetch=True)
+        assert elements
+        assert all(e.sqlite_wrapper.attribute_cache for e in elements)
+        assert ifc_sqlite.by_type("IfcProject")[0].Name == "My Project"
+
+    def test_traverse_prefetch(self):
+        ifc_sqlite = get_ifc_sqlite()
+        project = ifc_sqlite.by_id(1)
+        expected = {e.id() for e in ifc_sqlite.traverse(project)}
+        ifc_sqlite.clear_cache()
+        project = ifc_sqlite.by_id(1)
+        assert {e.id() for e in ifc_sqlite.traverse(project, prefetch=True)} == expected
+
+    def test_entity_cache_size(self):
+        ifc_sqlite = ifcopenshell.sqlite(get_ifc_sqlite().filepath, entity_cache_size=2)
+        for i in range(1, 5):
+            ifc_sqlite.by_id(i)
+        assert list(ifc_sqlite.entity_cache.keys()) == [3, 4]
+
 
 class TestEntity:
     def test_getattr(self):
@@ -72,3 +93,43 @@ class TestEntity:
         assert element.Name == "Foo"
         element.Name = "My Project"
         assert element.Name == "My Project"
+
+    def test_getattr_inverse(self):
+        ifc_sqlite = get_ifc_sqlite()
+        assert (element := ifc_sqlite.by_id(1))
+        assert {rel.is_a() for rel in element.IsDecomposedBy} == {"IfcRelAggregates"}
+        assert element.IsDecomposedBy[0] in ifc_sqlite.get_inverse(element)
+
+
+class TestGeometry:
+    def test_get_geometry_returns_arrays(self):
+        import numpy as np
+
+        ifc_sqlite = get_ifc_sqlite()
+        element = ifc_sqlite.by_type("IfcActuator")[0]
+        result = ifc_sqlite.get_geometry([element.id()])
+        geometry_id = result["shapes"][element.id()]["geometry"]
+        assert geometry_id
+        geometry = result["geometry"][geometry_id]
+        assert isinstance(geometry["verts"], np.ndarray)
+        assert isinstance(geometry["faces"], np.ndarray)
+        assert len(geometry["verts"]) and len(geometry["verts"]) % 3 == 0
+        assert result["shapes"][element.id()]["matrix"].shape == (4, 4)
+
+    def test_get_geometry_without_shape(self):
+        import numpy as np
+
+        ifc_sqlite = get_ifc_sqlite()
+        result = ifc_sqlite.get_geometry([1])
+        assert result["shapes"][1]["geometry"] is None
+        assert np.array_equal(result["shapes"][1]["matrix"], np.eye(4))
+
+    def test_iter_geometry(self):
+        ifc_sqlite = get_ifc_sqlite()
+        element = ifc_sqlite.by_type("IfcActuator")[0]
+        chunks = list(ifc_sqlite.iter_geometry(chunk_size=1))
+        shapes = {k: v for chunk in chunks for k, v in chunk["shapes"].items()}
+        geometry = {k: v for chunk in chunks for k, v in chunk["geometry"].items()}
+        assert element.id() in shapes
+        assert shapes[element.id()]["geometry"] in geometry
+        assert all(len(chunk["shapes"]) <= 1 for chunk in chunks)
@@ -0,0 +1,53 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+import ifcopenshell.util.doc as subject
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = tmp_path / "ifc_docs.sqlite"
+    monkeypatch.setattr(subject, "INDEX_PATH", path)
+    subject.clear_db()
+    yield path
+    subject.clear_db()
+
+
+class TestGetDb:
+    def test_loading_only_accessed_data_types(self, index_path):
+        db = subject.get_db("IFC4")
+        assert db["types"]["IfcLabel"]["description"]
+        assert list(db.data_types) == ["types"]
+        assert subject.get_db("IFC4X3") is not db
+
+    def test_using_a_fallback_schema(self, index_path):
+        assert subject.get_db("IFC4X3_ADD2") is subject.get_db("IFC4X3")
+
+    def test_unsupported_schemas(self, index_path):
+        assert subject.get_db("IFC9") is None
+
+    def test_looking_up_from_an_index(self, index_path):
+        expected = dict(subject.get_db("IFC4")["properties"])
+        subject.build_index(index_path)
+        properties = subject.get_db("IFC4")["properties"]
+        assert isinstance(properties, subject.IndexedDocs)
+        assert properties["Pset_WallCommon"] == expected["Pset_WallCommon"]
+        assert properties.get("Pset_Foo") is None
+        assert len(properties) == len(expected)
+        assert subject.get_type_doc("IFC4", "IfcLabel")["description"]
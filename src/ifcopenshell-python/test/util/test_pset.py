@@ -66,3 +66,15 @@ class TestPsetQto:
         assert "Pset_MaterialConcrete" not in names
         names = self.pset_qto.get_applicable_names("IfcMaterial", "concrete")
         assert "Pset_MaterialConcrete" in names
+
+    def test_sharing_template_files_between_instances(self):
+        assert pset.PsetQto("IFC4").templates[0] is self.pset_qto.templates[0]
+
+    def test_saving_and_loading_an_applicability_index(self, tmp_path):
+        template = self.pset_qto.templates[0]
+        names = self.pset_qto.get_applicable_names("IfcWallType", "SHEAR")
+        pset.get_applicability_index(template).save(tmp_path / "index.json")
+        pset.applicability_indices[template] = pset.ApplicabilityIndex.load(tmp_path / "index.json")
+        assert pset.applicability_indices[template].classes
+        assert self.pset_qto.get_applicable_names("IfcWallType", "SHEAR") == names
+        assert self.pset_qto.get_by_name("Pset_WallCommon").Name == "Pset_WallCommon"
@@ -36,6 +36,16 @@ import ifcopenshell.util.pset
 import numpy as np
 
 
+class TestGetGrammar:
+    def test_compiling_a_grammar_once(self):
+        assert subject.get_grammar("format") is subject.get_grammar("format")
+
+    def test_accessing_grammars_as_module_attributes(self):
+        assert subject.filter_elements_grammar is subject.get_grammar("filter_elements")
+        assert subject.get_element_grammar is subject.get_grammar("get_element")
+        assert subject.format_grammar is subject.get_grammar("format")
+
+
 class TestFormat:
     def test_no_formatting(self):
         assert subject.format("123") == "123"
@@ -141,6 +151,23 @@ class TestGetElementValue(test.bootstrap.IFC4):
         assert subject.get_element_value(element, "/Pset_.*Common/.Status.0") == "New"
 
 
+class TestGetElementValues(test.bootstrap.IFC4):
+    def test_run(self):
+        element = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWall", name="Foo")
+        element2 = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcSlab")
+        pset = ifcopenshell.api.pset.add_pset(self.file, product=element, name="Foobar")
+        ifcopenshell.api.pset.edit_pset(self.file, pset=pset, properties={"Foo": "Bar", "Baz": 123})
+        queries = ["class", "Name", "Foobar.Foo", "Foobar.Baz", "Foobar./B.*/", "type.Name"]
+        assert subject.get_element_values([element, element2], queries) == [
+            ["IfcWall", "IfcSlab"],
+            ["Foo", None],
+            ["Bar", None],
+            [123, None],
+            [123, None],
+            [None, None],
+        ]
+
+
 class TestFilterElements(test.bootstrap.IFC4):
     def test_selecting_by_globalid(self):
         element = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWall")
@@ -366,6 +393,35 @@ class TestSetElementValue(test.bootstrap.IFC4):
         assert material.Name == "Foo"
 
 
+class TestSetElementValues(test.bootstrap.IFC4):
+    def test_run(self):
+        element = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWall")
+        pset = ifcopenshell.api.pset.add_pset(self.file, product=element, name="Pset_WallCommon")
+        ifcopenshell.api.pset.edit_pset(self.file, pset=pset, properties={"FireRating": "1HR", "Status": ("NEW",)})
+        subject.set_element_values(
+            self.file,
+            element,
+            {
+                "Name": "Foo",
+                "Pset_WallCommon.FireRating": "2HR",
+                "Pset_WallCommon.IsExternal": True,
+                "Pset_WallCommon.Status": "DEMOLISH, OTHER",
+                "Qto_WallBaseQuantities.Length": "3.5",
+            },
+        )
+        assert element.Name == "Foo"
+        pset_data = ifcopenshell.util.element.get_pset(element, "Pset_WallCommon")
+        assert pset_data["FireRating"] == "2HR"
+        assert pset_data["IsExternal"] is True
+        assert pset_data["Status"] == ["DEMOLISH", "OTHER"]
+        assert ifcopenshell.util.element.get_pset(element, "Qto_WallBaseQuantities")["Length"] == 3.5
+
+    def test_not_adding_psets_without_values(self):
+        element = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWall")
+        subject.set_element_values(self.file, element, {"Foo_Bar.Baz": None, "Foo_Bar.Qux": ""})
+        assert not ifcopenshell.util.element.get_psets(element)
+
+
 class TestSetElementValuePredefinedType(test.bootstrap.IFC4):
     def test_setting_an_element_predefined_type(self):
         element = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWindow")
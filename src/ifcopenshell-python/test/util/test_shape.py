@@ -0,0 +1,102 @@
+# IfcOpenShell - IFC toolkit and geometry engine
+# Copyright (C) 2021 Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcOpenShell.
+#
+# IfcOpenShell is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcOpenShell is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import test.bootstrap
+import ifcopenshell.api.context
+import ifcopenshell.api.geometry
+import ifcopenshell.api.root
+import ifcopenshell.api.type
+import ifcopenshell.api.unit
+import ifcopenshell.geom
+import ifcopenshell.util.shape as subject
+from ifcopenshell.util.shape_builder import ShapeBuilder
+
+
+class TestGetShapesMesh(test.bootstrap.IFC4):
+    def create_elements(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        ifcopenshell.api.unit.assign_unit(self.file)
+        model = ifcopenshell.api.context.add_context(self.file, context_type="Model")
+        body = ifcopenshell.api.context.add_context(
+            self.file, context_type="Model", context_identifier="Body", target_view="MODEL_VIEW", parent=model
+        )
+        builder = ShapeBuilder(self.file)
+
+        # Two walls which are instances of the geometry of their type
+        wall_type = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWallType")
+        item = builder.extrude(builder.rectangle(size=(1000.0, 200.0)), magnitude=3000.0)
+        representation = builder.get_representation(body, [item])
+        ifcopenshell.api.geometry.assign_representation(self.file, product=wall_type, representation=representation)
+        walls = []
+        for x in (0.0, 5.0):
+            wall = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcWall")
+            ifcopenshell.api.type.assign_type(self.file, related_objects=[wall], relating_type=wall_type)
+            matrix = np.eye(4)
+            matrix[:3, 3] = (x, 1.0, 0.0)
+            ifcopenshell.api.geometry.edit_object_placement(self.file, product=wall, matrix=matrix)
+            walls.append(wall)
+
+        # A slab with its own geometry
+        slab = ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcSlab")
+        item = builder.extrude(builder.rectangle(size=(2000.0, 2000.0)), magnitude=200.0)
+        representation = builder.get_representation(body, [item])
+        ifcopenshell.api.geometry.assign_representation(self.file, product=slab, representation=representation)
+        matrix = np.eye(4)
+        matrix[:3, 3] = (0.0, 0.0, 3.0)
+        ifcopenshell.api.geometry.edit_object_placement(self.file, product=slab, matrix=matrix)
+        return walls, slab
+
+    def get_shapes(self):
+        iterator = ifcopenshell.geom.iterator(ifcopenshell.geom.settings(), self.file)
+        shapes = []
+        if iterator.initialize():
+            while True:
+                shapes.append(iterator.get())
+                if not iterator.next():
+                    break
+        return sorted(shapes, key=lambda shape: shape.id)
+
+    def test_run(self):
+        walls, slab = self.create_elements()
+        shapes = self.get_shapes()
+        assert [shape.id for shape in shapes] == [walls[0].id(), walls[1].id(), slab.id()]
+        mesh = subject.get_shapes_mesh(shapes)
+
+        assert mesh.ids.tolist() == [shape.id for shape in shapes]
+        assert mesh.geometry_ids[0] == mesh.geometry_ids[1]
+        assert mesh.geometry_ids[0] != mesh.geometry_ids[2]
+        assert len(mesh.vert_offsets) == len(mesh.face_offsets) == len(shapes) + 1
+        assert mesh.vert_offsets[-1] == len(mesh.verts)
+        assert mesh.face_offsets[-1] == len(mesh.faces)
+        for i, shape in enumerate(shapes):
+            verts = mesh.verts[mesh.vert_offsets[i] : mesh.vert_offsets[i + 1]]
+            faces = mesh.faces[mesh.face_offsets[i] : mesh.face_offsets[i + 1]]
+            assert np.allclose(verts, subject.get_shape_vertices(shape, shape.geometry))
+            assert np.array_equal(faces - mesh.vert_offsets[i], subject.get_faces(shape.geometry))
+        # The instances are transformed from the same geometry, to different places
+        assert not np.allclose(
+            mesh.verts[: mesh.vert_offsets[1]], mesh.verts[mesh.vert_offsets[1] : mesh.vert_offsets[2]]
+        )
+
+    def test_no_shapes(self):
+        mesh = subject.get_shapes_mesh([])
+        assert len(mesh.ids) == 0
+        assert mesh.verts.shape == (0, 3)
+        assert mesh.faces.shape == (0, 3)
+        assert mesh.vert_offsets.tolist() == [0]
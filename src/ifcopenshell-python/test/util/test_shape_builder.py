@@ -136,6 +136,57 @@ class TestRectangle(test.bootstrap.IFC4):
         assert np.allclose(coords, [[3.0, 0.0, 4.0], [4.0, 0.0, 4.0], [4.0, 0.0, 6.0], [3.0, 0.0, 6.0]])
 
 
+class TestFaceSets(test.bootstrap.IFC4):
+    def test_creating_a_triangulated_face_set_from_arrays(self):
+        builder = ShapeBuilder(self.file)
+        points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+        faces = np.array([[0, 1, 2], [0, 2, 3]])
+        (face_set,) = builder.face_sets(points, faces)
+        assert face_set.is_a("IfcTriangulatedFaceSet")
+        assert face_set.Coordinates.CoordList == ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0))
+        assert face_set.CoordIndex == ((1, 2, 3), (1, 3, 4))
+
+    def test_creating_a_polygonal_face_set(self):
+        builder = ShapeBuilder(self.file)
+        points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]])
+        (face_set,) = builder.face_sets(points, [[0, 1, 2, 3], [0, 1, 4]])
+        assert face_set.is_a("IfcPolygonalFaceSet")
+        assert [f.CoordIndex for f in face_set.Faces] == [(1, 2, 3, 4), (1, 2, 5)]
+
+    def test_deduplicating_points(self):
+        builder = ShapeBuilder(self.file)
+        # A triangle soup, with a face which collapses when points are merged
+        points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0], [0, 0, 0]])
+        faces = np.array([[0, 1, 2], [3, 4, 5], [0, 6, 7]])
+        (face_set,) = builder.face_sets(points, faces, deduplicate=True)
+        coords = face_set.Coordinates.CoordList
+        assert len(coords) == 4
+        assert len(face_set.CoordIndex) == 2
+        triangles = [[coords[i - 1] for i in face] for face in face_set.CoordIndex]
+        assert triangles == [
+            [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)],
+            [(0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)],
+        ]
+
+    def test_skipping_meshes_without_faces(self):
+        builder = ShapeBuilder(self.file)
+        assert builder.face_sets(np.zeros((0, 3)), np.zeros((0, 3), dtype=int)) == []
+        points = np.array([[0, 0, 0], [1, 0, 0], [1, 0, 0]])
+        assert builder.face_sets(points, [[0, 1, 2]], deduplicate=True) == []
+        assert len(self.file.by_type("IfcCartesianPointList3D")) == 0
+
+    def test_splitting_into_chunks(self):
+        builder = ShapeBuilder(self.file)
+        points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]])
+        faces = np.array([[0, 1, 2], [0, 2, 3], [0, 3, 4]])
+        face_sets = builder.face_sets(points, faces, max_faces=2)
+        assert len(face_sets) == 2
+        assert face_sets[0].CoordIndex == ((1, 2, 3), (1, 3, 4))
+        assert len(face_sets[0].Coordinates.CoordList) == 4
+        assert face_sets[1].CoordIndex == ((1, 2, 3),)
+        assert face_sets[1].Coordinates.CoordList == ((0.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+
 class TestCreatePolyline(test.bootstrap.IFC4):
     def test_simple_polyline(self):
         builder = ShapeBuilder(self.file)
@@ -237,6 +237,36 @@ class TestConvertFileLengthUnits(test.bootstrap.IFC4):
         output = subject.convert_file_length_units(self.file, target_units="METER")
         assert subject.get_full_unit_name(subject.get_project_unit(output, "LENGTHUNIT")) == "METRE"
 
+    def test_converting_aggregates_and_selects(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        unit = ifcopenshell.api.unit.add_si_unit(self.file, unit_type="LENGTHUNIT", prefix="MILLI")
+        ifcopenshell.api.unit.assign_unit(self.file, units=[unit])
+        self.file.createIfcCartesianPoint((1000.0, 2000.0, 3000.0))
+        self.file.createIfcCartesianPointList3D(((1000.0, 0.0, 0.0), (0.0, 500.0, 0.0)))
+        self.file.createIfcPropertySingleValue("Width", None, self.file.createIfcLengthMeasure(1500.0))
+        self.file.createIfcPropertySingleValue("Label", None, self.file.createIfcLabel("1500"))
+        self.file.createIfcPropertyListValue(
+            "Widths", None, [self.file.createIfcLengthMeasure(100.0), self.file.createIfcLengthMeasure(200.0)]
+        )
+        output = subject.convert_file_length_units(self.file, target_units="METER")
+        assert output.by_type("IfcCartesianPoint")[0].Coordinates == (1.0, 2.0, 3.0)
+        assert output.by_type("IfcCartesianPointList3D")[0].CoordList == ((1.0, 0.0, 0.0), (0.0, 0.5, 0.0))
+        values = {p.Name: p for p in output.by_type("IfcSimpleProperty")}
+        assert values["Width"].NominalValue.wrappedValue == 1.5
+        assert values["Label"].NominalValue.wrappedValue == "1500"
+        assert [v.wrappedValue for v in values["Widths"].ListValues] == [0.1, 0.2]
+        assert self.file.by_type("IfcCartesianPoint")[0].Coordinates == (1000.0, 2000.0, 3000.0)
+
+    def test_converting_in_place(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        unit = ifcopenshell.api.unit.add_si_unit(self.file, unit_type="LENGTHUNIT", prefix="MILLI")
+        ifcopenshell.api.unit.assign_unit(self.file, units=[unit])
+        point = self.file.createIfcCartesianPoint((1000.0, 2000.0, 3000.0))
+        output = subject.convert_file_length_units(self.file, target_units="METER", in_place=True)
+        assert output is self.file
+        assert subject.get_full_unit_name(subject.get_project_unit(self.file, "LENGTHUNIT")) == "METRE"
+        assert point.Coordinates == (1.0, 2.0, 3.0)
+
     def test_converting_map_conversion_if_there_is_no_map_unit(self):
         ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
         unit = ifcopenshell.api.unit.add_si_unit(self.file, unit_type="LENGTHUNIT", prefix="MILLI")
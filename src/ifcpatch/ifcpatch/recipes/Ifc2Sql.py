@@ -213,11 +213,19 @@ class Patcher:
 
         products = self.elements
         iterator = ifcopenshell.geom.iterator(self.settings, self.file, multiprocessing.cpu_count(), include=products)
-        valid_file = iterator.initialize()
         checkpoint = time.time()
         progress = 0
         total = len(products)
-        while True:
+        # Shared geometries are yielded once, followed by a record for each instance
+        for item in iterator.iter_instances():
+            if not isinstance(item, ifcopenshell.geom.InstanceRecord):
+                v = np.array(item.verts).tobytes()
+                e = np.array(item.edges).tobytes()
+                f = np.array(item.faces).tobytes()
+                mids = np.array(item.material_ids).tobytes()
+                m = json.dumps([m.instance_id() for m in item.materials])
+                self.geometry_rows[item.id] = [item.id, v, e, f, mids, m]
+                continue
             progress += 1
             if progress % 250 == 0:
                 percent_created = round(progress / total * 100)
@@ -229,24 +237,13 @@ class Patcher:
                     )
                 )
                 checkpoint = time.time()
-            shape = iterator.get()
-            if shape:
-                if shape.geometry.id not in self.geometry_rows:
-                    v = np.array(shape.geometry.verts).tobytes()
-                    e = np.array(shape.geometry.edges).tobytes()
-                    f = np.array(shape.geometry.faces).tobytes()
-                    mids = np.array(shape.geometry.material_ids).tobytes()
-                    m = json.dumps([m.instance_id() for m in shape.geometry.materials])
-                    self.geometry_rows[shape.geometry.id] = [shape.geometry.id, v, e, f, mids, m]
-                # Copy required since otherwise it is read-only
-                m = ifcopenshell.util.shape.get_shape_matrix(shape).copy()
-                m[0][3] /= self.unit_scale
-                m[1][3] /= self.unit_scale
-                m[2][3] /= self.unit_scale
-                x, y, z = m[:, 3][0:3]
-                self.shape_rows[shape.id] = [shape.id, float(x), float(y), float(z), m.tobytes(), shape.geometry.id]
-            if not iterator.next():
-                break
+            # Copy required since otherwise it is read-only
+            m = ifcopenshell.util.shape.get_shape_matrix(item).copy()
+            m[0][3] /= self.unit_scale
+            m[1][3] /= self.unit_scale
+            m[2][3] /= self.unit_scale
+            x, y, z = m[:, 3][0:3]
+            self.shape_rows[item.id] = [item.id, float(x), float(y), float(z), m.tobytes(), item.geometry_id]
 
     def create_id_map(self) -> None:
         if self.sql_type == "sqlite":
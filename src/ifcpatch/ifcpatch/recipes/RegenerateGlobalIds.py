@@ -53,28 +53,24 @@ class Patcher:
         self.only_duplicates = only_duplicates
 
     def patch(self):
+        elements = self.file.by_type("IfcRoot")
         if self.only_duplicates:
             duplicates = 0
             invalid_ids = 0
 
             guids = set()
-            for element in self.file.by_type("IfcRoot"):
+            is_valid = ifcopenshell.guid.validate_many([element.GlobalId for element in elements])
+            for element, is_valid_id in zip(elements, is_valid):
                 if element.GlobalId in guids:
                     element.GlobalId = ifcopenshell.guid.new()
                     duplicates += 1
-                elif len(element.GlobalId) != 22 or element.GlobalId[0] not in "0123":
+                elif not is_valid_id:
                     element.GlobalId = ifcopenshell.guid.new()
                     invalid_ids += 1
-                else:
-                    try:
-                        ifcopenshell.guid.expand(element.GlobalId)
-                    except:
-                        element.GlobalId = ifcopenshell.guid.new()
-                    invalid_ids += 1
                 guids.add(element.GlobalId)
 
             print("Replaced %s duplicate GlobalIds" % duplicates)
             print("Replaced %s invalid GlobalIds" % invalid_ids)
         else:
-            for element in self.file.by_type("IfcRoot"):
-                element.GlobalId = ifcopenshell.guid.new()
+            for element, guid in zip(elements, ifcopenshell.guid.new_many(len(elements))):
+                element.GlobalId = guid
@@ -16,12 +16,18 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
+import sqlite3
 import tempfile
+import numpy as np
 import ifcpatch
 import ifcopenshell
 import ifcopenshell.api.context
 import ifcopenshell.api.geometry
 import ifcopenshell.api.georeference
+import ifcopenshell.api.project
+import ifcopenshell.api.root
+import ifcopenshell.api.type
+import ifcopenshell.api.unit
 import ifcopenshell.geom
 import ifcopenshell.util.geolocation
 import ifcopenshell.util.placement
@@ -49,3 +55,45 @@ class TestIfc2Sql:
         ifc_sqlite = ifcopenshell.open(sqlite_path)
         assert isinstance(ifc_sqlite, ifcopenshell.sqlite)
         assert ifc_sqlite.by_id(1)
+
+    def test_storing_shared_geometry_once(self):
+        ifc_file = ifcopenshell.api.project.create_file()
+        ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcProject")
+        ifcopenshell.api.unit.assign_unit(ifc_file)
+        model = ifcopenshell.api.context.add_context(ifc_file, context_type="Model")
+        body = ifcopenshell.api.context.add_context(
+            ifc_file, context_type="Model", context_identifier="Body", target_view="MODEL_VIEW", parent=model
+        )
+        builder = ifcopenshell.util.shape_builder.ShapeBuilder(ifc_file)
+        wall_type = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcWallType")
+        item = builder.extrude(builder.rectangle(size=(1000.0, 200.0)), magnitude=3000.0)
+        representation = builder.get_representation(body, [item])
+        ifcopenshell.api.geometry.assign_representation(ifc_file, product=wall_type, representation=representation)
+        walls = []
+        for x in (0.0, 5.0):
+            wall = ifcopenshell.api.root.create_entity(ifc_file, ifc_class="IfcWall")
+            ifcopenshell.api.type.assign_type(ifc_file, related_objects=[wall], relating_type=wall_type)
+            matrix = np.eye(4)
+            matrix[:3, 3] = (x, 1.0, 0.0)
+            ifcopenshell.api.geometry.edit_object_placement(ifc_file, product=wall, matrix=matrix)
+            walls.append(wall)
+
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".ifcsqlite")
+        sqlite_path = ifcpatch.execute(
+            {"file": ifc_file, "recipe": "Ifc2Sql", "arguments": ["sqlite", None, None, None, tmp.name]}
+        )
+
+        db = sqlite3.connect(sqlite_path)
+        shapes = {row[0]: row[1:] for row in db.execute("SELECT ifc_id, x, y, z, matrix, geometry FROM shape")}
+        geometry_ids = [row[0] for row in db.execute("SELECT id FROM geometry")]
+        db.close()
+        assert sorted(shapes) == sorted(w.id() for w in walls)
+        assert len(geometry_ids) == 1
+        for wall in walls:
+            x, y, z, matrix, geometry_id = shapes[wall.id()]
+            assert geometry_id == geometry_ids[0]
+            matrix = np.frombuffer(matrix, "d").reshape((4, 4))
+            # Translations are stored in project units
+            expected = ifcopenshell.util.placement.get_local_placement(wall.ObjectPlacement)
+            assert np.allclose(matrix[:3, :3], expected[:3, :3])
+            assert np.allclose((x, y, z), expected[:3, 3])
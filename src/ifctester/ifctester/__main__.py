@@ -22,36 +22,84 @@ import time
 import argparse
 import ifcopenshell
 from . import ids
+from . import batch
 from . import reporter
 from pathlib import Path
 
 parser = argparse.ArgumentParser(description="Uses an IDS to audit an IFC")
 parser.add_argument("ids", type=str, help="Path to an IDS")
-parser.add_argument("ifc", type=str, help="Path to an IFC", nargs="?")
+parser.add_argument(
+    "ifc",
+    type=str,
+    help="Path to an IFC. Multiple IFCs, directories, or glob patterns may be given to audit them in batch",
+    nargs="*",
+)
 parser.add_argument("-r", "--reporter", type=str, help="The reporting method to view audit results", default="Console")
 parser.add_argument("--no-color", help="Disable colour output (supported by Console reporting)", action="store_true")
 parser.add_argument("--excel-safe", help="Make sure exported ODS is safely exported for Excel", action="store_true")
-parser.add_argument("-o", "--output", help="Output file (supported for all types of reporting except Console)")
+parser.add_argument(
+    "-o",
+    "--output",
+    help="Output file (supported for all types of reporting except Console), or output directory in batch mode",
+)
+parser.add_argument("-j", "--processes", type=int, help="Number of processes to audit with in batch mode")
 args = parser.parse_args()
 
 ids_path = Path(args.ids)
 if ids_path.suffix.lower() != ".ids":
     raise Exception(f"Provided file is not an .ids file: '{ids_path}'.")
 
-ifc_patch = Path(args.ifc)
-if ifc_patch.suffix.lower() != ".ifc":
-    raise Exception(f"Provided file is not an .ifc file: '{ifc_patch}'.")
-
 specs = ids.open(str(ids_path))
-if args.ifc:
+
+ifc_paths = batch.get_ifc_paths(args.ifc)
+if len(ifc_paths) > 1 or (args.ifc and ifc_paths != args.ifc):
+    if not args.output:
+        raise Exception("An output directory is required to audit in batch.")
+    if args.reporter == "Console":
+        args.reporter = "Json"
+    start = time.time()
+    results = batch.audit(
+        specs,
+        ifc_paths,
+        args.output,
+        reporter_type=args.reporter,
+        processes=args.processes,
+        excel_safe=args.excel_safe,
+    )
+    for result in results:
+        status = batch.get_status(all(s is not False for s in result["statuses"]) if not result["error"] else False)
+        print(f"[{status.upper()}] {result['filepath']}", result["error"] or "")
+    print("Finished auditing:", time.time() - start)
+    raise SystemExit
+
+streaming_reporter_types = {
+    "JsonLines": lambda: reporter.JsonLines(specs, args.output),
+    "HtmlStream": lambda: reporter.HtmlStream(specs, args.output),
+    "OdsStream": lambda: reporter.OdsStream(specs, args.output, excel_safe=args.excel_safe),
+}
+
+streaming_engine = None
+if args.reporter in streaming_reporter_types:
+    if not args.output:
+        raise Exception(f"An output file is required for the {args.reporter} reporter.")
+    streaming_engine = streaming_reporter_types[args.reporter]()
+
+if ifc_paths:
+    ifc_patch = Path(ifc_paths[0])
+    if ifc_patch.suffix.lower() != ".ifc":
+        raise Exception(f"Provided file is not an .ifc file: '{ifc_patch}'.")
+
     start = time.time()
     ifc = ifcopenshell.open(ifc_patch)
     assert isinstance(ifc, ifcopenshell.file)
     print("Finished loading:", time.time() - start)
     start = time.time()
-    specs.validate(ifc)
+    specs.validate(ifc, reporter=streaming_engine)
     print("Finished validating:", time.time() - start)
 
+if streaming_engine:
+    raise SystemExit
+
 reporter_types = {
     "Console": lambda: reporter.Console(specs, use_colour=not args.no_color),
     "Txt": lambda: reporter.Txt(specs),
@@ -0,0 +1,203 @@
+# IfcTester - IDS based model auditing
+# Copyright (C) 2021 Artur Tomczak <artomczak@gmail.com>, Thomas Krijnen <mail@thomaskrijnen.com>, Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcTester.
+#
+# IfcTester is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcTester is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcTester.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+import os
+import csv
+import glob
+import time
+import ifcopenshell
+from . import reporter
+from .ids import Ids
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, TypedDict, Union
+
+# Reporters which may write to a file, and the extension of their reports
+reporter_extensions = {
+    "Txt": ".txt",
+    "Json": ".json",
+    "Html": ".html",
+    "Ods": ".ods",
+    "OdsSummary": ".ods",
+    "Bcf": ".bcf",
+    "JsonLines": ".jsonl",
+    "HtmlStream": ".html",
+    "OdsStream": ".ods",
+}
+
+# The IDS audited by a worker process
+worker_ids: Optional[Ids] = None
+
+
+class AuditResult(TypedDict):
+    filepath: str
+    report: Optional[str]
+    error: Optional[str]
+    statuses: list[Optional[bool]]
+    load_time: float
+    validate_time: float
+    report_time: float
+
+
+def get_ifc_paths(paths: list[str]) -> list[str]:
+    """Expands files, directories and glob patterns into a sorted list of IFC filepaths
+
+    Directories are searched (non recursively) for files with an .ifc
+    extension. Glob patterns may use ``**`` to search recursively.
+    """
+    results = set()
+    for path in paths:
+        if os.path.isdir(path):
+            results.update(str(p) for p in Path(path).iterdir() if p.suffix.lower() == ".ifc")
+        elif glob.has_magic(path):
+            results.update(p for p in glob.glob(path, recursive=True) if os.path.isfile(p))
+        else:
+            results.add(path)
+    return sorted(results)
+
+
+def audit(
+    ids: Ids,
+    ifc_paths: list[str],
+    output_dir: str,
+    reporter_type: str = "Json",
+    processes: Optional[int] = None,
+    excel_safe: bool = False,
+) -> list[AuditResult]:
+    """Audits many IFC models against one IDS
+
+    The IDS is parsed once and shared by all audits. Each model is loaded,
+    validated and reported in a process pool, with one report per model
+    written to the output directory. A ``summary.csv`` with the pass or fail
+    status of each specification for each model, and a ``timings.csv`` with
+    how long each model took to load, validate and report, are also written.
+
+    :param ids: The IDS to audit against.
+    :param ifc_paths: The filepaths of the models to audit.
+    :param output_dir: The directory to write reports to.
+    :param reporter_type: The name of a reporter class in
+        :mod:`ifctester.reporter` which can write to a file.
+    :param processes: The number of processes to use. Defaults to the number
+        of CPUs. If 1, models are audited in this process.
+    :param excel_safe: Whether ODS reports should be made safe for Excel.
+    :return: The results of each audit, in the same order as the models.
+    """
+    if reporter_type not in reporter_extensions:
+        raise ValueError(f"Expected one of the following reporters: {', '.join(reporter_extensions)}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    report_paths = []
+    used_names = set()
+    for ifc_path in ifc_paths:
+        name = Path(ifc_path).stem
+        i = 1
+        while name in used_names:
+            name = f"{Path(ifc_path).stem}-{i}"
+            i += 1
+        used_names.add(name)
+        report_paths.append(os.path.join(output_dir, name + reporter_extensions[reporter_type]))
+
+    args = (ifc_paths, report_paths, [reporter_type] * len(ifc_paths), [excel_safe] * len(ifc_paths))
+    if processes == 1:
+        init_worker(ids)
+        results = list(map(audit_file, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, initializer=init_worker, initargs=(ids,)) as executor:
+            results = list(executor.map(audit_file, *args))
+
+    write_summary(ids, results, os.path.join(output_dir, "summary.csv"))
+    write_timings(results, os.path.join(output_dir, "timings.csv"))
+    return results
+
+
+def init_worker(ids: Ids) -> None:
+    global worker_ids
+    worker_ids = ids
+
+
+def audit_file(ifc_path: str, report_path: str, reporter_type: str, excel_safe: bool) -> AuditResult:
+    result = AuditResult(
+        filepath=ifc_path,
+        report=None,
+        error=None,
+        statuses=[None] * len(worker_ids.specifications),
+        load_time=0.0,
+        validate_time=0.0,
+        report_time=0.0,
+    )
+
+    start = time.time()
+    try:
+        ifc_file = ifcopenshell.open(ifc_path)
+    except Exception as e:
+        result["error"] = f"Unable to load: {e}"
+        return result
+    result["load_time"] = time.time() - start
+
+    kwargs: dict[str, Any] = {"excel_safe": excel_safe} if reporter_type.startswith("Ods") else {}
+    reporter_class = getattr(reporter, reporter_type)
+    start = time.time()
+    try:
+        if issubclass(reporter_class, reporter.StreamingReporter):
+            engine = reporter_class(worker_ids, report_path, **kwargs)
+            worker_ids.validate(ifc_file, filepath=ifc_path, reporter=engine)
+            result["validate_time"] = time.time() - start
+        else:
+            worker_ids.validate(ifc_file, filepath=ifc_path)
+            result["validate_time"] = time.time() - start
+            start = time.time()
+            engine = reporter_class(worker_ids, **kwargs)
+            engine.report()
+            engine.to_file(report_path)
+            result["report_time"] = time.time() - start
+    except Exception as e:
+        result["error"] = f"Unable to audit: {e}"
+        return result
+
+    result["report"] = report_path
+    result["statuses"] = [s.status for s in worker_ids.specifications]
+    return result
+
+
+def write_summary(ids: Ids, results: list[AuditResult], filepath: str) -> None:
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Specification"] + [os.path.basename(r["filepath"]) for r in results])
+        for i, specification in enumerate(ids.specifications):
+            writer.writerow([specification.name] + [get_status(r["statuses"][i]) for r in results])
+
+
+def write_timings(results: list[AuditResult], filepath: str) -> None:
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["File", "Load (s)", "Validate (s)", "Report (s)", "Error"])
+        for r in results:
+            writer.writerow(
+                [
+                    r["filepath"],
+                    f"{r['load_time']:.3f}",
+                    f"{r['validate_time']:.3f}",
+                    f"{r['report_time']:.3f}",
+                    r["error"] or "",
+                ]
+            )
+
+
+def get_status(status: Union[bool, None]) -> str:
+    return "Pass" if status else ("Fail" if status is False else "Untested")
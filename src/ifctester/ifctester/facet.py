@@ -68,6 +68,143 @@ def get_psets(element):
     return ifcopenshell.util.element.get_psets(element)
 
 
+class FilterIndex:
+    """Lookups of an IFC model shared by all applicability filters in a run.
+
+    Lookups are built lazily on first use and then reused by every
+    specification, instead of each specification rescanning the model. An
+    index is only valid while the model is unchanged, so one is activated for
+    the duration of :meth:`ifctester.ids.Ids.validate` using :func:`set_index`.
+    """
+
+    def __init__(self, ifc_file: ifcopenshell.file):
+        self.file = ifc_file
+        self.elements_by_type: dict[tuple[str, bool], list[ifcopenshell.entity_instance]] = {}
+        self.predefined_types: dict[int, Optional[str]] = {}
+        self.containers: dict[int, Optional[ifcopenshell.entity_instance]] = {}
+        self.type_occurrences: Optional[dict[int, list[ifcopenshell.entity_instance]]] = None
+        self.pset_elements: Optional[dict[Optional[str], set[ifcopenshell.entity_instance]]] = None
+        self.classified_elements: Optional[dict[str, set[ifcopenshell.entity_instance]]] = None
+        self.material_elements: Optional[set[ifcopenshell.entity_instance]] = None
+
+    def by_type(self, ifc_class: str, include_subtypes: bool = True) -> list[ifcopenshell.entity_instance]:
+        """Returns a cached list of elements of a class. Do not modify it.
+
+        Classes which don't exist in the schema return no elements.
+        """
+        key = (ifc_class, include_subtypes)
+        results = self.elements_by_type.get(key)
+        if results is None:
+            try:
+                results = self.file.by_type(ifc_class, include_subtypes=include_subtypes)
+            except:
+                # If the user has specified a class that doesn't exist in the version
+                results = []
+            self.elements_by_type[key] = results
+        return results
+
+    def get_object_definitions(self) -> list[ifcopenshell.entity_instance]:
+        """Returns all elements which may have properties, classifications, and materials."""
+        key = ("ObjectDefinitions", True)
+        results = self.elements_by_type.get(key)
+        if results is None:
+            results = list(self.by_type("IfcObjectDefinition"))
+            if self.file.schema != "IFC2X3":
+                results.extend(self.by_type("IfcMaterialDefinition"))
+                results.extend(self.by_type("IfcProfileDef"))
+            self.elements_by_type[key] = results
+        return results
+
+    def get_type_occurrences(self) -> dict[int, list[ifcopenshell.entity_instance]]:
+        """Returns occurrences typed by each type, keyed by the ID of the type."""
+        if self.type_occurrences is None:
+            self.type_occurrences = {}
+            for rel in self.by_type("IfcRelDefinesByType"):
+                self.type_occurrences.setdefault(rel.RelatingType.id(), []).extend(rel.RelatedObjects)
+        return self.type_occurrences
+
+    def get_pset_elements(self) -> dict[Optional[str], set[ifcopenshell.entity_instance]]:
+        """Returns elements which have a property set, directly or via their type, keyed by the set name."""
+        if self.pset_elements is None:
+            self.pset_elements = {}
+            for rel in self.by_type("IfcRelDefinesByProperties"):
+                definitions = rel.RelatingPropertyDefinition
+                if isinstance(definitions, ifcopenshell.entity_instance):
+                    definitions = (definitions,)
+                for definition in definitions:
+                    self.pset_elements.setdefault(definition.Name, set()).update(rel.RelatedObjects)
+            type_occurrences = self.get_type_occurrences()
+            for element_type in self.by_type("IfcTypeObject"):
+                for definition in element_type.HasPropertySets or []:
+                    elements = self.pset_elements.setdefault(definition.Name, set())
+                    elements.add(element_type)
+                    elements.update(type_occurrences.get(element_type.id(), []))
+            if self.file.schema != "IFC2X3":
+                for definition in self.by_type("IfcMaterialProperties"):
+                    self.pset_elements.setdefault(definition.Name, set()).add(definition.Material)
+                for definition in self.by_type("IfcProfileProperties"):
+                    self.pset_elements.setdefault(definition.Name, set()).add(definition.ProfileDefinition)
+        return self.pset_elements
+
+    def get_classified_elements(self) -> dict[str, set[ifcopenshell.entity_instance]]:
+        """Returns elements classified directly or via their type, keyed by the classification system name."""
+        if self.classified_elements is None:
+            self.classified_elements = {}
+            type_occurrences = self.get_type_occurrences()
+            for rel in self.by_type("IfcRelAssociatesClassification"):
+                classification = ifcopenshell.util.classification.get_classification(rel.RelatingClassification)
+                if classification is None:
+                    continue
+                elements = self.classified_elements.setdefault(classification.Name, set())
+                for element in rel.RelatedObjects:
+                    if not element.is_a("IfcObjectDefinition"):
+                        continue
+                    elements.add(element)
+                    elements.update(type_occurrences.get(element.id(), []))
+        return self.classified_elements
+
+    def get_material_elements(self) -> set[ifcopenshell.entity_instance]:
+        """Returns elements with a material, directly or via their type."""
+        if self.material_elements is None:
+            self.material_elements = set()
+            type_occurrences = self.get_type_occurrences()
+            for rel in self.by_type("IfcRelAssociatesMaterial"):
+                for element in rel.RelatedObjects:
+                    if not element.is_a("IfcObjectDefinition"):
+                        continue
+                    self.material_elements.add(element)
+                    self.material_elements.update(type_occurrences.get(element.id(), []))
+        return self.material_elements
+
+    def get_predefined_type(self, element: ifcopenshell.entity_instance) -> Optional[str]:
+        element_id = element.id()
+        if element_id not in self.predefined_types:
+            self.predefined_types[element_id] = ifcopenshell.util.element.get_predefined_type(element)
+        return self.predefined_types[element_id]
+
+    def get_container(self, element: ifcopenshell.entity_instance) -> Optional[ifcopenshell.entity_instance]:
+        element_id = element.id()
+        if element_id not in self.containers:
+            self.containers[element_id] = ifcopenshell.util.element.get_container(element)
+        return self.containers[element_id]
+
+
+active_index: Optional[FilterIndex] = None
+
+
+def set_index(index: Optional[FilterIndex]) -> None:
+    """Activates an index to be shared by filters, or deactivates it if None."""
+    global active_index
+    active_index = index
+
+
+def get_index(ifc_file: ifcopenshell.file) -> FilterIndex:
+    """Returns the active index for a model, or a new index for one-off use."""
+    if active_index is not None and active_index.file is ifc_file:
+        return active_index
+    return FilterIndex(ifc_file)
+
+
 Cardinality = Literal["required", "optional", "prohibited"]
 
 
@@ -83,6 +220,9 @@ class Facet:
         self.status = None
         self.passed_entities: set[ifcopenshell.entity_instance] = set()
         self.failures: list[FacetFailure] = []
+        # Totals are kept even when results are streamed rather than stored
+        self.total_pass = 0
+        self.total_fail = 0
         for i, name in enumerate(self.parameters):
             setattr(self, name.replace("@", ""), parameters[i])
 
@@ -197,24 +337,17 @@ class Entity(Facet):
         if isinstance(elements, list):
             return super().filter(ifc_file, elements)
 
+        index = get_index(ifc_file)
         if isinstance(self.name, str):
-            try:
-                results = ifc_file.by_type(self.name, include_subtypes=False)
-            except:
-                # If the user has specified a class that doesn't exist in the version
-                results = []
+            results = index.by_type(self.name, include_subtypes=False)
         else:
             results = []
             ifc_classes = [t for t in ifc_file.wrapped_data.types() if t.upper() == self.name]
             for ifc_class in ifc_classes:
-                try:
-                    results.extend(ifc_file.by_type(ifc_class, include_subtypes=False))
-                except:
-                    # If the user has specified a class that doesn't exist in the version
-                    continue
+                results.extend(index.by_type(ifc_class, include_subtypes=False))
         if self.predefinedType:
-            return [r for r in results if self(r)]
-        return results
+            return [r for r in results if index.get_predefined_type(r) == self.predefinedType]
+        return list(results)
 
     def __call__(self, inst: ifcopenshell.entity_instance, logger: Optional[Logger] = None) -> EntityResult:
         is_pass = inst.is_a().upper() == self.name
@@ -270,7 +403,7 @@ class Attribute(Facet):
             entity_name, entity = entities.popitem()
             for attribute in entity.attributes():
                 if attribute.name() == self.name:
-                    results.extend(ifc_file.by_type(entity_name, include_subtypes=True))
+                    results.extend(get_index(ifc_file).by_type(entity_name, include_subtypes=True))
                     # e.g. if IfcRoot already has .Name, it's safe not to check all it's subtypes attributes
                     ignore_subtypes(entity)
 
@@ -390,7 +523,15 @@ class Classification(Facet):
     ) -> list[ifcopenshell.entity_instance]:
         if isinstance(elements, list):
             return super().filter(ifc_file, elements)
-        return ifc_file.by_type("IfcObjectDefinition")
+        index = get_index(ifc_file)
+        if self.cardinality != "required":
+            return list(index.by_type("IfcObjectDefinition"))
+        # A classified element must have a reference in the system, either directly or via its type
+        results = set()
+        for system, system_elements in index.get_classified_elements().items():
+            if self.system == system:
+                results.update(system_elements)
+        return sorted(results, key=lambda e: e.id())
 
     def __call__(self, inst: ifcopenshell.entity_instance, logger: Optional[Logger] = None) -> ClassificationResult:
         leaf_references = ifcopenshell.util.classification.get_references(inst)
@@ -537,7 +678,7 @@ class PartOf(Facet):
                         is_pass = False
                         reason = {"type": "PREDEFINEDTYPE", "actual": predefined_type}
         elif self.relation == "IFCRELCONTAINEDINSPATIALSTRUCTURE":
-            container = ifcopenshell.util.element.get_container(inst)
+            container = get_index(inst.file).get_container(inst)
             is_pass = container is not None
             if not is_pass:
                 reason = {"type": "NOVALUE"}
@@ -646,13 +787,16 @@ class Property(Facet):
     ) -> list[ifcopenshell.entity_instance]:
         if isinstance(elements, list):
             return super().filter(ifc_file, elements)
+        index = get_index(ifc_file)
+        if self.cardinality != "required":
+            return list(index.get_object_definitions())
+        results = set()
+        for pset_name, pset_elements in index.get_pset_elements().items():
+            if pset_name is not None and self.propertySet == pset_name:
+                results.update(pset_elements)
         if ifc_file.schema == "IFC2X3":
-            return ifc_file.by_type("IfcObjectDefinition")
-        return (
-            ifc_file.by_type("IfcObjectDefinition")
-            + ifc_file.by_type("IfcMaterialDefinition")
-            + ifc_file.by_type("IfcProfileDef")
-        )
+            results = {e for e in results if e.is_a("IfcObjectDefinition")}
+        return sorted(results, key=lambda e: e.id())
 
     def __call__(self, inst: ifcopenshell.entity_instance, logger: Optional[Logger] = None) -> PropertyResult:
         if isinstance(self.propertySet, str):
@@ -914,7 +1058,10 @@ class Material(Facet):
     ) -> list[ifcopenshell.entity_instance]:
         if isinstance(elements, list):
             return super().filter(ifc_file, elements)
-        return ifc_file.by_type("IfcObjectDefinition")
+        index = get_index(ifc_file)
+        if self.cardinality != "required":
+            return list(index.by_type("IfcObjectDefinition"))
+        return sorted(index.get_material_elements(), key=lambda e: e.id())
 
     def __call__(self, inst: ifcopenshell.entity_instance, logger: Optional[Logger] = None) -> MaterialResult:
         material = ifcopenshell.util.element.get_material(inst, should_skip_usage=True)
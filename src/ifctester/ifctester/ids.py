@@ -19,7 +19,9 @@
 from __future__ import annotations
 import os
 import datetime
+import tempfile
 import ifcopenshell
+from concurrent.futures import ProcessPoolExecutor
 from xmlschema.validators.exceptions import XMLSchemaValidationError
 from xmlschema import XMLSchema
 from xmlschema import etree_tostring
@@ -37,12 +39,21 @@ from .facet import (
     get_psets,
     Cardinality,
     FacetFailure,
+    FilterIndex,
+    set_index,
 )
-from typing import List, Optional, Union, overload, Literal
+from typing import Any, List, Optional, Union, overload, Literal, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .reporter import StreamingReporter
 
 cwd = os.path.dirname(os.path.realpath(__file__))
 schema = None
 
+# State of a worker process when validating specifications in parallel
+worker_file: Optional[ifcopenshell.file] = None
+worker_specifications: List[Specification] = []
+
 
 class IdsXmlValidationError(Exception):
     def __init__(self, xml_error: XMLSchemaValidationError, message: str):
@@ -160,8 +171,30 @@ class Ids:
         return get_schema().is_valid(filepath)
 
     def validate(
-        self, ifc_file: ifcopenshell.file, should_filter_version: bool = False, filepath: Optional[str] = None
+        self,
+        ifc_file: ifcopenshell.file,
+        should_filter_version: bool = False,
+        filepath: Optional[str] = None,
+        processes: Optional[int] = None,
+        reporter: Optional[StreamingReporter] = None,
     ) -> None:
+        """Validates a model against all specifications
+
+        :param ifc_file: The model to validate.
+        :param should_filter_version: If true, specifications which don't
+            apply to the model's schema are not validated.
+        :param filepath: The filepath of the model, used in reports.
+        :param processes: If more than one, specifications are validated in a
+            pool of this many processes. Each process loads its own copy of
+            the model, so this only pays off for large models with many
+            specifications. Results are merged back as though validation ran
+            in this process.
+        :param reporter: If provided, results are streamed to the reporter as
+            they are validated rather than stored in each specification, so
+            memory use does not grow with the size of the model. Only totals
+            are kept. Streamed specifications are always validated in this
+            process.
+        """
         if filepath:
             self.filepath = filepath
             self.filename = os.path.basename(filepath)
@@ -172,7 +205,58 @@ class Ids:
         for specification in self.specifications:
             specification.reset_status()
             specification.check_ifc_version(ifc_file)
-            specification.validate(ifc_file, should_filter_version=should_filter_version)
+        if processes and processes > 1 and len(self.specifications) > 1 and reporter is None:
+            return self.validate_in_processes(ifc_file, should_filter_version, processes)
+        set_index(FilterIndex(ifc_file))
+        try:
+            if reporter:
+                reporter.start()
+            for specification in self.specifications:
+                if reporter:
+                    reporter.start_specification(specification)
+                specification.validate(ifc_file, should_filter_version=should_filter_version, reporter=reporter)
+                if reporter:
+                    reporter.finish_specification(specification)
+            if reporter:
+                reporter.finish()
+        finally:
+            set_index(None)
+            get_pset.cache_clear()
+            get_psets.cache_clear()
+
+    def validate_in_processes(self, ifc_file: ifcopenshell.file, should_filter_version: bool, processes: int) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = os.path.join(tmpdir, "model.ifc")
+            ifc_file.write(model_path)
+            with ProcessPoolExecutor(
+                max_workers=min(processes, len(self.specifications)),
+                initializer=init_worker,
+                initargs=(model_path, self.specifications),
+            ) as executor:
+                futures = [
+                    executor.submit(validate_specification, i, should_filter_version)
+                    for i in range(len(self.specifications))
+                ]
+                for specification, future in zip(self.specifications, futures):
+                    specification.load_results(ifc_file, future.result())
+
+
+def init_worker(model_path: str, specifications: List[Specification]) -> None:
+    global worker_file, worker_specifications
+    worker_file = ifcopenshell.open(model_path)
+    worker_specifications = specifications
+    set_index(FilterIndex(worker_file))
+
+
+def validate_specification(i: int, should_filter_version: bool) -> dict[str, Any]:
+    specification = worker_specifications[i]
+    specification.reset_status()
+    specification.check_ifc_version(worker_file)
+    specification.validate(worker_file, should_filter_version=should_filter_version)
+    results = specification.get_results()
+    # Free the worker's copies of the results before the next specification
+    specification.reset_status()
+    return results
 
 
 class Specification:
@@ -199,6 +283,8 @@ class Specification:
         self.applicable_entities: list[ifcopenshell.entity_instance] = []
         self.passed_entities: set[ifcopenshell.entity_instance] = set()
         self.failed_entities: set[ifcopenshell.entity_instance] = set()
+        self.total_applicable = 0
+        self.total_applicable_fail = 0
         self.status = None
         self.is_ifc_version = None
 
@@ -265,16 +351,68 @@ class Specification:
         self.applicable_entities.clear()
         self.passed_entities: set[ifcopenshell.entity_instance] = set()
         self.failed_entities: set[ifcopenshell.entity_instance] = set()
+        self.total_applicable = 0
+        self.total_applicable_fail = 0
         for facet in self.requirements:
             facet.status = None
+            facet.passed_entities.clear()
             facet.failures.clear()
+            facet.total_pass = 0
+            facet.total_fail = 0
         self.status = None
 
+    def get_results(self) -> dict[str, Any]:
+        """Returns validation results with elements referenced by ID
+
+        Unlike entity instances, the results may be pickled and then loaded
+        into a specification validated against another copy of the model using
+        :meth:`load_results`.
+        """
+        return {
+            "status": self.status,
+            "total_applicable": self.total_applicable,
+            "total_applicable_fail": self.total_applicable_fail,
+            "applicable_entities": [e.id() for e in self.applicable_entities],
+            "passed_entities": [e.id() for e in self.passed_entities],
+            "failed_entities": [e.id() for e in self.failed_entities],
+            "requirements": [
+                {
+                    "status": facet.status,
+                    "total_pass": facet.total_pass,
+                    "total_fail": facet.total_fail,
+                    "passed_entities": [e.id() for e in facet.passed_entities],
+                    "failures": [(f["element"].id(), f["reason"]) for f in facet.failures],
+                }
+                for facet in self.requirements
+            ],
+        }
+
+    def load_results(self, ifc_file: ifcopenshell.file, results: dict[str, Any]) -> None:
+        self.status = results["status"]
+        self.total_applicable = results["total_applicable"]
+        self.total_applicable_fail = results["total_applicable_fail"]
+        self.applicable_entities = [ifc_file.by_id(i) for i in results["applicable_entities"]]
+        self.passed_entities = {ifc_file.by_id(i) for i in results["passed_entities"]}
+        self.failed_entities = {ifc_file.by_id(i) for i in results["failed_entities"]}
+        for facet, facet_results in zip(self.requirements, results["requirements"]):
+            facet.status = facet_results["status"]
+            facet.total_pass = facet_results["total_pass"]
+            facet.total_fail = facet_results["total_fail"]
+            facet.passed_entities = {ifc_file.by_id(i) for i in facet_results["passed_entities"]}
+            facet.failures = [
+                FacetFailure(element=ifc_file.by_id(i), reason=reason) for i, reason in facet_results["failures"]
+            ]
+
     def check_ifc_version(self, ifc_file: ifcopenshell.file) -> bool:
         self.is_ifc_version = ifc_file.schema_identifier in self.ifcVersion
         return self.is_ifc_version
 
-    def validate(self, ifc_file: ifcopenshell.file, should_filter_version: bool = False) -> None:
+    def validate(
+        self,
+        ifc_file: ifcopenshell.file,
+        should_filter_version: bool = False,
+        reporter: Optional[StreamingReporter] = None,
+    ) -> None:
         if should_filter_version and not self.is_ifc_version:
             return
 
@@ -285,48 +423,55 @@ class Specification:
         for i, facet in enumerate(self.applicability):
             elements = facet.filter(ifc_file, elements)
 
+        # Subsequent facets have already checked every element they were
+        # given, so only the first facet's broadphase results need checking.
+        first_facet = self.applicability[0] if self.applicability else None
+        if isinstance(first_facet, Entity):
+            first_facet = None
+
         for element in elements or []:
-            is_applicable = True
-            for facet in self.applicability:
-                if isinstance(facet, Entity):
-                    continue
-                if not bool(facet(element)):
-                    is_applicable = False
-                    break
-            if not is_applicable:
+            if first_facet is not None and not bool(first_facet(element)):
                 continue
-            self.applicable_entities.append(element)
+            self.total_applicable += 1
+            if reporter is None:
+                self.applicable_entities.append(element)
+            is_element_pass = True
             for facet in self.requirements:
                 result = facet(element)
                 is_pass = bool(result)
-                if self.maxOccurs != 0:  # This is a required or optional specification
-                    if is_pass:
+                if self.maxOccurs == 0:  # This is a prohibited specification
+                    is_pass = not is_pass
+                if is_pass:
+                    facet.total_pass += 1
+                    if reporter is None:
                         self.passed_entities.add(element)
                         facet.passed_entities.add(element)
                     else:
-                        self.failed_entities.add(element)
-                        facet.failures.append(FacetFailure(element=element, reason=str(result)))
-                else:  # This is a prohibited specification
-                    if is_pass:
+                        reporter.report_pass(self, facet, element)
+                else:
+                    facet.total_fail += 1
+                    is_element_pass = False
+                    if reporter is None:
                         self.failed_entities.add(element)
                         facet.failures.append(FacetFailure(element=element, reason=str(result)))
                     else:
-                        self.passed_entities.add(element)
-                        facet.passed_entities.add(element)
+                        reporter.report_failure(self, facet, element, str(result))
+            if not is_element_pass:
+                self.total_applicable_fail += 1
 
         self.status = True
         for facet in self.requirements:
-            facet.status = not bool(facet.failures)
+            facet.status = not facet.total_fail
             if not facet.status:
                 self.status = False
 
         if self.minOccurs != 0:  # Required specification
-            if not self.applicable_entities:
+            if not self.total_applicable:
                 self.status = False
                 for facet in self.requirements:
                     facet.status = False
         elif self.maxOccurs == 0:  # Prohibited specification
-            if self.applicable_entities and not self.requirements:
+            if self.total_applicable and not self.requirements:
                 self.status = False
 
     def get_usage(self) -> Cardinality:
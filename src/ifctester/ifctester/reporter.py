@@ -801,3 +801,404 @@ class Bcf(Json):
                     if element.is_a("IfcElement"):
                         topic.add_viewpoint(element)
         bcfxml.save_project(filepath)
+
+
+class StreamingReporter(Reporter):
+    """Writes results incrementally as specifications are validated
+
+    Pass the reporter to :meth:`ifctester.ids.Ids.validate`. Failures are
+    written as soon as they are found and passes are written up to a sample
+    limit per requirement. Nothing else is stored apart from totals, so memory
+    use does not grow with the size of the model.
+
+    :param ids: The IDS being validated.
+    :param filepath: The file to write the report to.
+    :param passed_entity_limit: The maximum number of passing elements to
+        write per requirement, or None to write all of them.
+    :param failed_entity_limit: The maximum number of failing elements to
+        write per requirement, or None to write all of them.
+    """
+
+    def __init__(
+        self,
+        ids: Ids,
+        filepath: str,
+        passed_entity_limit: Optional[int] = 0,
+        failed_entity_limit: Optional[int] = None,
+    ):
+        super().__init__(ids)
+        self.filepath = filepath
+        self.passed_entity_limit = passed_entity_limit
+        self.failed_entity_limit = failed_entity_limit
+        self.file = None
+        self.total_passes: dict[int, int] = {}
+        self.total_failures: dict[int, int] = {}
+        self.results = Results()
+
+    def start(self) -> None:
+        self.results = Results(
+            title=self.ids.info.get("title", "Untitled IDS"),
+            date=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            filepath=self.ids.filepath,
+            filename=self.ids.filename,
+            status=True,
+            total_specifications=0,
+            total_specifications_pass=0,
+            total_requirements=0,
+            total_requirements_pass=0,
+            total_checks=0,
+            total_checks_pass=0,
+        )
+        self.open()
+
+    def start_specification(self, specification: Specification) -> None:
+        self.total_passes = {}
+        self.total_failures = {}
+
+    def report_pass(self, specification: Specification, requirement: Facet, element: ifcopenshell.entity_instance):
+        key = id(requirement)
+        total = self.total_passes.get(key, 0)
+        if self.passed_entity_limit is None or total < self.passed_entity_limit:
+            self.write_entity(specification, requirement, self.get_entity(element), True)
+        self.total_passes[key] = total + 1
+
+    def report_failure(
+        self, specification: Specification, requirement: Facet, element: ifcopenshell.entity_instance, reason: str
+    ) -> None:
+        key = id(requirement)
+        total = self.total_failures.get(key, 0)
+        if self.failed_entity_limit is None or total < self.failed_entity_limit:
+            self.write_entity(specification, requirement, self.get_entity(element, reason), False)
+        self.total_failures[key] = total + 1
+
+    def finish_specification(self, specification: Specification) -> None:
+        summary = self.get_specification_summary(specification)
+        self.results["total_specifications"] += 1
+        self.results["total_specifications_pass"] += 1 if specification.status else 0
+        self.results["total_requirements"] += len(specification.requirements)
+        self.results["total_requirements_pass"] += len([r for r in specification.requirements if r.status])
+        self.results["total_checks"] += summary["total_checks"]
+        self.results["total_checks_pass"] += summary["total_checks_pass"]
+        if not specification.status:
+            self.results["status"] = False
+        self.write_specification(specification, summary)
+
+    def finish(self) -> None:
+        results = self.results
+        results["total_specifications_fail"] = results["total_specifications"] - results["total_specifications_pass"]
+        results["percent_specifications_pass"] = self.get_percent(
+            results["total_specifications_pass"], results["total_specifications"]
+        )
+        results["total_requirements_fail"] = results["total_requirements"] - results["total_requirements_pass"]
+        results["percent_requirements_pass"] = self.get_percent(
+            results["total_requirements_pass"], results["total_requirements"]
+        )
+        results["total_checks_fail"] = results["total_checks"] - results["total_checks_pass"]
+        results["percent_checks_pass"] = self.get_percent(results["total_checks_pass"], results["total_checks"])
+        self.write_summary()
+        self.close()
+
+    def open(self) -> None:
+        self.file = open(self.filepath, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        self.file.close()
+        self.file = None
+
+    def write_entity(
+        self, specification: Specification, requirement: Facet, entity: ResultsEntity, is_pass: bool
+    ) -> None:
+        pass
+
+    def write_specification(self, specification: Specification, summary: dict) -> None:
+        pass
+
+    def write_summary(self) -> None:
+        pass
+
+    def get_entity(self, element: ifcopenshell.entity_instance, reason: Optional[str] = None) -> ResultsEntity:
+        entity = ResultsEntity(
+            {
+                "element": element,
+                "element_type": ifcopenshell.util.element.get_type(element),
+                "class": element.is_a(),
+                "predefined_type": ifcopenshell.util.element.get_predefined_type(element),
+                "name": getattr(element, "Name", None),
+                "description": getattr(element, "Description", None),
+                "id": element.id(),
+                "global_id": getattr(element, "GlobalId", None),
+                "tag": getattr(element, "Tag", None),
+            }
+        )
+        if reason is not None:
+            entity["reason"] = reason
+        return entity
+
+    def get_specification_summary(self, specification: Specification) -> dict:
+        total_applicable = specification.total_applicable
+        total_applicable_pass = total_applicable - specification.total_applicable_fail
+        total_checks = total_applicable * len(specification.requirements)
+        total_checks_pass = sum(total_applicable - r.total_fail for r in specification.requirements)
+        return {
+            "name": specification.name,
+            "status": specification.status,
+            "is_ifc_version": specification.is_ifc_version,
+            "total_applicable": total_applicable,
+            "total_applicable_pass": total_applicable_pass,
+            "total_applicable_fail": total_applicable - total_applicable_pass,
+            "percent_applicable_pass": self.get_percent(total_applicable_pass, total_applicable),
+            "total_checks": total_checks,
+            "total_checks_pass": total_checks_pass,
+            "total_checks_fail": total_checks - total_checks_pass,
+            "percent_checks_pass": self.get_percent(total_checks_pass, total_checks),
+            "requirements": [
+                {
+                    "description": r.to_string("requirement", specification, r),
+                    "status": r.status,
+                    "total_pass": r.total_pass,
+                    "total_fail": r.total_fail,
+                    "percent_pass": self.get_percent(total_applicable - r.total_fail, total_applicable),
+                }
+                for r in specification.requirements
+            ],
+        }
+
+    def get_percent(self, total_pass: int, total: int) -> ResultsPercent:
+        return math.floor((total_pass / total) * 100) if total else "N/A"
+
+
+class JsonLines(StreamingReporter):
+    """Streams results as JSON Lines
+
+    Each line is an object with a "type" of either "pass" or "fail" for an
+    element, "specification" for the totals of a specification once it has
+    been validated, or "summary" for the totals of the whole IDS at the end.
+    """
+
+    def write_entity(
+        self, specification: Specification, requirement: Facet, entity: ResultsEntity, is_pass: bool
+    ) -> None:
+        self.write(
+            {
+                "type": "pass" if is_pass else "fail",
+                "specification": specification.name,
+                "requirement": requirement.to_string("requirement", specification, requirement),
+                **entity,
+            }
+        )
+
+    def write_specification(self, specification: Specification, summary: dict) -> None:
+        self.write({"type": "specification", **summary})
+
+    def write_summary(self) -> None:
+        self.write({"type": "summary", **self.results})
+
+    def write(self, data: dict) -> None:
+        import json
+
+        self.file.write(json.dumps(data, ensure_ascii=False, default=self.encode))
+        self.file.write("\n")
+
+    def encode(self, obj):
+        return str(obj)
+
+
+class HtmlStream(StreamingReporter):
+    """Streams results as an HTML document
+
+    Elements are written to tables of at most ``chunk_size`` rows so that
+    browsers can render large reports progressively. As totals are only
+    known once validation finishes, each specification's totals follow its
+    elements and the overall summary is at the end of the document.
+    """
+
+    def __init__(self, *args, chunk_size: int = 1000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chunk_size = chunk_size
+        self.total_rows = 0
+
+    def start(self) -> None:
+        super().start()
+        with open(os.path.join(cwd, "templates", "report.html"), "r") as file:
+            template = file.read()
+        style = template[template.index("<style>") : template.index("</style>") + len("</style>")]
+        self.file.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8" />\n')
+        self.file.write(f"<title>{self.escape(self.results['title'])}</title>\n{style}\n</head>\n<body>\n")
+        self.file.write(f"<header><h1>{self.escape(self.results['title'])}</h1>")
+        self.file.write(f"<p><strong>{self.escape(self.results['filename'] or '')} {self.results['date']}</strong></p>")
+        self.file.write("</header>\n")
+
+    def start_specification(self, specification: Specification) -> None:
+        super().start_specification(specification)
+        self.total_rows = 0
+        self.file.write(
+            f'<section style="clear: both; overflow: hidden;">\n<h2>{self.escape(specification.name)}</h2>\n'
+        )
+        for applicability in specification.applicability:
+            self.file.write(f"<p>{self.escape(applicability.to_string('applicability'))}</p>\n")
+
+    def write_entity(
+        self, specification: Specification, requirement: Facet, entity: ResultsEntity, is_pass: bool
+    ) -> None:
+        if self.total_rows % self.chunk_size == 0:
+            if self.total_rows:
+                self.file.write("</tbody></table>\n")
+            self.file.write("<table><thead><tr>")
+            for header in ("Requirement", "Status", "Class", "Name", "GlobalId", "Tag", "Reason"):
+                self.file.write(f"<th>{header}</th>")
+            self.file.write("</tr></thead><tbody>\n")
+        self.total_rows += 1
+        row = [
+            requirement.to_string("requirement", specification, requirement),
+            "Pass" if is_pass else "Fail",
+            entity["class"],
+            entity["name"],
+            entity["global_id"],
+            entity["tag"],
+            entity.get("reason"),
+        ]
+        self.file.write(f'<tr class="{"pass" if is_pass else "fail"}">')
+        for col in row:
+            self.file.write(f"<td>{self.escape(col or '')}</td>")
+        self.file.write("</tr>\n")
+
+    def write_specification(self, specification: Specification, summary: dict) -> None:
+        if self.total_rows:
+            self.file.write("</tbody></table>\n")
+        status = self.get_status(summary["status"])
+        self.file.write(f'<p><span class="item {status.lower()}">{status}</span>')
+        self.file.write(
+            f'<span class="item">Checks passed: <strong>{summary["total_checks_pass"]}</strong> / '
+            f'<strong>{summary["total_checks"]}</strong></span>'
+        )
+        self.file.write(
+            f'<span class="item">Elements passed: <strong>{summary["total_applicable_pass"]}</strong> / '
+            f'<strong>{summary["total_applicable"]}</strong></span></p>\n<ul>\n'
+        )
+        for requirement in summary["requirements"]:
+            status = self.get_status(requirement["status"])
+            self.file.write(
+                f'<li class="{status.lower()}">{self.escape(requirement["description"])} - '
+                f'{requirement["total_pass"]} passed, {requirement["total_fail"]} failed</li>\n'
+            )
+        self.file.write("</ul>\n</section>\n")
+
+    def write_summary(self) -> None:
+        results = self.results
+        status = self.get_status(results["status"])
+        self.file.write(f'<h2>Summary</h2>\n<p><span class="item {status.lower()}">{status}</span>')
+        for label, key in (
+            ("Specifications", "specifications"),
+            ("Requirements", "requirements"),
+            ("Checks", "checks"),
+        ):
+            self.file.write(
+                f'<span class="item">{label} passed: <strong>{results[f"total_{key}_pass"]}</strong> / '
+                f'<strong>{results[f"total_{key}"]}</strong></span>'
+            )
+        self.file.write("</p>\n</body>\n</html>\n")
+
+    def get_status(self, status: Optional[bool]) -> str:
+        return "Pass" if status else ("Fail" if status is False else "Skipped")
+
+    def escape(self, value) -> str:
+        import html
+
+        return html.escape(str(value))
+
+
+class OdsStream(StreamingReporter):
+    """Streams failures as ODS rows
+
+    A summary sheet lists every specification, followed by a sheet of failures
+    for each failing specification. Rows are added as results are found
+    without building an intermediate results dictionary. Note that the ODS
+    document itself is only written once validation finishes, so
+    ``failed_entity_limit`` should be used to bound the size of the sheets.
+    """
+
+    def __init__(self, *args, excel_safe=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.excel_safe = excel_safe
+        self.colours = {
+            "h": "cccccc",  # Header
+            "p": "97cc64",  # Pass
+            "f": "fb5a3e",  # Fail
+            "t": "ffffff",  # Regular text
+        }
+        self.table = None
+
+    def excel_safe_spreadsheet_name(self, name: str) -> str:
+        return Ods.excel_safe_spreadsheet_name(self, name)
+
+    def open(self) -> None:
+        from odf.opendocument import OpenDocumentSpreadsheet
+        from odf.style import Style, TableCellProperties
+        from odf.table import Table
+
+        self.doc = OpenDocumentSpreadsheet()
+        for key, value in self.colours.items():
+            style = Style(name=key, family="table-cell")
+            style.addElement(TableCellProperties(backgroundcolor="#" + value))
+            self.doc.automaticstyles.addElement(style)
+
+        self.summary_table = Table(name=self.excel_safe_spreadsheet_name(self.results["title"]))
+        self.add_row(
+            self.summary_table, ["Specification", "Status", "Total Pass", "Total Checks", "Percentage Pass"], "h"
+        )
+        self.doc.spreadsheet.addElement(self.summary_table)
+
+    def start_specification(self, specification: Specification) -> None:
+        super().start_specification(specification)
+        self.table = None
+
+    def write_entity(
+        self, specification: Specification, requirement: Facet, entity: ResultsEntity, is_pass: bool
+    ) -> None:
+        if is_pass:
+            return
+        if self.table is None:
+            from odf.table import Table
+
+            self.table = Table(name=self.excel_safe_spreadsheet_name(specification.name))
+            headers = ["Requirement", "Problem", "Class", "PredefinedType", "Name", "Description", "GlobalId", "Tag"]
+            self.add_row(self.table, headers + ["Element", "ElementType"], "h")
+            self.doc.spreadsheet.addElement(self.table)
+        element_type = entity["element_type"]
+        row = [
+            requirement.to_string("requirement", specification, requirement),
+            entity.get("reason", "No reason provided"),
+            entity["class"],
+            entity["predefined_type"],
+            entity["name"],
+            entity["description"],
+            entity["global_id"],
+            entity["tag"],
+            str(entity["element"]),
+            str(element_type) if element_type else "N/A",
+        ]
+        self.add_row(self.table, row, "t")
+
+    def write_specification(self, specification: Specification, summary: dict) -> None:
+        row = [
+            specification.name,
+            "Pass" if summary["status"] else "Fail",
+            str(summary["total_checks_pass"]),
+            str(summary["total_checks"]),
+            str(summary["percent_checks_pass"]),
+        ]
+        self.add_row(self.summary_table, row, "p" if summary["status"] else "f")
+
+    def close(self) -> None:
+        self.doc.save(self.filepath, addsuffix=not self.filepath.lower().endswith(".ods"))
+
+    def add_row(self, table, row: list[Optional[str]], stylename: str) -> None:
+        from odf.table import TableRow, TableCell
+        from odf.text import P
+
+        tr = TableRow()
+        for col in row:
+            tc = TableCell(valuetype="string", stylename=stylename)
+            tc.addElement(P(text="NULL" if col is None else col))
+            tr.addElement(tc)
+        table.addElement(tr)
@@ -0,0 +1,63 @@
+# IfcTester - IDS based model auditing
+# Copyright (C) 2021-2022 Thomas Krijnen <thomas@aecgeeks.com>, Dion Moult <dion@thinkmoult.com>
+#
+# This file is part of IfcTester.
+#
+# IfcTester is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# IfcTester is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with IfcTester.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import csv
+import ifcopenshell
+from ifctester import ids, batch
+
+
+class TestAudit:
+    def test_auditing_many_models_against_one_ids(self, tmp_path):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+        specs.specifications.append(spec)
+
+        model = ifcopenshell.file()
+        model.createIfcWall(Name="Waldo")
+        model.write(str(tmp_path / "a.ifc"))
+        model.createIfcWall(Name="Wally")
+        model.write(str(tmp_path / "b.ifc"))
+
+        ifc_paths = batch.get_ifc_paths([str(tmp_path)])
+        assert ifc_paths == [str(tmp_path / "a.ifc"), str(tmp_path / "b.ifc")]
+
+        output_dir = str(tmp_path / "reports")
+        results = batch.audit(specs, ifc_paths, output_dir, reporter_type="Json", processes=1)
+        assert [r["statuses"] for r in results] == [[True], [False]]
+        assert all(r["error"] is None for r in results)
+        assert (tmp_path / "reports" / "a.json").is_file()
+        assert (tmp_path / "reports" / "b.json").is_file()
+
+        with open(tmp_path / "reports" / "summary.csv", newline="") as f:
+            assert list(csv.reader(f)) == [["Specification", "a.ifc", "b.ifc"], ["Name", "Pass", "Fail"]]
+        with open(tmp_path / "reports" / "timings.csv", newline="") as f:
+            assert len(list(csv.reader(f))) == 3
+
+    def test_recording_models_which_fail_to_load(self, tmp_path):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        specs.specifications.append(spec)
+
+        (tmp_path / "invalid.ifc").write_text("Not an IFC")
+        results = batch.audit(specs, [str(tmp_path / "invalid.ifc")], str(tmp_path), processes=1)
+        assert results[0]["error"]
+        assert results[0]["statuses"] == [None]
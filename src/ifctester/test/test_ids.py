@@ -17,10 +17,17 @@
 # along with IfcTester.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import json
 import pytest
 import xmlschema
 import ifcopenshell
-from ifctester import ids
+import ifcopenshell.api.classification
+import ifcopenshell.api.material
+import ifcopenshell.api.project
+import ifcopenshell.api.pset
+import ifcopenshell.api.root
+import ifcopenshell.api.type
+from ifctester import ids, reporter
 from typing import Optional
 
 
@@ -242,6 +249,36 @@ class TestIds:
         assert spec.requirements[0].failures[0]["element"] == wall
         assert spec2.requirements[0].failures[0]["element"] == wall
 
+    def test_validating_specifications_in_multiple_processes(self):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+        specs.specifications.append(spec)
+
+        spec2 = ids.Specification(name="Name")
+        spec2.applicability.append(ids.Entity(name="IFCSLAB"))
+        spec2.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+        specs.specifications.append(spec2)
+
+        model = ifcopenshell.file()
+        wall = model.createIfcWall()
+        waldo = model.createIfcWall(Name="Waldo")
+        slab = model.createIfcSlab(Name="Waldo")
+        specs.validate(model, processes=2)
+
+        assert spec.status is False
+        assert spec.applicable_entities == [wall, waldo]
+        assert spec.passed_entities == {waldo}
+        assert spec.failed_entities == {wall}
+        assert spec.requirements[0].status is False
+        assert spec.requirements[0].passed_entities == {waldo}
+        assert spec.requirements[0].failures[0]["element"] == wall
+        assert spec.requirements[0].failures[0]["reason"]
+        assert spec2.status is True
+        assert spec2.applicable_entities == [slab]
+        assert spec2.requirements[0].passed_entities == {slab}
+
     def test_parsing_entities_with_no_attributes(self):
         model = ifcopenshell.file()
         wall1 = model.createIfcWall(Name="Waldo")
@@ -265,6 +302,70 @@ class TestIds:
             [wall2],
         )
 
+    def test_streaming_results_to_a_reporter(self, tmp_path):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+        specs.specifications.append(spec)
+
+        model = ifcopenshell.file()
+        wall = model.createIfcWall()
+        model.createIfcWall(Name="Waldo")
+        model.createIfcWall(Name="Waldo")
+        filepath = str(tmp_path / "report.jsonl")
+        specs.validate(model, reporter=reporter.JsonLines(specs, filepath, passed_entity_limit=1))
+
+        assert spec.status is False
+        assert spec.applicable_entities == []
+        assert spec.total_applicable == 3
+        assert spec.total_applicable_fail == 1
+        assert spec.requirements[0].failures == []
+        assert spec.requirements[0].total_pass == 2
+        assert spec.requirements[0].total_fail == 1
+
+        with open(filepath, "r") as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["type"] for line in lines] == ["fail", "pass", "specification", "summary"]
+        assert lines[0]["id"] == wall.id()
+        assert lines[2]["total_checks_pass"] == 2
+        assert lines[3]["total_checks"] == 3
+
+    def test_applicability_filters_include_elements_inheriting_from_their_type(self):
+        model = ifcopenshell.api.project.create_file()
+        ifcopenshell.api.root.create_entity(model, ifc_class="IfcProject")
+        wall_type = ifcopenshell.api.root.create_entity(model, ifc_class="IfcWallType")
+        wall = ifcopenshell.api.root.create_entity(model, ifc_class="IfcWall")
+        ifcopenshell.api.root.create_entity(model, ifc_class="IfcWall")
+        ifcopenshell.api.type.assign_type(model, related_objects=[wall], relating_type=wall_type)
+        pset = ifcopenshell.api.pset.add_pset(model, product=wall_type, name="Foo_Bar")
+        ifcopenshell.api.pset.edit_pset(model, pset=pset, properties={"Foo": "Bar"})
+        material = ifcopenshell.api.material.add_material(model)
+        ifcopenshell.api.material.assign_material(model, products=[wall_type], material=material)
+        classification = ifcopenshell.api.classification.add_classification(model, classification="Name")
+        ifcopenshell.api.classification.add_reference(
+            model, products=[wall_type], identification="1", classification=classification
+        )
+
+        for facet in (
+            ids.Property(propertySet="Foo_Bar", baseName="Foo"),
+            ids.Material(),
+            ids.Classification(system="Name"),
+        ):
+            specs = ids.Ids(title="Title")
+            spec = ids.Specification(name="Name")
+            spec.applicability.append(facet)
+            spec.requirements.append(ids.Attribute(name="Name"))
+            specs.specifications.append(spec)
+            run(
+                "Elements inherit applicability from their type",
+                specs,
+                model,
+                False,
+                [wall_type, wall],
+                [wall_type, wall],
+            )
+
 
 class TestSpecification:
     def test_create_specification_with_minimal_information(self):